@@ -1,126 +1,104 @@
-import streamlit as st
-import os
-import pandas as pd
-import plotly.graph_objects as go
-
-st.title("AWS QC Dashboard – Temperatuur (Raw Value)")
-
-# 📁 Detecteer stations
-data_path = "data"
-stations = [d for d in os.listdir(data_path) if os.path.isdir(os.path.join(data_path, d))]
+import datetime
 
-station = st.selectbox("Kies een station", stations)
+import numpy as np
+import pandas as pd
+import streamlit as st
+import plotly.express as px
 
-# 📄 Automatisch temperatuur-bestand kiezen
-station_path = os.path.join(data_path, station)
-temp_file = "Air_Temperaturedeg_C_QC.xlsx"
-file_path = os.path.join(station_path, temp_file)
+from utils.aggregation import days_in_month, month_statistics
+from utils.bitset import network_calendar
+from utils.conclusions import day_conclusion, month_conclusion
+from utils.compact import NETWERK
+from utils.completeness import day_slots, slot_matrix, variable_completeness
+from utils.downsample import downsample
+from utils.figures import (
+    block_timeline_figure,
+    block_timeline_stack,
+    month_calendar_figure,
+    month_strip_figure,
+    network_calendar_figure,
+)
+from utils.flags import FLAG_COLORS, display_decimals
+from utils.loader import (
+    TEMPERATUUR,
+    load_station_frame,
+    month_bounds,
+    period_bounds,
+)
+from utils.manifest import load_manifest, manifest_days, stations_with
+from utils.profiling import RerunProfiel, configure_logging
+from utils.store import load_daily_qc, load_monthly_qc
+from utils.tables import render_flag_table
+from utils.temporal import temporal_flag
 
-df = pd.read_excel(file_path)
+st.title("AWS QC Dashboard – Temperatuur (Raw Value)")
 
-# Combineer Dag + Tijd
-df['Timestamp'] = pd.to_datetime(df['Dag'].astype(str) + ' ' + df['Tijd'].astype(str))
-df = df.sort_values('Timestamp')
+# ⏱️ Tijd per sectie, cachetellers en geheugen (debugpaneel in de sidebar + log)
+configure_logging()
+profiel = RerunProfiel("app")
+profiel.sectie("0. Manifest & laden")
 
-# 📅 Dagselectie
-alle_dagen = sorted(df['Timestamp'].dt.date.unique())
-gekozen_dag = st.selectbox("Kies een dag", alle_dagen)
+# 📁 Stations uit de manifest – alleen stations met temperatuurmetingen
+# Eén proces: geen process pool vanuit de Streamlit-server
+manifest = load_manifest(workers=1)
+stations = stations_with(manifest, TEMPERATUUR)
 
-df_dag = df[df['Timestamp'].dt.date == gekozen_dag]
+if not stations:
+    st.error("Geen station met temperatuurmetingen gevonden in data/.")
+    profiel.afronden(st.sidebar)
+    st.stop()
 
-st.subheader(f"QC Rapport – {gekozen_dag}")
+station = st.selectbox("Kies een station", stations)
 
-# -----------------------------
-# 1. CUSTOM BLOCKS TIMELINE
-# -----------------------------
-st.subheader("Ontbrekende metingen voor de dag!")
+# 📅 Periode: één dag, de week/maand van de gekozen dag of een eigen bereik
+alle_dagen = manifest_days(manifest, station, TEMPERATUUR)
+periode = st.radio("Periode", ["Dag", "Week", "Maand", "Eigen bereik"], horizontal=True)
 
-# Raw Value numeriek maken
-df["Raw Value"] = pd.to_numeric(df["Raw Value"], errors="coerce")
+if periode == "Eigen bereik":
+    bereik = st.date_input(
+        "Kies een periode",
+        value=(max(alle_dagen[0], alle_dagen[-1] - datetime.timedelta(days=6)), alle_dagen[-1]),
+        min_value=alle_dagen[0],
+        max_value=alle_dagen[-1]
+    )
+    # Leeg (gewist) of nog maar één datum gekozen → wachten op een volledig bereik
+    if len(bereik) < 2:
+        st.info("Kies een begin- en einddatum.")
+        profiel.afronden(st.sidebar)
+        st.stop()
+    start, eind = bereik
+    gekozen_dag = start
+else:
+    gekozen_dag = st.selectbox("Kies een dag", alle_dagen)
+    start, eind = period_bounds(periode, gekozen_dag)
 
-# Filter op gekozen dag
-df_dag = df[df['Timestamp'].dt.date == gekozen_dag].copy()
+eenheid = "dag" if start == eind else "periode"
+bereik_tekst = f"op {start}" if start == eind else f"van {start} t/m {eind}"
 
-# Verwachte timestamps
-start = pd.to_datetime(str(gekozen_dag) + " 00:00:00")
-expected_times = pd.date_range(start=start, periods=144, freq="10min")
+# 📄 Alleen de dagen van de periode, uit de compacte reeksen die het proces
+# voor alle stations vasthoudt (eerste keer geladen uit de store)
+df = NETWERK.frame(station, TEMPERATUUR, start, eind, manifest)
+profiel.frame("periode", df)
+profiel.resident("netwerk (compact)", NETWERK.rows, NETWERK.nbytes)
 
-df_expected = pd.DataFrame({"Timestamp": expected_times})
+st.subheader(f"QC Rapport – {start if start == eind else f'{start} t/m {eind}'}")
 
 # -----------------------------
-# ⭐ BELANGRIJKSTE FIX:
-# Status = True ALS er een echte Raw Value is
+# 1. CUSTOM BLOCKS TIMELINE
 # -----------------------------
-df_expected = df_expected.merge(
-    df_dag[["Timestamp", "Raw Value"]],
-    on="Timestamp",
-    how="left"
-)
-
-df_expected["Status"] = df_expected["Raw Value"].notna()
+profiel.sectie("1. CUSTOM BLOCKS TIMELINE")
+st.subheader(f"Ontbrekende metingen {bereik_tekst}!")
 
-# Uur + blok berekenen
-df_expected["Hour"] = df_expected["Timestamp"].dt.hour
-df_expected["Block"] = df_expected["Timestamp"].dt.minute // 10
+# Verwachte timestamps (144 per dag) voor elke kalenderdag van de periode
+kalenderdagen = list(pd.date_range(start, eind).date)
+matrix = slot_matrix(df, kalenderdagen)
 
-# Raster parameters
-cell_size = 30
-gap = 5
-rows = 6
-cols = 24
-
-fig = go.Figure()
-
-# Blokjes tekenen
-for _, row in df_expected.iterrows():
-    hour = row["Hour"]
-    block = row["Block"]
-    status = row["Status"]
-
-    color = "green" if status else "red"
-
-    x = hour * (cell_size + gap)
-    y = (5 - block) * (cell_size + gap)
-
-    fig.add_shape(
-        type="rect",
-        x0=x, x1=x + cell_size,
-        y0=y, y1=y + cell_size,
-        line=dict(width=0),
-        fillcolor=color
-    )
-
-# As-instellingen
-fig.update_xaxes(
-    title_text="<b>Uur van de dag</b>",
-    title_font=dict(size=16),
-    tickfont=dict(size=14, color="black"),
-    range=[0, cols * (cell_size + gap)],
-    tickmode="array",
-    tickvals=[h * (cell_size + gap) + cell_size/2 for h in range(cols)],
-    ticktext=[f"<b>{h:02d}:00</b>" for h in range(cols)],
-    showgrid=False,
-    zeroline=False
-)
-
-fig.update_yaxes(
-    title_text="<b>10-minuten blok</b>",
-    title_font=dict(size=16),
-    tickfont=dict(size=14, color="black"),
-    range=[0, rows * (cell_size + gap)],
-    tickmode="array",
-    tickvals=[i * (cell_size + gap) + cell_size/2 for i in range(rows)],
-    ticktext=[f"<b>{t}</b>" for t in ["00", "10", "20", "30", "40", "50"]],
-    showgrid=False,
-    zeroline=False
-)
-
-fig.update_layout(
-    width=cols * (cell_size + gap) + 200,
-    height=rows * (cell_size + gap) + 200,
-    margin=dict(l=80, r=40, t=60, b=80),
-    plot_bgcolor="white"
-)
+if start == eind:
+    # Raster als één heatmap-trace (uur × 10-minuten blok)
+    fig = block_timeline_figure(day_slots(df, start))
+else:
+    # Alle dagen onder elkaar (dagen × 144 slots) in één heatmap
+    fig = block_timeline_stack(matrix, kalenderdagen)
 
 st.plotly_chart(fig, use_container_width=True)
 
@@ -132,15 +110,16 @@ st.markdown("**Legenda:** 🟩 Ontvangen meting   |   🟥 Ontbrekende meting")
 # -----------------------------
 # 2. QC SAMENVATTING
 # -----------------------------
+profiel.sectie("2. QC SAMENVATTING")
 st.subheader("QC")
 
-totaal_blokken = 144
-aanwezig = df_expected["Status"].sum()
+totaal_blokken = matrix.size
+aanwezig = int((~np.isnan(matrix)).sum())
 ontbrekend = totaal_blokken - aanwezig
 percentage = round((aanwezig / totaal_blokken) * 100, 1)
 
 kwaliteit = (
-    "Voldoende — dag voldoet aan de minimale eis."
+    f"Voldoende — {eenheid} voldoet aan de minimale eis."
     if percentage >= 75
     else "Onvoldoende — minder dan 75% datacompleetheid."
 )
@@ -155,7 +134,7 @@ qc_html = f"""
 ">
 <p>De temperatuur wordt elke 10 minuten gemeten en geregistreerd.</p>
 <p>In totaal moeten er <b>144 metingen</b> zijn per dag.</p>
-<p><b>Ontbrekende metingen:</b> {ontbrekend} van de 144.</p>
+<p><b>Ontbrekende metingen:</b> {ontbrekend} van de {totaal_blokken}.</p>
 <p><b>Datacompleetheid:</b> {percentage}%.</p>
 <p><b>Kwaliteit:</b> {kwaliteit}</p>
 <p>Minimaal <b>75%</b> van de datametingen moet aanwezig zijn om te voldoen aan de kwaliteitsnorm.</p>
@@ -167,85 +146,28 @@ st.markdown(qc_html, unsafe_allow_html=True)
 # ---------------------------------------------------------
 # 3. MAANDOVERZICHT QC – TEMPERATUUR
 # ---------------------------------------------------------
+profiel.sectie("3. MAANDOVERZICHT QC – TEMPERATUUR")
 
 st.subheader("Maandelijkse QC – Temperatuur")
 
-# Alle unieke dagen in de dataset
-alle_dagen = sorted(df['Timestamp'].dt.date.unique())
-
-qc_resultaten = []
-
-for dag in alle_dagen:
-    df_dag = df[df['Timestamp'].dt.date == dag].copy()
-
-    # Raw Value numeriek maken
-    df_dag["Raw Value"] = pd.to_numeric(df_dag["Raw Value"], errors="coerce")
-
-    # ⭐ Alleen echte metingen tellen
-    aanwezig = df_dag["Raw Value"].notna().sum()
+# Dagelijkse completeness uit de store (alleen dagen met nieuwe rijen worden herberekend)
+qc_df = load_daily_qc(station, TEMPERATUUR)
 
-    # Verwachte 144 metingen
-    totaal = 144
-    percentage = round((aanwezig / totaal) * 100, 1)
-
-    status = "goed" if percentage >= 75 else "slecht"
-
-    qc_resultaten.append({
-        "Dag": dag,
-        "Aanwezig": aanwezig,
-        "Percentage": percentage,
-        "Status": status
-    })
-
-qc_df = pd.DataFrame(qc_resultaten)
+# Strook en samenvatting gaan over de maand van de gekozen dag
+maand_start, maand_eind = month_bounds(gekozen_dag)
+maand_qc_df = qc_df[(qc_df["Dag"] >= maand_start) & (qc_df["Dag"] <= maand_eind)]
 
 # -----------------------------
 # GRAFIEK MAANDOVERZICHT
 # -----------------------------
 
-fig2 = go.Figure()
-
-cell_size = 40
-gap = 10
-
-for i, row in qc_df.iterrows():
-    kleur = "green" if row["Status"] == "goed" else "red"
+# Strook (één cel per dag van de maand) of kalender (weekdagen × weken, alle maanden)
+weergave = st.radio("Weergave", ["Strook", "Kalender"], horizontal=True)
 
-    x0 = i * (cell_size + gap)
-    x1 = x0 + cell_size
-
-    fig2.add_shape(
-        type="rect",
-        x0=x0, x1=x1,
-        y0=0, y1=cell_size,
-        line=dict(width=0),
-        fillcolor=kleur
-    )
-
-    # Dagnummer tonen
-    fig2.add_annotation(
-        x=x0 + cell_size/2,
-        y=cell_size/2,
-        text=str(row["Dag"].day),
-        showarrow=False,
-        font=dict(color="white", size=14)
-    )
-
-fig2.update_xaxes(
-    visible=False,
-    range=[0, len(qc_df) * (cell_size + gap)]
-)
-
-fig2.update_yaxes(
-    visible=False,
-    range=[0, cell_size]
-)
-
-fig2.update_layout(
-    height=150,
-    margin=dict(l=20, r=20, t=20, b=20),
-    plot_bgcolor="white"
-)
+if weergave == "Kalender":
+    fig2 = month_calendar_figure(qc_df)
+else:
+    fig2 = month_strip_figure(maand_qc_df)
 
 st.plotly_chart(fig2, use_container_width=True)
 
@@ -258,38 +180,19 @@ st.markdown("**Legenda:** 🟩 Geschikte dag (≥75% compleet)   |   🟥 Ongesc
 # BEREKENING VAN DAGEN IN MAAND
 # -----------------------------
 
-eerste_dag = alle_dagen[0]
-maand = eerste_dag.month
-jaar = eerste_dag.year
-
-dagen_per_maand = {
-    1: 31,
-    2: 29 if (jaar % 4 == 0 and (jaar % 100 != 0 or jaar % 400 == 0)) else 28,
-    3: 31,
-    4: 30,
-    5: 31,
-    6: 30,
-    7: 31,
-    8: 31,
-    9: 30,
-    10: 31,
-    11: 30,
-    12: 31
-}
-
-totaal_dagen_in_maand = dagen_per_maand[maand]
-dagen_met_data = len(alle_dagen)
+totaal_dagen_in_maand = days_in_month(gekozen_dag.year, gekozen_dag.month)
+dagen_met_data = sum(maand_start <= dag <= maand_eind for dag in alle_dagen)
 ontbrekende_dagen = totaal_dagen_in_maand - dagen_met_data
 
 # -----------------------------
 # SAMENVATTING
 # -----------------------------
 
-goede_dagen = (qc_df["Status"] == "goed").sum()
-slechte_dagen = (qc_df["Status"] == "slecht").sum()
+goede_dagen = (maand_qc_df["Status"] == "goed").sum()
+slechte_dagen = (maand_qc_df["Status"] == "slecht").sum()
 
 st.markdown(f"""
-### Samenvatting maand
+### Samenvatting maand ({gekozen_dag.strftime('%B %Y')})
 - **Geschikte dagen (≥75% compleet):** {goede_dagen}  
 - **Ongeschikte dagen (<75% compleet):** {slechte_dagen}  
 - **Aantal dagen met data:** {dagen_met_data} van de {totaal_dagen_in_maand}  
@@ -299,81 +202,47 @@ st.markdown(f"""
 # ---------------------------------------------------------
 # 4. GEREGISTREERDE TEMPERATUURMETINGEN & DATAKWALITEIT
 # ---------------------------------------------------------
+profiel.sectie("4. GEREGISTREERDE TEMPERATUURMETINGEN & DATAKWALITEIT")
 
 st.subheader("Geregistreerde Temperatuurmetingen & Datakwaliteit")
 st.caption("We kijken naar de werkelijke gemeten data én de kwaliteit ervan.")
 
-# 1. Timestamp bouwen
-df["Tijd"] = df["Tijd"].astype(str).str.strip()
-df["Timestamp"] = pd.to_datetime(
-    df["Dag"].astype(str) + " " + df["Tijd"].astype(str),
-    errors="coerce"
-)
-
-# 2. Raw Value numeriek maken
-df["Raw Value"] = pd.to_numeric(df["Raw Value"], errors="coerce")
-
-# 3. Gebruik de dag die bovenaan al gekozen is
-df_dag = df[df["Timestamp"].dt.date == gekozen_dag].copy()
+# 1. Gebruik de periode die bovenaan al gekozen is (df bevat alleen die dagen)
+# 2. VERWIJDER ALLE rijen zonder Raw Value
+df_dag = df[df["Raw Value"].notna()].copy()
 
-# 4. VERWIJDER ALLE rijen zonder Raw Value
-df_dag = df_dag[df_dag["Raw Value"].notna()]
-
-# 5. ALS ER GEEN ENKELE METING IS → MELDING TONEN
+# 3. ALS ER GEEN ENKELE METING IS → MELDING TONEN
 if df_dag.empty:
-    st.warning(f"Er zijn geen temperatuurmetingen beschikbaar voor {gekozen_dag}.")
+    st.warning(f"Er zijn geen temperatuurmetingen beschikbaar {bereik_tekst}.")
+    profiel.afronden(st.sidebar)
     st.stop()
 
-# 6. Sorteren
-df_dag = df_dag.sort_values("Timestamp")
-
-# 6b. Raw Value afronden voor weergave
-df_dag["Raw Value"] = df_dag["Raw Value"].round(1)
+# 4. Raw Value afronden voor weergave
+decimalen = display_decimals(TEMPERATUUR)
+df_dag["Raw Value"] = df_dag["Raw Value"].round(decimalen)
 
 # ---------------------------------------------------------
 # ⭐ 7. QC INTERVALLEN – SURINAME SPECIFIEK
 # ---------------------------------------------------------
+profiel.sectie("7. QC INTERVALLEN – SURINAME SPECIFIEK")
 
-df_dag["QC_Flag"] = "OK"
-
-# Onmogelijke waarden (<0°C)
-df_dag.loc[df_dag["Raw Value"] < 0, "QC_Flag"] = "LOW_IMPOSSIBLE"
+# QC_Flag (regeltabel in utils.flags) komt al mee uit de compacte reeks
 
-# Onrealistisch laag (0–5°C)
-df_dag.loc[(df_dag["Raw Value"] >= 0) & (df_dag["Raw Value"] < 5), "QC_Flag"] = "LOW_SUSPICIOUS"
-
-# Verdacht laag (5–20°C)
-df_dag.loc[(df_dag["Raw Value"] >= 5) & (df_dag["Raw Value"] < 20), "QC_Flag"] = "LOW_RANGE"
-
-# Normaal (20–37°C) → OK
-
-# Extreem hoog (37–40°C)
-df_dag.loc[(df_dag["Raw Value"] >= 37) & (df_dag["Raw Value"] <= 40), "QC_Flag"] = "HIGH"
-
-# Zeer extreem hoog (>40°C)
-df_dag.loc[df_dag["Raw Value"] > 40, "QC_Flag"] = "VERY_HIGH"
+# Temporele controles (sprong, piek, vlakke lijn) over de hele periode; gaten breken de vergelijking
+df_dag["Tijd_Flag"] = temporal_flag(TEMPERATUUR, df_dag)
 
 # ---------------------------------------------------------
 # 8. Tabel tonen – MET HIGHLIGHTING
 # ---------------------------------------------------------
-
-def highlight_qc(val):
-    colors = {
-        "OK": "background-color: #b6f2b6",
-        "LOW_RANGE": "background-color: #ffd27f",
-        "LOW_SUSPICIOUS": "background-color: #fff59d",
-        "LOW_IMPOSSIBLE": "background-color: #90caf9",
-        "HIGH": "background-color: #ff8a80",
-        "VERY_HIGH": "background-color: #d32f2f; color: white"
-    }
-    return colors.get(val, "")
-
-st.write(f"Temperatuurmetingen op {gekozen_dag}:")
-st.dataframe(
-    df_dag[["Timestamp", "Raw Value", "QC_Flag"]]
-    .style
-    .applymap(highlight_qc, subset=["QC_Flag"])
-    .format({"Raw Value": "{:.1f}"})
+profiel.sectie("8. Tabel tonen – MET HIGHLIGHTING")
+
+st.write(f"Temperatuurmetingen {bereik_tekst}:")
+# Gefilterd en gepagineerd; kleuren via één map over de flagkolom i.p.v. een callback per cel
+render_flag_table(
+    st,
+    df_dag[["Timestamp", "Raw Value", "QC_Flag", "Tijd_Flag"]],
+    {"Raw Value": f"{{:.{decimalen}f}}"},
+    key="temperatuur"
 )
 
 # ---------------------------------------------------------
@@ -388,29 +257,33 @@ st.markdown("""
 - 🟦 **LOW_IMPOSSIBLE** — Onmogelijk (<0°C)  
 - 🟥 **HIGH** — Extreem hoog (37–40°C)  
 - 🟥 **VERY_HIGH** — Zeer extreem hoog (>40°C)  
+
+Temporele controles (kolom *Tijd_Flag*):
+- 🟪 **STEP** — Sprong van meer dan 3°C t.o.v. de vorige meting  
+- 🩷 **SPIKE** — Meer dan 2,5°C afwijking van beide buren (piek of dal)  
+- ⬜ **FLATLINE** — Langer dan 3 uur exact dezelfde waarde  
 """)
 
 # ---------------------------------------------------------
 # 9. Grafiek tonen – MET QC-KLEUREN
 # ---------------------------------------------------------
+profiel.sectie("9. Grafiek tonen – MET QC-KLEUREN")
 
-import plotly.express as px
+# Eén dag = alle 144 punten; langer = min/max per tijdsinterval + alle niet-OK metingen
+if start == eind:
+    df_grafiek = df_dag
+else:
+    afwijkend = (df_dag["QC_Flag"] != "OK") | (df_dag["Tijd_Flag"] != "OK")
+    df_grafiek = downsample(df_dag, behouden=afwijkend)
 
 fig = px.line(
-    df_dag,
+    df_grafiek,
     x="Timestamp",
     y="Raw Value",
-    title=f"Temperatuurverloop op {gekozen_dag}",
+    title=f"Temperatuurverloop {bereik_tekst}",
     markers=True,
     color="QC_Flag",
-    color_discrete_map={
-        "OK": "green",
-        "LOW_RANGE": "orange",
-        "LOW_SUSPICIOUS": "yellow",
-        "LOW_IMPOSSIBLE": "blue",
-        "HIGH": "red",
-        "VERY_HIGH": "darkred"
-    }
+    color_discrete_map=FLAG_COLORS
 )
 
 fig.update_yaxes(title_text="Temperatuur (°C)")
@@ -421,6 +294,7 @@ st.plotly_chart(fig, use_container_width=True)
 # ---------------------------------------------------------
 # ⭐ 10. QC SAMENVATTING – ONDER DE GRAFIEK
 # ---------------------------------------------------------
+profiel.sectie("10. QC SAMENVATTING – ONDER DE GRAFIEK")
 
 laagste = df_dag["Raw Value"].min()
 hoogste = df_dag["Raw Value"].max()
@@ -437,45 +311,30 @@ st.markdown(f"""
 """)
 
 # ⭐ Dagconclusie
-if hoogste > 40:
-    conclusie = "❌ De dag bevat zeer extreme hoge waarden (boven 40°C). Controle aanbevolen."
-elif hoogste > 37:
-    conclusie = "⚠️ De dag bevat extreme hoge waarden (boven 37°C)."
-elif laagste < 20:
-    conclusie = "ℹ️ De dag bevat lage waarden die niet typisch zijn voor Suriname."
-else:
-    conclusie = "✔️ De gemeten waarden vallen binnen het normale bereik."
+conclusie = day_conclusion(TEMPERATUUR, laagste, hoogste, qc_counts, eenheid)
 
 st.markdown(f"### Dagconclusie\n{conclusie}")
 
 # ---------------------------------------------------------
 # ⭐ 11. MAANDSTATISTIEKEN – AUTOMATISCH OP BASIS VAN GEKOZEN DAG
 # ---------------------------------------------------------
+profiel.sectie("11. MAANDSTATISTIEKEN – AUTOMATISCH OP BASIS VAN GEKOZEN DAG")
 
-maand = gekozen_dag.month
-jaar = gekozen_dag.year
-
-df_maand = df[
-    (df["Timestamp"].dt.month == maand) &
-    (df["Timestamp"].dt.year == jaar)
-].copy()
-
-df_maand = df_maand[df_maand["Raw Value"].notna()]
+# Uit de maandrollup van de store – geen scan over de ruwe metingen
+maand_qc = load_monthly_qc(station, TEMPERATUUR)
+maand_stats = month_statistics(maand_qc, gekozen_dag.year, gekozen_dag.month)
 
-if not df_maand.empty:
+if maand_stats is not None:
 
-    totaal_waarden = len(df_maand)
-    negatieve_count = (df_maand["Raw Value"] < 0).sum()
-    negatieve_percentage = (negatieve_count / totaal_waarden) * 100
+    negatieve_count = maand_stats["ongeldig"]
+    negatieve_percentage = maand_stats["ongeldig_percentage"]
 
-    df_maand_pos = df_maand[df_maand["Raw Value"] >= 0]
-
-    if not df_maand_pos.empty:
-        laagste_maand = round(df_maand_pos["Raw Value"].min(), 1)
+    if maand_stats["laagste_geldig"] is not None:
+        laagste_maand = round(maand_stats["laagste_geldig"], decimalen)
     else:
         laagste_maand = None
 
-    hoogste_maand = round(df_maand["Raw Value"].max(), 1)
+    hoogste_maand = round(maand_stats["hoogste"], decimalen)
 
     st.markdown(f"""
     ### Maandstatistieken ({gekozen_dag.strftime('%B %Y')})
@@ -488,64 +347,48 @@ if not df_maand.empty:
     # ---------------------------------------------------------
     # ⭐ 12. MAAND-CONCLUSIE – GESCHIKTHEID VAN HET STATION
     # ---------------------------------------------------------
+    maand_conclusie = month_conclusion(TEMPERATUUR, maand_stats)
 
-    problemen = []
+    st.markdown(f"### Maandconclusie\n{maand_conclusie}")
 
-    # A. Meer dan 50% negatieve waarden → data onbruikbaar
-    if negatieve_percentage >= 50:
-        maand_conclusie = (
-            "❌ Meer dan 50% van de maandwaarden is negatief. "
-            "De data is NIET geschikt voor analyse."
-        )
+# ---------------------------------------------------------
+# ⭐ 13. NETWERKKALENDER – COMPLETENESS PER STATION EN DAG
+# ---------------------------------------------------------
+profiel.sectie("13. NETWERKKALENDER – COMPLETENESS PER STATION EN DAG")
 
-    else:
-        # Minder dan 50% negatief → filteren en verder gebruiken
-        if negatieve_count > 0:
-            problemen.append(
-                f"Er zijn {negatieve_count} negatieve waarden gevonden. "
-                "Filter deze uit voordat je de data verder gebruikt."
-            )
-
-        if laagste_maand is not None and laagste_maand > 30:
-            problemen.append(
-                "De laagste geldige waarde ligt boven 30°C, wat onrealistisch is voor Suriname."
-            )
-
-        if laagste_maand is not None and laagste_maand < 5:
-            problemen.append(
-                "De laagste geldige waarde ligt onder 5°C, wat fysiek onmogelijk is."
-            )
-        elif laagste_maand is not None and laagste_maand < 10:
-            problemen.append(
-                "De laagste geldige waarde ligt onder 10°C, wat zeer onrealistisch is."
-            )
-        elif laagste_maand is not None and laagste_maand < 20:
-            problemen.append(
-                "De laagste geldige waarde ligt onder 20°C, wat niet typisch is voor Suriname."
-            )
-
-        if hoogste_maand > 45:
-            problemen.append(
-                "De maand bevat waarden boven 45°C, wat fysiek onmogelijk is."
-            )
-        elif hoogste_maand > 40:
-            problemen.append(
-                "De maand bevat extreem hoge waarden (>40°C)."
-            )
-        elif hoogste_maand > 37:
-            problemen.append(
-                "De maand bevat zeer hoge waarden (>37°C)."
-            )
-
-        if problemen:
-            maand_conclusie = (
-                "⚠️ De data bevat aandachtspunten. Gebruik de data alleen na filtering en controle.\n\n"
-                + "\n".join(f"- {p}" for p in problemen)
-            )
-        else:
-            maand_conclusie = (
-                "✔ Het station toont realistische waarden voor deze maand. "
-                "Het station is geschikt voor verdere analyse."
-            )
+st.subheader("Netwerkkalender – completeness per station en dag")
 
-    st.markdown(f"### Maandconclusie\n{maand_conclusie}")
+# Jaren met metingen bij minstens één station
+jaren = sorted({
+    dag.year for s in stations for dag in manifest_days(manifest, s, TEMPERATUUR)
+})
+kalender_jaar = st.selectbox("Jaar", jaren[::-1] + ["Alle jaren"])
+
+if kalender_jaar == "Alle jaren":
+    kalender_start, kalender_eind = datetime.date(jaren[0], 1, 1), datetime.date(jaren[-1], 12, 31)
+else:
+    kalender_start, kalender_eind = datetime.date(kalender_jaar, 1, 1), datetime.date(kalender_jaar, 12, 31)
+
+# Per station-dag een bitset van de 144 slots → completeness is een popcount,
+# het netwerk (≥1 / alle stations) een OR / AND over de stations
+kalender = network_calendar(NETWERK, stations, TEMPERATUUR, kalender_start, kalender_eind, manifest)
+st.plotly_chart(network_calendar_figure(kalender), use_container_width=True)
+st.caption("Groen: ≥75% compleet · oranje/rood: minder. "
+           "De onderste rijen tellen slots met een meting bij minstens één / alle stations.")
+profiel.resident("netwerk (compact)", NETWERK.rows, NETWERK.nbytes)
+
+# ---------------------------------------------------------
+# ⭐ 14. STATION – ALLE VARIABELEN IN DE PERIODE
+# ---------------------------------------------------------
+profiel.sectie("14. STATION – ALLE VARIABELEN IN DE PERIODE")
+
+st.subheader(f"{station} – alle variabelen {bereik_tekst}")
+
+# Alle werkmappen van het station parallel geladen en uitgelijnd op één 10-minuten raster
+variabelen = sorted(v for v, entry in manifest[station].items() if entry.get("metingen", 0) > 0)
+station_frame = load_station_frame(station, variabelen, start, eind)
+profiel.frame("station (alle variabelen)", station_frame)
+
+st.dataframe(variable_completeness(station_frame, start, eind), use_container_width=True)
+
+profiel.afronden(st.sidebar)
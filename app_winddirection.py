@@ -1,117 +1,104 @@
-import streamlit as st
-import os
-import pandas as pd
-import plotly.graph_objects as go
+import datetime
+
 import numpy as np
-import plotly.express as px
+import pandas as pd
+import streamlit as st
+
+from utils.aggregation import days_in_month, month_statistics
+from utils.bitset import network_calendar
+from utils.conclusions import day_conclusion, month_conclusion
+from utils.compact import NETWERK
+from utils.completeness import day_slots, slot_matrix, variable_completeness
+from utils.flags import display_decimals
+from utils.figures import (
+    block_timeline_figure,
+    block_timeline_stack,
+    month_calendar_figure,
+    month_strip_figure,
+    network_calendar_figure,
+    windrose_figure,
+)
+from utils.loader import (
+    WINDRICHTING,
+    load_station_frame,
+    month_bounds,
+    period_bounds,
+)
+from utils.manifest import load_manifest, manifest_days, stations_with
+from utils.profiling import RerunProfiel, configure_logging
+from utils.store import load_daily_qc, load_monthly_qc, load_sector_histograms
+from utils.tables import render_flag_table
+from utils.temporal import temporal_flag
+from utils.windrose import rose_counts
 
 st.title("AWS QC Dashboard – Windrichting (Raw Value)")
 
-# 📁 Detecteer stations
-data_path = "data"
-stations = [d for d in os.listdir(data_path) if os.path.isdir(os.path.join(data_path, d))]
+# ⏱️ Tijd per sectie, cachetellers en geheugen (debugpaneel in de sidebar + log)
+configure_logging()
+profiel = RerunProfiel("app_winddirection")
+profiel.sectie("0. Manifest & laden")
 
-station = st.selectbox("Kies een station", stations)
+# 📁 Stations uit de manifest – alleen stations met windrichtingmetingen
+# Eén proces: geen process pool vanuit de Streamlit-server
+manifest = load_manifest(workers=1)
+stations = stations_with(manifest, WINDRICHTING)
 
-# 📄 Automatisch windrichting-bestand kiezen
-station_path = os.path.join(data_path, station)
-wind_file = "Wind_Dir_Averagedeg_QC.xlsx"
-file_path = os.path.join(station_path, wind_file)
+if not stations:
+    st.error("Geen station met windrichtingmetingen gevonden in data/.")
+    profiel.afronden(st.sidebar)
+    st.stop()
 
-df = pd.read_excel(file_path)
+station = st.selectbox("Kies een station", stations)
 
-# Combineer Dag + Tijd
-df["Timestamp"] = pd.to_datetime(df["Dag"].astype(str) + " " + df["Tijd"].astype(str))
-df = df.sort_values("Timestamp")
+# 📅 Periode: één dag, de week/maand van de gekozen dag of een eigen bereik
+alle_dagen = manifest_days(manifest, station, WINDRICHTING)
+periode = st.radio("Periode", ["Dag", "Week", "Maand", "Eigen bereik"], horizontal=True)
 
-# 📅 Dagselectie
-alle_dagen = sorted(df["Timestamp"].dt.date.unique())
-gekozen_dag = st.selectbox("Kies een dag", alle_dagen)
+if periode == "Eigen bereik":
+    bereik = st.date_input(
+        "Kies een periode",
+        value=(max(alle_dagen[0], alle_dagen[-1] - datetime.timedelta(days=6)), alle_dagen[-1]),
+        min_value=alle_dagen[0],
+        max_value=alle_dagen[-1]
+    )
+    # Leeg (gewist) of nog maar één datum gekozen → wachten op een volledig bereik
+    if len(bereik) < 2:
+        st.info("Kies een begin- en einddatum.")
+        profiel.afronden(st.sidebar)
+        st.stop()
+    start, eind = bereik
+    gekozen_dag = start
+else:
+    gekozen_dag = st.selectbox("Kies een dag", alle_dagen)
+    start, eind = period_bounds(periode, gekozen_dag)
 
-df_dag = df[df["Timestamp"].dt.date == gekozen_dag]
+eenheid = "dag" if start == eind else "periode"
+bereik_tekst = f"op {start}" if start == eind else f"van {start} t/m {eind}"
 
-st.subheader(f"QC Rapport – {gekozen_dag}")
+# 📄 Alleen de dagen van de periode, uit de compacte reeksen die het proces
+# voor alle stations vasthoudt (eerste keer geladen uit de store)
+df = NETWERK.frame(station, WINDRICHTING, start, eind, manifest)
+profiel.frame("periode", df)
+profiel.resident("netwerk (compact)", NETWERK.rows, NETWERK.nbytes)
+
+st.subheader(f"QC Rapport – {start if start == eind else f'{start} t/m {eind}'}")
 
 # ---------------------------------------------------------
 # 1. CUSTOM BLOCKS TIMELINE – MISSING DETECTIE
 # ---------------------------------------------------------
-st.subheader("Ontbrekende metingen voor de dag!")
-
-df["Raw Value"] = pd.to_numeric(df["Raw Value"], errors="coerce")
+profiel.sectie("1. CUSTOM BLOCKS TIMELINE – MISSING DETECTIE")
+st.subheader(f"Ontbrekende metingen {bereik_tekst}!")
 
-df_dag = df[df["Timestamp"].dt.date == gekozen_dag].copy()
-
-start = pd.to_datetime(str(gekozen_dag) + " 00:00:00")
-expected_times = pd.date_range(start=start, periods=144, freq="10min")
-
-df_expected = pd.DataFrame({"Timestamp": expected_times})
-
-df_expected = df_expected.merge(
-    df_dag[["Timestamp", "Raw Value"]],
-    on="Timestamp",
-    how="left"
-)
+# Verwachte timestamps (144 per dag) voor elke kalenderdag van de periode
+kalenderdagen = list(pd.date_range(start, eind).date)
+matrix = slot_matrix(df, kalenderdagen)
 
-df_expected["Status"] = df_expected["Raw Value"].notna()
-
-df_expected["Hour"] = df_expected["Timestamp"].dt.hour
-df_expected["Block"] = df_expected["Timestamp"].dt.minute // 10
-
-cell_size = 30
-gap = 5
-rows = 6
-cols = 24
-
-fig = go.Figure()
-
-for _, row in df_expected.iterrows():
-    hour = row["Hour"]
-    block = row["Block"]
-    status = row["Status"]
-
-    color = "green" if status else "red"
-
-    x = hour * (cell_size + gap)
-    y = (5 - block) * (cell_size + gap)
-
-    fig.add_shape(
-        type="rect",
-        x0=x, x1=x + cell_size,
-        y0=y, y1=y + cell_size,
-        line=dict(width=0),
-        fillcolor=color
-    )
-
-fig.update_xaxes(
-    title_text="<b>Uur van de dag</b>",
-    title_font=dict(size=16),
-    tickfont=dict(size=14, color="black"),
-    range=[0, cols * (cell_size + gap)],
-    tickmode="array",
-    tickvals=[h * (cell_size + gap) + cell_size/2 for h in range(cols)],
-    ticktext=[f"<b>{h:02d}:00</b>" for h in range(cols)],
-    showgrid=False,
-    zeroline=False
-)
-
-fig.update_yaxes(
-    title_text="<b>10-minuten blok</b>",
-    title_font=dict(size=16),
-    tickfont=dict(size=14, color="black"),
-    range=[0, rows * (cell_size + gap)],
-    tickmode="array",
-    tickvals=[i * (cell_size + gap) + cell_size/2 for i in range(rows)],
-    ticktext=[f"<b>{t}</b>" for t in ["00", "10", "20", "30", "40", "50"]],
-    showgrid=False,
-    zeroline=False
-)
-
-fig.update_layout(
-    width=cols * (cell_size + gap) + 200,
-    height=rows * (cell_size + gap) + 200,
-    margin=dict(l=80, r=40, t=60, b=80),
-    plot_bgcolor="white"
-)
+if start == eind:
+    # Raster als één heatmap-trace (uur × 10-minuten blok)
+    fig = block_timeline_figure(day_slots(df, start))
+else:
+    # Alle dagen onder elkaar (dagen × 144 slots) in één heatmap
+    fig = block_timeline_stack(matrix, kalenderdagen)
 
 st.plotly_chart(fig, use_container_width=True)
 
@@ -120,15 +107,16 @@ st.markdown("**Legenda:** 🟩 Ontvangen meting   |   🟥 Ontbrekende meting**"
 # ---------------------------------------------------------
 # 2. QC SAMENVATTING – DAG
 # ---------------------------------------------------------
+profiel.sectie("2. QC SAMENVATTING – DAG")
 st.subheader("QC")
 
-totaal_blokken = 144
-aanwezig = df_expected["Status"].sum()
+totaal_blokken = matrix.size
+aanwezig = int((~np.isnan(matrix)).sum())
 ontbrekend = totaal_blokken - aanwezig
 percentage = round((aanwezig / totaal_blokken) * 100, 1)
 
 kwaliteit = (
-    "Voldoende — dag voldoet aan de minimale eis."
+    f"Voldoende — {eenheid} voldoet aan de minimale eis."
     if percentage >= 75
     else "Onvoldoende — minder dan 75% datacompleetheid."
 )
@@ -143,7 +131,7 @@ qc_html = f"""
 ">
 <p>Windrichting wordt elke 10 minuten gemeten en geregistreerd.</p>
 <p>In totaal moeten er <b>144 metingen</b> zijn per dag.</p>
-<p><b>Ontbrekende metingen:</b> {ontbrekend} van de 144.</p>
+<p><b>Ontbrekende metingen:</b> {ontbrekend} van de {totaal_blokken}.</p>
 <p><b>Datacompleetheid:</b> {percentage}%.</p>
 <p><b>Kwaliteit:</b> {kwaliteit}</p>
 <p>Minimaal <b>75%</b> van de datametingen moet aanwezig zijn om te voldoen aan de kwaliteitsnorm.</p>
@@ -155,60 +143,27 @@ st.markdown(qc_html, unsafe_allow_html=True)
 # ---------------------------------------------------------
 # 3. MAANDOVERZICHT QC
 # ---------------------------------------------------------
+profiel.sectie("3. MAANDOVERZICHT QC")
 st.subheader("Maandelijkse QC – Windrichting")
 
-qc_resultaten = []
-
-for dag in alle_dagen:
-    df_dag = df[df["Timestamp"].dt.date == dag].copy()
-    df_dag["Raw Value"] = pd.to_numeric(df_dag["Raw Value"], errors="coerce")
-    aanwezig = df_dag["Raw Value"].notna().sum()
-    totaal = 144
-    percentage = round((aanwezig / totaal) * 100, 1)
-    status = "goed" if percentage >= 75 else "slecht"
+# Dagelijkse completeness uit de store (alleen dagen met nieuwe rijen worden herberekend)
+qc_df = load_daily_qc(station, WINDRICHTING)
 
-    qc_resultaten.append({
-        "Dag": dag,
-        "Aanwezig": aanwezig,
-        "Percentage": percentage,
-        "Status": status
-    })
-
-qc_df = pd.DataFrame(qc_resultaten)
+# Strook en samenvatting gaan over de maand van de gekozen dag
+maand_start, maand_eind = month_bounds(gekozen_dag)
+maand_qc_df = qc_df[(qc_df["Dag"] >= maand_start) & (qc_df["Dag"] <= maand_eind)]
 
 # ---------------------------------------------------------
 # 4. GRAFIEK MAANDOVERZICHT
 # ---------------------------------------------------------
-fig2 = go.Figure()
-
-cell_size = 40
-gap = 10
+profiel.sectie("4. GRAFIEK MAANDOVERZICHT")
+# Strook (één cel per dag van de maand) of kalender (weekdagen × weken, alle maanden)
+weergave = st.radio("Weergave", ["Strook", "Kalender"], horizontal=True)
 
-for i, row in qc_df.iterrows():
-    kleur = "green" if row["Status"] == "goed" else "red"
-
-    x0 = i * (cell_size + gap)
-    x1 = x0 + cell_size
-
-    fig2.add_shape(
-        type="rect",
-        x0=x0, x1=x1,
-        y0=0, y1=cell_size,
-        line=dict(width=0),
-        fillcolor=kleur
-    )
-
-    fig2.add_annotation(
-        x=x0 + cell_size/2,
-        y=cell_size/2,
-        text=str(row["Dag"].day),
-        showarrow=False,
-        font=dict(color="white", size=14)
-    )
-
-fig2.update_xaxes(visible=False, range=[0, len(qc_df) * (cell_size + gap)])
-fig2.update_yaxes(visible=False, range=[0, cell_size])
-fig2.update_layout(height=150, margin=dict(l=20, r=20, t=20, b=20), plot_bgcolor="white")
+if weergave == "Kalender":
+    fig2 = month_calendar_figure(qc_df)
+else:
+    fig2 = month_strip_figure(maand_qc_df)
 
 st.plotly_chart(fig2, use_container_width=True)
 
@@ -217,111 +172,67 @@ st.markdown("**Legenda:** 🟩 Geschikte dag (≥75% compleet)   |   🟥 Ongesc
 # ---------------------------------------------------------
 # 5. GEREGISTREERDE METINGEN & QC
 # ---------------------------------------------------------
+profiel.sectie("5. GEREGISTREERDE METINGEN & QC")
 st.subheader("Geregistreerde Windrichtingmetingen & Datakwaliteit")
 
-df["Tijd"] = df["Tijd"].astype(str).str.strip()
-df["Timestamp"] = pd.to_datetime(df["Dag"].astype(str) + " " + df["Tijd"].astype(str), errors="coerce")
-df["Raw Value"] = pd.to_numeric(df["Raw Value"], errors="coerce")
-
-df_dag = df[df["Timestamp"].dt.date == gekozen_dag].copy()
-df_dag = df_dag[df_dag["Raw Value"].notna()]
+# df bevat alleen de dagen van de gekozen periode
+df_dag = df[df["Raw Value"].notna()].copy()
 
 if df_dag.empty:
-    st.warning(f"Er zijn geen windrichtingmetingen beschikbaar voor {gekozen_dag}.")
+    st.warning(f"Er zijn geen windrichtingmetingen beschikbaar {bereik_tekst}.")
+    profiel.afronden(st.sidebar)
     st.stop()
 
-df_dag = df_dag.sort_values("Timestamp")
-
 # ---------------------------------------------------------
 # 6. QC REGELS – WINDRICHTING (0–360°)
 # ---------------------------------------------------------
-df_dag["QC_Flag"] = "OK"
-df_dag.loc[(df_dag["Raw Value"] < 0) | (df_dag["Raw Value"] > 360), "QC_Flag"] = "OUT_OF_RANGE"
+profiel.sectie("6. QC REGELS – WINDRICHTING (0–360°)")
+# QC_Flag (regeltabel in utils.flags) komt al mee uit de compacte reeks
+
+# Temporele controles met circulair verschil (350° → 10° is 20°); gaten breken de vergelijking
+df_dag["Tijd_Flag"] = temporal_flag(WINDRICHTING, df_dag)
 
 # ---------------------------------------------------------
 # 7. TABEL MET KLEUREN + AFRONDING
 # ---------------------------------------------------------
-df_dag["Raw Value"] = df_dag["Raw Value"].round(0).astype("Int64")
-
-def highlight_qc(val):
-    colors = {
-        "OK": "background-color: #b6f2b6",
-        "OUT_OF_RANGE": "background-color: #ff8a80"
-    }
-    return colors.get(val, "")
-
-st.write(f"Windrichtingmetingen op {gekozen_dag}:")
-st.dataframe(
-    df_dag[["Timestamp", "Raw Value", "QC_Flag"]]
-    .style
-    .applymap(highlight_qc, subset=["QC_Flag"])
-    .format({"Raw Value": "{:.0f}"})
+profiel.sectie("7. TABEL MET KLEUREN + AFRONDING")
+decimalen = display_decimals(WINDRICHTING)
+df_dag["Raw Value"] = df_dag["Raw Value"].round(decimalen)
+
+st.write(f"Windrichtingmetingen {bereik_tekst}:")
+# Gefilterd en gepagineerd; kleuren via één map over de flagkolom i.p.v. een callback per cel
+render_flag_table(
+    st,
+    df_dag[["Timestamp", "Raw Value", "QC_Flag", "Tijd_Flag"]],
+    {"Raw Value": f"{{:.{decimalen}f}}"},
+    key="windrichting"
 )
 
 st.markdown("""
 ### Legenda datakwaliteit
 - 🟩 **OK** — Geldige windrichting (0–360°)  
 - 🟥 **OUT_OF_RANGE** — Ongeldige waarde (buiten 0–360°)  
+
+Temporele controles (kolom *Tijd_Flag*):
+- 🩷 **SPIKE** — Meer dan 150° afwijking van beide buren (circulair)  
+- ⬜ **FLATLINE** — Langer dan 6 uur exact dezelfde richting  
 """)
 
 # ---------------------------------------------------------
 # 8. PREMIUM WINDROOS – DAG (ZONDER DOMINANTE PIJL)
 # ---------------------------------------------------------
+profiel.sectie("8. PREMIUM WINDROOS – DAG (ZONDER DOMINANTE PIJL)")
 
-# Waarden afronden op hele graden
-df_dag["Raw Value"] = df_dag["Raw Value"].round(0).astype("Int64")
-
-# Sectoren van 10 graden
-df_dag["Sector"] = (df_dag["Raw Value"] // 10) * 10
-freq_dag = df_dag.groupby("Sector").size().reset_index(name="Count")
-
-# Kleurintensiteit op basis van frequentie
-max_count_dag = freq_dag["Count"].max()
-freq_dag["Color"] = freq_dag["Count"] / max_count_dag
-
-fig_d = go.Figure()
-
-# Balken met kleurgradatie (LANGER GEMAAKT)
-fig_d.add_trace(go.Barpolar(
-    r=freq_dag["Count"] * 1.4,   # 40% langer
-    theta=freq_dag["Sector"],
-    marker=dict(
-        color=freq_dag["Color"],
-        colorscale="Blues",
-        cmin=0,
-        cmax=1
-    ),
-    opacity=0.95,
-    name="Frequentie"
-))
-
-# Cardinal directions
-cardinal_angles = [0, 45, 90, 135, 180, 225, 270, 315]
-cardinal_labels = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-
-for angle, label in zip(cardinal_angles, cardinal_labels):
-    fig_d.add_trace(go.Scatterpolar(
-        r=[max_count_dag * 1.8],
-        theta=[angle],
-        mode="text",
-        text=[label],
-        textfont=dict(size=14, color="black"),
-        showlegend=False
-    ))
-
-fig_d.update_layout(
-    title=f"Windroos – {gekozen_dag}",
-    polar=dict(
-        radialaxis=dict(showticklabels=True, ticks='outside', range=[0, max_count_dag * 2]),
-        angularaxis=dict(direction="clockwise", rotation=90)
-    ),
-    showlegend=True
-)
+# Som van de dagvectoren van de periode uit de vooraf berekende 36-sectoren histogrammen
+dag_hist = load_sector_histograms(station, WINDRICHTING, start, eind)
+counts_dag = rose_counts(dag_hist, start, eind)
+
+fig_d = windrose_figure(counts_dag, f"Windroos – {start if start == eind else f'{start} t/m {eind}'}")
 
 st.plotly_chart(fig_d, use_container_width=True)
 
 # Uitleg windroos
-st.markdown("""
+st.markdown(f"""
 ### Uitleg Windroos
 De windroos toont **hoe vaak** de wind uit elke richting heeft gewaaid.
 
@@ -333,19 +244,20 @@ De windroos toont **hoe vaak** de wind uit elke richting heeft gewaaid.
 
 - De labels **N, NE, E, SE, S, SW, W, NW** geven de **windrichtingen** aan.
 
-- De windroos gebruikt **alle individuele metingen** van de dag.  
+- De windroos gebruikt **alle individuele metingen** van de gekozen {eenheid}.  
   Er wordt **geen gemiddelde windrichting** berekend, omdat dat meteorologisch niet correct is.
 """)
 
 # Samenvatting
 st.markdown(f"""
-### Dagelijkse Windrichting Samenvatting
-- **Hoogste frequentie:** {max_count_dag} metingen  
-- **Aantal sectoren met wind:** {freq_dag[freq_dag['Count'] > 0].shape[0]}  
+### Windrichting Samenvatting ({bereik_tekst})
+- **Hoogste frequentie:** {counts_dag.max()} metingen  
+- **Aantal sectoren met wind:** {(counts_dag > 0).sum()}  
 """)
 # ---------------------------------------------------------
 # 9. QC SAMENVATTING – DAG
 # ---------------------------------------------------------
+profiel.sectie("9. QC SAMENVATTING – DAG")
 laagste = df_dag["Raw Value"].min()
 hoogste = df_dag["Raw Value"].max()
 qc_counts = df_dag["QC_Flag"].value_counts()
@@ -357,34 +269,25 @@ st.markdown(f"""
 - **Aantal OUT_OF_RANGE:** {qc_counts.get('OUT_OF_RANGE', 0)}  
 """)
 
-if qc_counts.get("OUT_OF_RANGE", 0) > 0:
-    conclusie = "❌ De dag bevat ongeldige windrichtingwaarden (buiten 0–360°)."
-else:
-    conclusie = "✔️ Alle waarden vallen binnen het geldige bereik."
+conclusie = day_conclusion(WINDRICHTING, laagste, hoogste, qc_counts, eenheid)
 
 st.markdown(f"### Dagconclusie\n{conclusie}")
 
 # ---------------------------------------------------------
 # 10. MAANDSTATISTIEKEN – WINDRICHTING
 # ---------------------------------------------------------
-maand = gekozen_dag.month
-jaar = gekozen_dag.year
-
-df_maand = df[
-    (df["Timestamp"].dt.month == maand) &
-    (df["Timestamp"].dt.year == jaar)
-].copy()
-
-df_maand = df_maand[df_maand["Raw Value"].notna()]
+profiel.sectie("10. MAANDSTATISTIEKEN – WINDRICHTING")
+# Uit de maandrollup van de store – geen scan over de ruwe metingen
+maand_qc = load_monthly_qc(station, WINDRICHTING)
+maand_stats = month_statistics(maand_qc, gekozen_dag.year, gekozen_dag.month)
 
-if not df_maand.empty:
+if maand_stats is not None:
 
-    totaal_waarden = len(df_maand)
-    fout_count = ((df_maand["Raw Value"] < 0) | (df_maand["Raw Value"] > 360)).sum()
-    fout_percentage = (fout_count / totaal_waarden) * 100
+    fout_count = maand_stats["ongeldig"]
+    fout_percentage = maand_stats["ongeldig_percentage"]
 
-    laagste_maand = df_maand["Raw Value"].min()
-    hoogste_maand = df_maand["Raw Value"].max()
+    laagste_maand = maand_stats["laagste"]
+    hoogste_maand = maand_stats["hoogste"]
 
     st.markdown(f"""
     ### Maandstatistieken ({gekozen_dag.strftime('%B %Y')})
@@ -397,87 +300,39 @@ if not df_maand.empty:
     # ---------------------------------------------------------
     # 11. MAANDCONCLUSIE
     # ---------------------------------------------------------
-    problemen = []
-
-    if fout_percentage >= 50:
-        maand_conclusie = (
-            "❌ Meer dan 50% van de maandwaarden is ongeldig. "
-            "De data is NIET geschikt voor analyse."
-        )
-    else:
-        if fout_count > 0:
-            problemen.append(
-                f"Er zijn {fout_count} ongeldige waarden gevonden. "
-                "Filter deze uit voordat je de data verder gebruikt."
-            )
-
-        if problemen:
-            maand_conclusie = (
-                "⚠️ De data bevat aandachtspunten. Gebruik de data alleen na filtering.\n\n"
-                + "\n".join(f"- {p}" for p in problemen)
-            )
-        else:
-            maand_conclusie = (
-                "✔ Het station toont geldige windrichtingwaarden voor deze maand. "
-                "Het station is geschikt voor verdere analyse."
-            )
+    maand_conclusie = month_conclusion(WINDRICHTING, maand_stats)
 
     st.markdown(f"### Maandconclusie\n{maand_conclusie}")
 
 # ---------------------------------------------------------
 # 12. PREMIUM WINDROOS – MAAND (ZONDER DOMINANTE PIJL)
 # ---------------------------------------------------------
+profiel.sectie("12. PREMIUM WINDROOS – MAAND (ZONDER DOMINANTE PIJL)")
 st.subheader("Maandelijkse Windroos")
 
-df_maand_valid = df_maand[df_maand["Raw Value"].between(0, 360)]
+# Periode = som van de dagvectoren; geen nieuwe pass over de metingen
+roos_periode = st.radio("Periode windroos", ["Maand", "Jaar", "Volledige periode"], horizontal=True)
+
+if roos_periode == "Maand":
+    roos_start = gekozen_dag.replace(day=1)
+    roos_eind = roos_start.replace(day=days_in_month(roos_start.year, roos_start.month))
+    titel = f"Maandelijkse Windroos – {gekozen_dag.strftime('%B %Y')}"
+elif roos_periode == "Jaar":
+    roos_start = gekozen_dag.replace(month=1, day=1)
+    roos_eind = gekozen_dag.replace(month=12, day=31)
+    titel = f"Windroos – {gekozen_dag.year}"
+else:
+    roos_start = roos_eind = None
+    titel = "Windroos – volledige periode"
+
+# Alleen de dagvectoren van de gekozen periode lezen
+periode_hist = load_sector_histograms(station, WINDRICHTING, roos_start, roos_eind)
+counts_m = rose_counts(periode_hist, roos_start, roos_eind)
 
-if df_maand_valid.empty:
-    st.info("Geen geldige windrichtingwaarden beschikbaar voor deze maand.")
+if counts_m.sum() == 0:
+    st.info("Geen geldige windrichtingwaarden beschikbaar voor deze periode.")
 else:
-    df_maand_valid["Sector"] = (df_maand_valid["Raw Value"] // 10) * 10
-    freq_m = df_maand_valid.groupby("Sector").size().reset_index(name="Count")
-
-    max_count_m = freq_m["Count"].max()
-    freq_m["Color"] = freq_m["Count"] / max_count_m
-
-    fig_m = go.Figure()
-
-    # Balken met kleurgradatie (LANGER GEMAAKT)
-    fig_m.add_trace(go.Barpolar(
-        r=freq_m["Count"] * 1.4,   # 40% langer
-        theta=freq_m["Sector"],
-        marker=dict(
-            color=freq_m["Color"],
-            colorscale="Blues",
-            cmin=0,
-            cmax=1
-        ),
-        opacity=0.95,
-        name="Frequentie"
-    ))
-
-    # Cardinal directions
-    cardinal_angles = [0, 45, 90, 135, 180, 225, 270, 315]
-    cardinal_labels = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-
-    for angle, label in zip(cardinal_angles, cardinal_labels):
-        fig_m.add_trace(go.Scatterpolar(
-            r=[max_count_m * 1.8],
-            theta=[angle],
-            mode="text",
-            text=[label],
-            textfont=dict(size=14, color="black"),
-            showlegend=False
-        ))
-
-    fig_m.update_layout(
-        title=f"Maandelijkse Windroos – {gekozen_dag.strftime('%B %Y')}",
-        polar=dict(
-            radialaxis=dict(showticklabels=True, ticks='outside', range=[0, max_count_m * 2]),
-            angularaxis=dict(direction="clockwise", rotation=90)
-        ),
-        showlegend=True
-    )
+    fig_m = windrose_figure(counts_m, titel)
 
     st.plotly_chart(fig_m, use_container_width=True)
 
@@ -494,13 +349,55 @@ else:
 
     - De labels **N, NE, E, SE, S, SW, W, NW** geven de **windrichtingen** aan.
 
-    - De windroos gebruikt **alle individuele metingen** van de maand.  
+    - De windroos gebruikt **alle individuele metingen** van de gekozen periode.  
       Er wordt **geen gemiddelde windrichting** berekend, omdat dat meteorologisch niet correct is.
     """)
 
     # Samenvatting
     st.markdown(f"""
     ### Maandelijkse Windrichting Samenvatting
-    - **Hoogste frequentie:** {max_count_m} metingen  
-    - **Aantal sectoren met wind:** {freq_m[freq_m['Count'] > 0].shape[0]}  
+    - **Hoogste frequentie:** {counts_m.max()} metingen  
+    - **Aantal sectoren met wind:** {(counts_m > 0).sum()}  
     """)
+
+# ---------------------------------------------------------
+# ⭐ 13. NETWERKKALENDER – COMPLETENESS PER STATION EN DAG
+# ---------------------------------------------------------
+profiel.sectie("13. NETWERKKALENDER – COMPLETENESS PER STATION EN DAG")
+
+st.subheader("Netwerkkalender – completeness per station en dag")
+
+# Jaren met metingen bij minstens één station
+jaren = sorted({
+    dag.year for s in stations for dag in manifest_days(manifest, s, WINDRICHTING)
+})
+kalender_jaar = st.selectbox("Jaar", jaren[::-1] + ["Alle jaren"])
+
+if kalender_jaar == "Alle jaren":
+    kalender_start, kalender_eind = datetime.date(jaren[0], 1, 1), datetime.date(jaren[-1], 12, 31)
+else:
+    kalender_start, kalender_eind = datetime.date(kalender_jaar, 1, 1), datetime.date(kalender_jaar, 12, 31)
+
+# Per station-dag een bitset van de 144 slots → completeness is een popcount,
+# het netwerk (≥1 / alle stations) een OR / AND over de stations
+kalender = network_calendar(NETWERK, stations, WINDRICHTING, kalender_start, kalender_eind, manifest)
+st.plotly_chart(network_calendar_figure(kalender), use_container_width=True)
+st.caption("Groen: ≥75% compleet · oranje/rood: minder. "
+           "De onderste rijen tellen slots met een meting bij minstens één / alle stations.")
+profiel.resident("netwerk (compact)", NETWERK.rows, NETWERK.nbytes)
+
+# ---------------------------------------------------------
+# ⭐ 14. STATION – ALLE VARIABELEN IN DE PERIODE
+# ---------------------------------------------------------
+profiel.sectie("14. STATION – ALLE VARIABELEN IN DE PERIODE")
+
+st.subheader(f"{station} – alle variabelen {bereik_tekst}")
+
+# Alle werkmappen van het station parallel geladen en uitgelijnd op één 10-minuten raster
+variabelen = sorted(v for v, entry in manifest[station].items() if entry.get("metingen", 0) > 0)
+station_frame = load_station_frame(station, variabelen, start, eind)
+profiel.frame("station (alle variabelen)", station_frame)
+
+st.dataframe(variable_completeness(station_frame, start, eind), use_container_width=True)
+
+profiel.afronden(st.sidebar)
@@ -0,0 +1,36 @@
+"""Batch QC over alle stations en variabelen, zonder dashboard.
+
+Gebruik:
+    python batch_qc.py --output qc_resultaten.csv --workers 8
+"""
+
+import argparse
+import time
+
+from utils.batch import run_batch
+from utils.loader import DATA_PATH
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QC voor de hele data/ map")
+    parser.add_argument("--data", default=DATA_PATH, help="map met stationsmappen")
+    parser.add_argument("--output", default="qc_resultaten.csv",
+                        help="resultaattabel (.csv of .parquet)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="aantal processen (standaard: aantal cores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    resultaten = run_batch(args.data, args.workers)
+
+    if args.output.endswith(".parquet"):
+        resultaten.to_parquet(args.output, index=False)
+    else:
+        resultaten.to_csv(args.output, index=False)
+
+    duur = time.perf_counter() - start
+    print(f"{len(resultaten)} dagresultaten geschreven naar {args.output} in {duur:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark van de QC-stappen op synthetische data.
+
+Gebruik:
+    python benchmark_qc.py --stations 4 --jaren 3 --output benchmark.json
+    python benchmark_qc.py --output nieuw.json --compare benchmark.json
+"""
+
+import argparse
+import json
+import tempfile
+
+from utils.benchmark import compare_reports, run_benchmark
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tijd per QC-stap op synthetische data")
+    parser.add_argument("--stations", type=int, default=2, help="aantal synthetische stations")
+    parser.add_argument("--jaren", type=int, default=1, help="jaren aan data per werkmap")
+    parser.add_argument("--interval", default="10min", help="meetinterval")
+    parser.add_argument("--gaten", type=float, default=0.05,
+                        help="aandeel ontbrekende metingen")
+    parser.add_argument("--buiten-bereik", type=float, default=0.001,
+                        help="aandeel metingen buiten bereik")
+    parser.add_argument("--formaat", choices=["xlsx", "parquet"], default="xlsx",
+                        help="formaat van de synthetische werkmappen")
+    parser.add_argument("--repeat", type=int, default=3, help="herhalingen per stap")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="aantal processen voor de batch-stap")
+    parser.add_argument("--workdir", default=None,
+                        help="map voor synthetische data (standaard: tijdelijke map)")
+    parser.add_argument("--output", default="benchmark.json", help="JSON-rapport")
+    parser.add_argument("--compare", default=None,
+                        help="eerder JSON-rapport om mee te vergelijken")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rapport = run_benchmark(
+            args.workdir or tmp,
+            stations=args.stations,
+            jaren=args.jaren,
+            interval=args.interval,
+            gap_fraction=args.gaten,
+            out_of_range_fraction=args.buiten_bereik,
+            file_format=args.formaat,
+            repeat=args.repeat,
+            workers=args.workers,
+        )
+
+    with open(args.output, "w") as f:
+        json.dump(rapport, f, indent=2)
+
+    for stap in rapport["stappen"]:
+        print(f"{stap['stap']:<28} {stap['variabele'] or '':<22} "
+              f"{stap['rijen']:>9} rijen  {stap['mediaan_s'] * 1000:9.1f} ms")
+    print(f"Rapport geschreven naar {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            oud = json.load(f)
+        vergelijking = compare_reports(oud, rapport)
+        print(vergelijking.to_string(index=False))
+
+        if vergelijking["regressie"].any():
+            raise SystemExit("Regressie: minstens één stap is trager geworden")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Statische HTML-maandrapporten voor alle stations en variabelen.
+
+Gebruik:
+    python report_qc.py --output reports --workers 8
+
+Ongewijzigde maanden worden overgeslagen, dus het script kan als geplande
+taak (bijv. elke nacht) draaien.
+"""
+
+import argparse
+import time
+
+from utils.loader import DATA_PATH
+from utils.report import RAPPORT_DIR, run_reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maandrapporten voor de hele data/ map")
+    parser.add_argument("--data", default=DATA_PATH, help="map met stationsmappen")
+    parser.add_argument("--output", default=RAPPORT_DIR,
+                        help="map voor de rapporten (<station>/<variabele>/<jjjj-mm>.html)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="aantal processen (standaard: aantal cores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    uitkomsten = run_reports(args.data, args.output, args.workers)
+
+    duur = time.perf_counter() - start
+    print(
+        f"{uitkomsten['nieuw']} rapporten geschreven, "
+        f"{uitkomsten['overgeslagen']} ongewijzigd overgeslagen "
+        f"naar {args.output} in {duur:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Ruimtelijke QC: elke meting vergeleken met de andere stations, zonder dashboard.
+
+Gebruik:
+    python spatial_qc.py --variabele Air_Temperaturedeg_C --output uitschieters.csv
+    python spatial_qc.py --start 2024-01-01 --eind 2024-12-31 --drempel 4
+"""
+
+import argparse
+import time
+
+from utils.loader import DATA_PATH, TEMPERATUUR
+from utils.spatial import MIN_STATIONS, Z_DREMPEL, run_spatial_check
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ruimtelijke QC over alle stations")
+    parser.add_argument("--data", default=DATA_PATH, help="map met stationsmappen")
+    parser.add_argument("--variabele", default=TEMPERATUUR,
+                        help="variabele (bestandsnaam zonder _QC.xlsx)")
+    parser.add_argument("--start", default=None, help="eerste dag (JJJJ-MM-DD)")
+    parser.add_argument("--eind", default=None, help="laatste dag (JJJJ-MM-DD)")
+    parser.add_argument("--drempel", type=float, default=Z_DREMPEL,
+                        help="|z| waarboven een meting een uitschieter is")
+    parser.add_argument("--min-stations", type=int, default=MIN_STATIONS,
+                        help="minimaal aantal stations met een meting per tijdstip")
+    parser.add_argument("--output", default="uitschieters.csv",
+                        help="uitschietertabel (.csv of .parquet)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="aantal threads/processen (standaard: aantal cores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    uitschieters, samenvatting = run_spatial_check(
+        args.variabele, args.start, args.eind, args.data,
+        args.drempel, args.min_stations, args.workers
+    )
+
+    if args.output.endswith(".parquet"):
+        uitschieters.to_parquet(args.output, index=False)
+    else:
+        uitschieters.to_csv(args.output, index=False)
+
+    duur = time.perf_counter() - start
+    print(samenvatting.to_string(index=False))
+    print(f"{len(uitschieters)} uitschieters geschreven naar {args.output} in {duur:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
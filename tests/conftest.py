@@ -0,0 +1,5 @@
+import os
+import sys
+
+# De tests importeren ``utils`` vanuit de hoofdmap, net als de scripts
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from utils.bitset import (
+    WOORDEN, completeness, day_bitsets, day_range, intersection, popcount, union
+)
+
+SLOT = 600
+DAG = 86400
+
+
+def _voorbeeld():
+    # Dag 0: slots 0, 1 en 143 gemeten, slot 2 leeg (NaN), één tijdstip naast het raster
+    # Dag 1: niets; dag 2: alleen slot 64 (eerste bit van het tweede woord)
+    tijd = [0, 30, SLOT, 2 * SLOT, 143 * SLOT, 2 * DAG + 64 * SLOT]
+    waarden = [20.0, 20.2, 20.1, np.nan, 19.8, 21.0]
+    return day_bitsets(tijd, waarden)
+
+
+def test_day_bitsets_zet_een_bit_per_gemeten_slot():
+    eerste_dag, bits = _voorbeeld()
+
+    assert eerste_dag == 0
+    assert bits.dtype == np.uint64
+    assert bits.shape == (3, WOORDEN)
+    assert bits[0].tolist() == [0b11, 0, 1 << 15]
+    assert bits[1].tolist() == [0, 0, 0]
+    assert bits[2].tolist() == [0, 1, 0]
+
+
+def test_day_bitsets_zonder_metingen():
+    eerste_dag, bits = day_bitsets([0, SLOT], [np.nan, np.nan])
+    assert eerste_dag == 0
+    assert bits.shape == (0, WOORDEN)
+
+
+def test_popcount_en_completeness():
+    _, bits = _voorbeeld()
+    assert popcount(bits).tolist() == [3, 0, 1]
+    assert completeness(bits).tolist() == [2.1, 0.0, 0.7]
+
+
+def test_volle_dag_is_100_procent():
+    tijd = np.arange(144) * SLOT
+    _, bits = day_bitsets(tijd, np.ones(144))
+    assert popcount(bits).tolist() == [144]
+    assert completeness(bits).tolist() == [100.0]
+
+
+def test_popcount_zonder_bitwise_count(monkeypatch):
+    _, bits = _voorbeeld()
+    verwacht = popcount(bits).tolist()
+
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    assert popcount(bits).tolist() == verwacht
+
+
+def test_day_range_vult_dagen_buiten_de_reeks_met_nullen():
+    eerste_dag, bits = _voorbeeld()
+    uit = day_range(eerste_dag, bits, "1969-12-31", "1970-01-02")
+
+    assert uit.shape == (3, WOORDEN)
+    assert uit[0].tolist() == [0, 0, 0]
+    assert uit[1].tolist() == bits[0].tolist()
+    assert uit[2].tolist() == bits[1].tolist()
+
+
+@pytest.mark.parametrize("functie, verwacht", [(union, 0b0111), (intersection, 0b0010)])
+def test_union_en_intersection_over_stations(functie, verwacht):
+    # stations × dagen × woorden
+    bits = np.zeros((2, 1, WOORDEN), dtype=np.uint64)
+    bits[0, 0, 0] = 0b0011
+    bits[1, 0, 0] = 0b0110
+
+    netwerk = functie(bits)
+    assert netwerk.shape == (1, WOORDEN)
+    assert netwerk[0].tolist() == [verwacht, 0, 0]
+    assert popcount(netwerk).tolist() == [bin(verwacht).count("1")]
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from utils.compact import BYTES_PER_METING, CompactReeks
+from utils.flags import flag_variable
+
+TEMPERATUUR = "Air_Temperaturedeg_C"
+
+
+def _frame():
+    # to_frame geeft nanoseconden; pandas 3 kiest bij tekst soms een grovere eenheid
+    ts = pd.Series(pd.date_range("2024-01-01", periods=2 * 144, freq="10min")).astype("datetime64[ns]")
+    waarden = (20 + (np.arange(len(ts)) % 50) * 0.3).round(1)
+    waarden[[0, 7, 100]] = [24.8, -3.4, 41.2]
+    waarden[[5, 200]] = np.nan
+    return pd.DataFrame({"Timestamp": ts, "Raw Value": waarden, "Datum": ts.dt.normalize()})
+
+
+def test_to_frame_geeft_het_frame_terug():
+    df = _frame()
+    reeks = CompactReeks.from_frame("Teststation", TEMPERATUUR, df)
+
+    terug = reeks.to_frame()
+    pd.testing.assert_frame_equal(terug[["Timestamp", "Raw Value", "Datum"]], df)
+    # Na float32 → float64 geen 24,799999
+    assert terug["Raw Value"].iloc[0] == 24.8
+    assert terug["QC_Flag"].tolist() == flag_variable(TEMPERATUUR, df["Raw Value"]).tolist()
+
+
+def test_to_frame_van_een_periode():
+    df = _frame()
+    reeks = CompactReeks.from_frame("Teststation", TEMPERATUUR, df)
+
+    terug = reeks.to_frame("2024-01-02", "2024-01-02")
+    verwacht = df[df["Datum"] == "2024-01-02"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(terug[["Timestamp", "Raw Value", "Datum"]], verwacht)
+    assert terug["QC_Flag"].iloc[200 - 144] == "MISSING"
+
+
+def test_opslag_per_meting():
+    reeks = CompactReeks.from_frame("Teststation", TEMPERATUUR, _frame())
+    assert reeks.tijd.dtype == np.uint32
+    assert reeks.waarden.dtype == np.float32
+    assert reeks.flags.dtype == np.uint8
+    assert reeks.nbytes == len(reeks) * BYTES_PER_METING
+
+
+def test_zonder_regels_geen_qc_flag():
+    reeks = CompactReeks.from_frame("Teststation", "Onbekend", _frame())
+    assert reeks.flags is None
+    assert "QC_Flag" not in reeks.to_frame().columns
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from utils.downsample import downsample
+
+WAARDEN = [5.0, 1.0, 7.0, 3.0, 9.0, 2.0, 8.0, 0.0, 6.0, 4.0]
+
+
+def _frame(waarden=WAARDEN):
+    return pd.DataFrame({
+        "Timestamp": pd.date_range("2024-01-01", periods=len(waarden), freq="10min"),
+        "Raw Value": waarden,
+    })
+
+
+def test_binnen_budget_ongewijzigd():
+    df = _frame()
+    assert downsample(df, budget=len(df)) is df
+
+
+def test_min_en_max_per_bucket():
+    # budget 4 → 2 buckets: rijen 0–4 en 5–9; plus de eerste en laatste rij
+    uit = downsample(_frame(), budget=4)
+    assert uit.index.tolist() == [0, 1, 4, 6, 7, 9]
+    assert uit["Raw Value"].tolist() == [5.0, 1.0, 9.0, 8.0, 0.0, 4.0]
+
+
+def test_behouden_rijen_blijven_staan():
+    df = _frame()
+    behouden = pd.Series(False, index=df.index)
+    behouden[2] = True
+
+    uit = downsample(df, budget=4, behouden=behouden)
+    assert uit.index.tolist() == [0, 1, 2, 4, 6, 7, 9]
+
+
+def test_lege_waarden_tellen_niet_mee():
+    waarden = list(WAARDEN)
+    waarden[4] = np.nan
+
+    uit = downsample(_frame(waarden), budget=4)
+    assert uit.index.tolist() == [0, 1, 2, 6, 7, 9]
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.flags import flag_indices, flag_names, flag_variable
+
+TEMPERATUUR = "Air_Temperaturedeg_C"
+WINDRICHTING = "Wind_Dir_Averagedeg"
+
+
+@pytest.mark.parametrize("waarde, verwacht", [
+    (-0.1, "LOW_IMPOSSIBLE"),
+    (0.0, "LOW_SUSPICIOUS"),
+    (4.9, "LOW_SUSPICIOUS"),
+    (5.0, "LOW_RANGE"),
+    (19.9, "LOW_RANGE"),
+    (20.0, "OK"),
+    (36.9, "OK"),
+    (37.0, "HIGH"),
+    (40.0, "HIGH"),
+    (40.1, "VERY_HIGH"),
+    # Eerst afgerond op 0,1°C
+    (36.96, "HIGH"),
+    (40.04, "HIGH"),
+    (np.nan, "MISSING"),
+])
+def test_temperatuurbanden(waarde, verwacht):
+    assert flag_variable(TEMPERATUUR, pd.Series([waarde])).tolist() == [verwacht]
+
+
+@pytest.mark.parametrize("waarde, verwacht", [
+    (-0.1, "OUT_OF_RANGE"),
+    (0.0, "OK"),
+    (359.9, "OK"),
+    (360.0, "OK"),
+    # Windrichting wordt niet afgerond
+    (360.4, "OUT_OF_RANGE"),
+    (np.nan, "MISSING"),
+])
+def test_windrichtingbanden(waarde, verwacht):
+    assert flag_variable(WINDRICHTING, pd.Series([waarde])).tolist() == [verwacht]
+
+
+def test_flag_variable_behoudt_index():
+    waarden = pd.Series([21.0, 45.0], index=[10, 20])
+    flags = flag_variable(TEMPERATUUR, waarden)
+    assert flags.index.tolist() == [10, 20]
+    assert flags.name == "QC_Flag"
+
+
+def test_indices_en_namen_geven_dezelfde_flags():
+    waarden = pd.Series([-1.0, 3.0, 12.0, 25.0, 38.0, 41.0, np.nan])
+    codes = flag_indices(TEMPERATUUR, waarden)
+
+    assert codes.dtype == np.uint8
+    namen = [flag_names(TEMPERATUUR)[c] for c in codes]
+    assert namen == flag_variable(TEMPERATUUR, waarden).tolist()
+
+
+def test_zonder_regels():
+    assert flag_variable("Onbekend", pd.Series([1.0])) is None
+    assert flag_indices("Onbekend", [1.0]) is None
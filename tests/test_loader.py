@@ -0,0 +1,42 @@
+import datetime
+
+import pandas as pd
+
+from utils.loader import select_day, select_month, select_range
+
+
+def _frame():
+    # Vier dagen, elke zes uur een meting
+    ts = pd.date_range("2024-01-01", periods=16, freq="6h")
+    return pd.DataFrame({"Timestamp": ts, "Raw Value": range(16)})
+
+
+def test_select_range_hele_dagen_inclusief_eind():
+    uit = select_range(_frame(), "2024-01-02", "2024-01-03")
+
+    assert len(uit) == 8
+    assert uit["Timestamp"].iloc[0] == pd.Timestamp("2024-01-02 00:00")
+    assert uit["Timestamp"].iloc[-1] == pd.Timestamp("2024-01-03 18:00")
+
+
+def test_select_range_gelijk_aan_masker():
+    df = _frame()
+    masker = (df["Timestamp"] >= "2024-01-02") & (df["Timestamp"] < "2024-01-04")
+    pd.testing.assert_frame_equal(select_range(df, "2024-01-02", "2024-01-03"), df[masker])
+
+
+def test_select_range_negeert_tijd_in_de_grenzen():
+    uit = select_range(_frame(), "2024-01-02 12:00", "2024-01-02 01:00")
+    assert uit["Raw Value"].tolist() == [4, 5, 6, 7]
+
+
+def test_select_range_buiten_de_reeks_is_leeg():
+    assert select_range(_frame(), "2023-12-01", "2023-12-31").empty
+    assert select_range(_frame(), "2024-02-01", "2024-02-02").empty
+
+
+def test_select_day_en_select_month():
+    df = _frame()
+    assert select_day(df, datetime.date(2024, 1, 4))["Raw Value"].tolist() == [12, 13, 14, 15]
+    assert len(select_month(df, 2024, 1)) == 16
+    assert select_month(df, 2024, 2).empty
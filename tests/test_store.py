@@ -0,0 +1,92 @@
+import datetime
+import os
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+from utils import store
+from utils.store import ingest, load_daily_qc, load_monthly_qc, load_store
+
+STATION = "Teststation"
+TEMPERATUUR = "Air_Temperaturedeg_C"
+
+
+@pytest.fixture(autouse=True)
+def lege_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "STORE_DIR", str(tmp_path / "store"))
+    monkeypatch.setattr(store, "_memo", {})
+
+
+def _metingen(start, aantal):
+    """``aantal`` 10-minuten metingen vanaf ``start``; elke 50e meting ontbreekt."""
+    ts = pd.date_range(start, periods=aantal, freq="10min")
+    waarden = 25 + 5 * np.sin(np.arange(aantal) / 20)
+    waarden[::50] = np.nan
+    return list(zip(ts, waarden.round(1)))
+
+
+def _schrijf_werkmap(pad, metingen):
+    os.makedirs(os.path.dirname(pad), exist_ok=True)
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Dag", "Tijd", "Raw Value"])
+    for ts, waarde in metingen:
+        ws.append([ts.date(), ts.time(), None if np.isnan(waarde) else float(waarde)])
+    wb.save(pad)
+
+
+def _inhoud():
+    return (
+        load_store(STATION, TEMPERATUUR, memo=False),
+        load_daily_qc(STATION, TEMPERATUUR),
+        load_monthly_qc(STATION, TEMPERATUUR),
+    )
+
+
+def test_incrementeel_gelijk_aan_volledig_opbouwen(tmp_path):
+    werkmap = str(tmp_path / "data" / STATION / f"{TEMPERATUUR}_QC.xlsx")
+    alles = _metingen("2024-01-31", 3 * 144)
+
+    # Eerste ingest stopt midden op 1 februari; de tweede vult die dag aan
+    _schrijf_werkmap(werkmap, alles[:144 + 36])
+    nieuw, dagen = ingest(STATION, TEMPERATUUR, werkmap)
+    assert nieuw == 144 + 36
+    assert dagen == [datetime.date(2024, 1, 31), datetime.date(2024, 2, 1)]
+
+    _schrijf_werkmap(werkmap, alles)
+    nieuw, dagen = ingest(STATION, TEMPERATUUR, werkmap)
+    assert nieuw == 2 * 144 - 36
+    assert dagen == [datetime.date(2024, 2, 1), datetime.date(2024, 2, 2)]
+
+    incrementeel = _inhoud()
+    ingest(STATION, TEMPERATUUR, werkmap, rebuild=True)
+    volledig = _inhoud()
+
+    assert len(incrementeel[0]) == 3 * 144
+    for links, rechts in zip(incrementeel, volledig):
+        pd.testing.assert_frame_equal(links, rechts)
+
+
+def test_ongewijzigde_werkmap_wordt_overgeslagen(tmp_path):
+    werkmap = str(tmp_path / "data" / STATION / f"{TEMPERATUUR}_QC.xlsx")
+    _schrijf_werkmap(werkmap, _metingen("2024-01-01", 144))
+
+    ingest(STATION, TEMPERATUUR, werkmap)
+    assert ingest(STATION, TEMPERATUUR, werkmap) == (0, [])
+
+
+def test_andere_werkmap_bouwt_de_store_opnieuw_op(tmp_path):
+    werkmap_a = str(tmp_path / "data" / STATION / f"{TEMPERATUUR}_QC.xlsx")
+    werkmap_b = str(tmp_path / "data_b" / STATION / f"{TEMPERATUUR}_QC.xlsx")
+    _schrijf_werkmap(werkmap_a, _metingen("2024-01-01", 144))
+    _schrijf_werkmap(werkmap_b, _metingen("2024-03-01", 72))
+
+    ingest(STATION, TEMPERATUUR, werkmap_a)
+    ingest(STATION, TEMPERATUUR, werkmap_b)
+
+    df = load_store(STATION, TEMPERATUUR, memo=False)
+    assert len(df) == 72
+    assert df["Timestamp"].iloc[0] == pd.Timestamp("2024-03-01")
+    assert load_daily_qc(STATION, TEMPERATUUR)["Dag"].tolist() == [datetime.date(2024, 3, 1)]
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from utils.temporal import circular_diff, temporal_checks, temporal_flag
+
+TEMPERATUUR = "Air_Temperaturedeg_C"
+WINDRICHTING = "Wind_Dir_Averagedeg"
+
+
+def _frame(waarden, tijden=None):
+    if tijden is None:
+        tijden = pd.date_range("2024-01-01", periods=len(waarden), freq="10min")
+    return pd.DataFrame({"Timestamp": pd.to_datetime(tijden), "Raw Value": waarden})
+
+
+def test_step_boven_max_stap():
+    checks = temporal_checks(TEMPERATUUR, _frame([20.0, 20.5, 24.0, 24.2, 24.1]))
+    assert checks["STEP"].tolist() == [False, False, True, False, False]
+    assert not checks["SPIKE"].any()
+
+
+def test_spike_naar_beide_buren():
+    checks = temporal_checks(TEMPERATUUR, _frame([20.0, 20.2, 23.0, 20.3, 20.1]))
+    assert checks["SPIKE"].tolist() == [False, False, True, False, False]
+    assert not checks["STEP"].any()
+
+
+def test_geen_verschil_over_een_gat():
+    # 00:20 ontbreekt: de sprong van 20 naar 25 ligt over het gat heen
+    tijden = ["2024-01-01 00:00", "2024-01-01 00:10", "2024-01-01 00:30"]
+    checks = temporal_checks(TEMPERATUUR, _frame([20.0, 20.0, 25.0], tijden))
+    assert not checks.to_numpy().any()
+
+
+def test_tijdstip_naast_het_raster_krijgt_geen_flag():
+    tijden = ["2024-01-01 00:00", "2024-01-01 00:05", "2024-01-01 00:10"]
+    checks = temporal_checks(TEMPERATUUR, _frame([20.0, 30.0, 20.0], tijden))
+    assert not checks.to_numpy().any()
+
+
+def test_flatline_pas_boven_vlak_uren():
+    # vlak_uren = 3 → meer dan 18 gelijke slots
+    net_niet = temporal_checks(TEMPERATUUR, _frame([21.0] + [20.0] * 18 + [21.0]))
+    assert not net_niet["FLATLINE"].any()
+
+    wel = temporal_checks(TEMPERATUUR, _frame([21.0] + [20.0] * 19 + [21.0]))
+    assert wel["FLATLINE"].tolist() == [False] + [True] * 19 + [False]
+
+
+def test_circulair_verschil():
+    assert circular_diff(10, 350) == 20
+    assert circular_diff(350, 10) == -20
+
+
+def test_windrichting_spike_rond_noord_is_geen_piek():
+    checks = temporal_checks(WINDRICHTING, _frame([350.0, 10.0, 350.0]))
+    assert not checks["SPIKE"].any()
+
+    checks = temporal_checks(WINDRICHTING, _frame([0.0, 170.0, 5.0]))
+    assert checks["SPIKE"].tolist() == [False, True, False]
+
+
+def test_temporal_flag_prioriteit_en_missing():
+    flag = temporal_flag(TEMPERATUUR, _frame([20.0, 20.2, 23.0, 20.3, np.nan]))
+    assert flag.tolist() == ["OK", "OK", "SPIKE", "OK", "MISSING"]
+
+
+def test_zonder_regels():
+    assert temporal_checks("Hours_of_Sunshinehr", _frame([1.0, 2.0])) is None
+    assert temporal_flag("Hours_of_Sunshinehr", _frame([1.0, 2.0])) is None
@@ -0,0 +1,82 @@
+import datetime
+import logging
+
+import pandas as pd
+
+from utils.timestamps import combine_timestamps, report_invalid
+
+
+def _kolom(waarden):
+    return pd.Series(waarden, dtype=object)
+
+
+def test_gemengde_celtypen():
+    dag = _kolom([
+        datetime.datetime(2024, 1, 1),
+        45293.0,                       # Excel-serienummer → 2024-01-02
+        "2024-01-03",
+        "03-01-2024",                  # terugvaloptie, dag eerst
+        None,
+        "geen datum",
+    ])
+    tijd = _kolom([
+        datetime.time(10, 20),
+        0.5,                           # fractie van een dag → 12:00
+        "10:20",
+        datetime.timedelta(hours=1, minutes=30),
+        None,
+        "10:00",
+    ])
+
+    timestamps, ongeldig = combine_timestamps(dag, tijd)
+
+    assert timestamps[:4].tolist() == [
+        pd.Timestamp("2024-01-01 10:20"),
+        pd.Timestamp("2024-01-02 12:00"),
+        pd.Timestamp("2024-01-03 10:20"),
+        pd.Timestamp("2024-01-03 01:30"),
+    ]
+    assert timestamps[4:].isna().all()
+    # Een volledig lege rij telt niet als ongeldig
+    assert ongeldig.tolist() == [False, False, False, False, False, True]
+
+
+def test_numerieke_kolommen():
+    dag = pd.Series([45292.0, 45292.75])
+    tijd = pd.Series([0.25, 0.75])
+
+    timestamps, ongeldig = combine_timestamps(dag, tijd)
+    assert timestamps.tolist() == [pd.Timestamp("2024-01-01 06:00"), pd.Timestamp("2024-01-01 18:00")]
+    assert not ongeldig.any()
+
+
+def test_tijd_als_datumcel():
+    dag = _kolom([datetime.date(2024, 1, 1)])
+    tijd = _kolom([datetime.datetime(1899, 12, 30, 10, 20)])
+
+    timestamps, _ = combine_timestamps(dag, tijd)
+    assert timestamps.tolist() == [pd.Timestamp("2024-01-01 10:20")]
+
+
+def test_ongeldige_rijen_worden_gemeld(caplog):
+    dag = _kolom(["2024-01-01", "geen datum", None])
+    tijd = _kolom(["10:00", "10:10", None])
+    _, ongeldig = combine_timestamps(dag, tijd)
+
+    with caplog.at_level(logging.WARNING, logger="aws_qc.timestamps"):
+        report_invalid(ongeldig, dag, tijd, "werkmap.xlsx")
+
+    assert len(caplog.records) == 1
+    bericht = caplog.records[0].getMessage()
+    assert bericht.startswith("werkmap.xlsx: 1 rijen zonder geldig tijdstip")
+    assert "'geen datum' '10:10'" in bericht
+
+
+def test_niets_te_melden(caplog):
+    dag = _kolom(["2024-01-01"])
+    tijd = _kolom(["10:00"])
+    _, ongeldig = combine_timestamps(dag, tijd)
+
+    with caplog.at_level(logging.WARNING, logger="aws_qc.timestamps"):
+        report_invalid(ongeldig, dag, tijd, "werkmap.xlsx")
+    assert not caplog.records
@@ -0,0 +1 @@
+"""Gedeelde hulpfuncties voor de AWS QC dashboards."""
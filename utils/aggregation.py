@@ -0,0 +1,74 @@
+"""Aggregaties over de dagelijkse QC-resultaten (maandrollups en -statistieken).
+
+De maandrollup wordt afgeleid uit de dagtabel van ``utils.qc.daily_qc``
+(aantallen en sommen optellen, minima/maxima van de dagen nemen), zodat de
+maandpanelen in de dashboards geen ruwe metingen meer hoeven te scannen.
+"""
+
+import calendar
+
+import pandas as pd
+
+from utils.completeness import MIN_PERCENTAGE, SLOTS_PER_DAG
+
+
+def days_in_month(jaar, maand):
+    return calendar.monthrange(jaar, maand)[1]
+
+
+def monthly_rollup(dag_qc):
+    """Eén rij per maand uit de dagtabel van ``utils.qc.daily_qc``.
+
+    Geeft ``Maand`` (eerste dag, datetime64), ``Dagen`` (dagen met rijen),
+    ``Goede dagen``, ``Aanwezig``, ``Percentage`` (t.o.v. alle slots van de
+    maand), ``Minimum``, ``Maximum``, ``Som``, ``Gemiddelde``, ``Ongeldig``,
+    ``Minimum geldig``, ``Maximum geldig`` en de opgetelde ``Aantal <flag>``.
+    """
+    dag = pd.to_datetime(dag_qc["Dag"].astype(str))
+    dag_qc = dag_qc.assign(
+        Maand=dag.dt.to_period("M").dt.to_timestamp(),
+        **{"Goede dagen": dag_qc["Percentage"] >= MIN_PERCENTAGE}
+    )
+
+    count_cols = [c for c in dag_qc.columns if c.startswith("Aantal ")]
+    sommen = ["Aanwezig", "Som", "Ongeldig", "Goede dagen"] + count_cols
+
+    gegroepeerd = dag_qc.groupby("Maand", sort=True)
+    maand_qc = gegroepeerd[sommen].sum()
+    maand_qc[["Minimum", "Minimum geldig"]] = gegroepeerd[["Minimum", "Minimum geldig"]].min()
+    maand_qc[["Maximum", "Maximum geldig"]] = gegroepeerd[["Maximum", "Maximum geldig"]].max()
+    maand_qc["Dagen"] = gegroepeerd.size()
+    maand_qc = maand_qc.reset_index()
+
+    slots = maand_qc["Maand"].dt.days_in_month * SLOTS_PER_DAG
+    maand_qc["Percentage"] = (maand_qc["Aanwezig"] / slots * 100).round(1)
+    maand_qc["Gemiddelde"] = maand_qc["Som"] / maand_qc["Aanwezig"].where(maand_qc["Aanwezig"] > 0)
+    maand_qc["Goede dagen"] = maand_qc["Goede dagen"].astype(int)
+
+    return maand_qc
+
+
+def month_statistics(maand_qc, jaar, maand):
+    """Statistieken over alle echte metingen van één maand uit de maandrollup.
+
+    ``maand_qc`` is de uitvoer van ``monthly_rollup``. Geeft ``None`` als de
+    maand geen metingen heeft, anders een dict met ``totaal``, ``ongeldig``,
+    ``ongeldig_percentage``, ``laagste``, ``laagste_geldig`` en ``hoogste``.
+    """
+    rij = maand_qc[maand_qc["Maand"] == pd.Timestamp(year=jaar, month=maand, day=1)]
+
+    if rij.empty or rij["Aanwezig"].iloc[0] == 0:
+        return None
+
+    rij = rij.iloc[0]
+    totaal = int(rij["Aanwezig"])
+    aantal_ongeldig = int(rij["Ongeldig"])
+
+    return {
+        "totaal": totaal,
+        "ongeldig": aantal_ongeldig,
+        "ongeldig_percentage": aantal_ongeldig / totaal * 100,
+        "laagste": rij["Minimum"],
+        "laagste_geldig": rij["Minimum geldig"] if pd.notna(rij["Minimum geldig"]) else None,
+        "hoogste": rij["Maximum"]
+    }
@@ -0,0 +1,85 @@
+"""Headless QC over de hele ``data/`` map.
+
+Voert per ``data/<station>/<variabele>_QC.xlsx`` dezelfde completeness- en
+bereikcontroles uit als de dashboards en levert één resultaattabel met een rij
+per station/variabele/dag. De bestanden worden parallel verwerkt in een
+process pool.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from utils.loader import (
+    DATA_PATH,
+    list_stations,
+    list_variables,
+    load_station_variable,
+)
+from utils.qc import daily_qc
+from utils.temporal import daily_temporal_counts
+from utils.store import load_daily_qc
+
+
+def find_jobs(data_path=DATA_PATH):
+    """Alle (station, variabele) combinaties met een QC-werkmap."""
+    return [
+        (station, variable)
+        for station in list_stations(data_path)
+        for variable in list_variables(station, data_path)
+    ]
+
+
+def qc_file(station, variable, data_path=DATA_PATH):
+    """Dagresultaten (completeness + aantal per QC-flag) voor één werkmap.
+
+    Via de incrementele store: alleen dagen met nieuwe rijen worden opnieuw
+    berekend. De temporele controles (``utils.temporal``) lopen over de hele
+    reeks, zodat vlakke lijnen over middernacht heen ook gevonden worden.
+    """
+    # load_station_variable werkt eerst de store bij; daarna is dag_qc actueel
+    df = load_station_variable(station, variable, data_path)
+
+    resultaat = load_daily_qc(station, variable)
+    if resultaat is None:
+        resultaat = daily_qc(df, variable)
+
+    temporeel = daily_temporal_counts(df, variable)
+    if temporeel is not None:
+        resultaat = resultaat.merge(temporeel, on="Dag", how="left")
+
+    resultaat.insert(0, "Variabele", variable)
+    resultaat.insert(0, "Station", station)
+    return resultaat
+
+
+def _qc_job(job):
+    station, variable, data_path = job
+    return qc_file(station, variable, data_path)
+
+
+def run_batch(data_path=DATA_PATH, workers=None):
+    """Voer de QC uit voor alle werkmappen onder ``data_path``.
+
+    ``workers`` is het aantal processen (standaard: aantal cores).
+    """
+    jobs = [(station, variable, data_path) for station, variable in find_jobs(data_path)]
+    if not jobs:
+        return pd.DataFrame()
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    if workers == 1:
+        resultaten = [_qc_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            resultaten = list(pool.map(_qc_job, jobs))
+
+    resultaten = pd.concat(resultaten, ignore_index=True)
+
+    # Niet elke variabele kent dezelfde flags → ontbrekende aantallen zijn 0
+    count_cols = [c for c in resultaten.columns if c.startswith("Aantal ")]
+    resultaten[count_cols] = resultaten[count_cols].fillna(0).astype(int)
+
+    return resultaten
@@ -0,0 +1,221 @@
+"""Benchmark van alle QC-stappen op synthetische data.
+
+Elke stap van de dashboards (inlezen, timestamps bouwen, completeness,
+flagging, windroos-binning, figuren) en van de batch-QC wordt apart getimed
+op synthetische werkmappen van ``utils.synthetic``. Het resultaat is een
+dict die als JSON wordt weggeschreven, zodat rapporten van verschillende
+versies met ``compare_reports`` naast elkaar gelegd kunnen worden.
+"""
+
+import os
+import platform
+import statistics
+import subprocess
+import time
+
+import pandas as pd
+import plotly.express as px
+
+from utils.batch import run_batch
+from utils.cache import build_timestamps, normalize_frame, read_excel_columns
+from utils.completeness import daily_completeness, day_slots, slot_matrix
+from utils.downsample import downsample
+from utils.figures import (
+    block_timeline_figure,
+    block_timeline_stack,
+    month_calendar_figure,
+    month_strip_figure,
+    windrose_figure,
+)
+from utils.flags import FLAG_COLORS, MISSING, flag_variable
+from utils.loader import TEMPERATUUR, WINDRICHTING, available_days, select_day
+from utils.qc import daily_qc
+from utils.store import ingest
+from utils.synthetic import write_synthetic_data
+from utils.temporal import temporal_checks
+from utils.windrose import daily_sector_histograms, rose_counts
+
+# Een stap die meer dan 25% trager is dan in het vorige rapport geldt als regressie
+REGRESSIE_FACTOR = 1.25
+
+
+def _time(functie, repeat):
+    """Voer ``functie`` ``repeat`` keer uit; geeft (laatste resultaat, tijden)."""
+    tijden = []
+    resultaat = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resultaat = functie()
+        tijden.append(time.perf_counter() - start)
+    return resultaat, tijden
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _read(file_path):
+    if file_path.endswith(".parquet"):
+        return pd.read_parquet(file_path)
+    return read_excel_columns(file_path)
+
+
+def _temperature_figures(df, qc_df, dag, dagen):
+    # Zelfde figuren als app.py voor één dag en de hele periode
+    block_timeline_figure(day_slots(df, dag))
+    block_timeline_stack(slot_matrix(df, dagen), dagen)
+    month_strip_figure(qc_df)
+    month_calendar_figure(qc_df)
+
+    df_dag = select_day(df, dag)
+    df_dag = df_dag[df_dag["Raw Value"].notna()].assign(
+        QC_Flag=lambda d: flag_variable(TEMPERATUUR, d["Raw Value"])
+    )
+    px.line(df_dag, x="Timestamp", y="Raw Value", markers=True,
+            color="QC_Flag", color_discrete_map=FLAG_COLORS)
+
+
+def _wind_figures(df, qc_df, histogrammen, dag, dagen):
+    # Zelfde figuren als app_winddirection.py
+    block_timeline_figure(day_slots(df, dag))
+    block_timeline_stack(slot_matrix(df, dagen), dagen)
+    month_strip_figure(qc_df)
+    month_calendar_figure(qc_df)
+    windrose_figure(rose_counts(histogrammen, dag, dag), "dag")
+    windrose_figure(rose_counts(histogrammen), "periode")
+
+
+def benchmark_file(file_path, variable, repeat=3):
+    """Tijden per stap voor één werkmap als lijst van dicts."""
+    stappen = []
+
+    def meet(stap, functie, rijen):
+        resultaat, tijden = _time(functie, repeat)
+        stappen.append({
+            "stap": stap,
+            "variabele": variable,
+            "rijen": int(rijen),
+            "mediaan_s": statistics.median(tijden),
+            "min_s": min(tijden),
+        })
+        return resultaat
+
+    ruw = meet("inlezen", lambda: _read(file_path), 0)
+    stappen[-1]["rijen"] = len(ruw)
+
+    met_tijd = meet("timestamps", lambda: build_timestamps(ruw.copy()), len(ruw))
+    df = meet("normaliseren", lambda: normalize_frame(met_tijd), len(met_tijd))
+
+    meet("completeness", lambda: daily_completeness(df), len(df))
+    meet("flagging", lambda: flag_variable(variable, df["Raw Value"]), len(df))
+    meet("temporeel", lambda: temporal_checks(variable, df), len(df))
+    qc_df = meet("dag_qc", lambda: daily_qc(df, variable), len(df))
+    flags = flag_variable(variable, df["Raw Value"])
+    meet("downsample", lambda: downsample(df, behouden=~flags.isin(["OK", MISSING])), len(df))
+
+    dagen = available_days(df)
+    dag = dagen[len(dagen) // 2]
+
+    if variable == WINDRICHTING:
+        histogrammen = meet("windroos_binning", lambda: daily_sector_histograms(df), len(df))
+        meet("windroos_periode", lambda: rose_counts(histogrammen), len(histogrammen))
+        meet("figuren_app_winddirection",
+             lambda: _wind_figures(df, qc_df, histogrammen, dag, dagen), len(df))
+    else:
+        meet("figuren_app", lambda: _temperature_figures(df, qc_df, dag, dagen), len(df))
+
+    return stappen
+
+
+def run_benchmark(workdir, stations=2, jaren=1, interval="10min", gap_fraction=0.05,
+                  out_of_range_fraction=0.001, file_format="xlsx", repeat=3, workers=None):
+    """Genereer synthetische data onder ``workdir`` en meet alle stappen.
+
+    Draait in ``workdir`` zodat de store (``.qc_cache/``) van de echte data
+    niet geraakt wordt.
+    """
+    config = {
+        "stations": stations,
+        "jaren": jaren,
+        "interval": interval,
+        "gap_fraction": gap_fraction,
+        "out_of_range_fraction": out_of_range_fraction,
+        "formaat": file_format,
+        "repeat": repeat,
+        "workers": workers,
+    }
+    variabelen = [TEMPERATUUR, WINDRICHTING]
+    station_namen = [f"Synthetisch_{i:02d}" for i in range(stations)]
+
+    commit = _git_commit()
+    oude_map = os.getcwd()
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+
+    try:
+        start = time.perf_counter()
+        paden = write_synthetic_data(
+            "data", station_namen, variabelen, "2024-01-01", 365 * jaren,
+            file_format=file_format, interval=interval, gap_fraction=gap_fraction,
+            out_of_range_fraction=out_of_range_fraction
+        )
+        genereren = time.perf_counter() - start
+
+        stappen = []
+        for variable, pad in zip(variabelen, paden):
+            stappen += benchmark_file(pad, variable, repeat)
+
+        # Store en batch lezen alleen werkmappen
+        if file_format == "xlsx":
+            pad = paden[0]
+            (nieuw, _), tijden = _time(
+                lambda: ingest(station_namen[0], TEMPERATUUR, pad, rebuild=True), 1
+            )
+            stappen.append({"stap": "ingest_koud", "variabele": TEMPERATUUR, "rijen": nieuw,
+                            "mediaan_s": tijden[0], "min_s": tijden[0]})
+
+            _, tijden = _time(lambda: ingest(station_namen[0], TEMPERATUUR, pad), repeat)
+            stappen.append({"stap": "ingest_ongewijzigd", "variabele": TEMPERATUUR, "rijen": 0,
+                            "mediaan_s": statistics.median(tijden), "min_s": min(tijden)})
+
+            resultaten, tijden = _time(lambda: run_batch("data", workers), 1)
+            stappen.append({"stap": "batch", "variabele": None, "rijen": len(resultaten),
+                            "mediaan_s": tijden[0], "min_s": tijden[0]})
+    finally:
+        os.chdir(oude_map)
+
+    return {
+        "meta": {
+            "commit": commit,
+            "tijdstip": pd.Timestamp.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "genereren_s": genereren,
+        },
+        "config": config,
+        "stappen": stappen,
+    }
+
+
+def compare_reports(oud, nieuw):
+    """Zet twee rapporten naast elkaar: één rij per (stap, variabele).
+
+    ``factor`` is nieuw / oud op de mediaan; ``regressie`` is True boven
+    ``REGRESSIE_FACTOR``.
+    """
+    sleutel = ["stap", "variabele"]
+    a = pd.DataFrame(oud["stappen"])[sleutel + ["mediaan_s"]]
+    b = pd.DataFrame(nieuw["stappen"])[sleutel + ["mediaan_s"]]
+
+    vergelijking = a.merge(b, on=sleutel, how="outer", suffixes=("_oud", "_nieuw"))
+    vergelijking["factor"] = vergelijking["mediaan_s_nieuw"] / vergelijking["mediaan_s_oud"]
+    vergelijking["regressie"] = vergelijking["factor"] > REGRESSIE_FACTOR
+    return vergelijking
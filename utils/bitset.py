@@ -0,0 +1,119 @@
+"""Completeness per station-dag als bitset van de 144 10-minuten slots.
+
+Elke dag is een rij van ``WOORDEN`` uint64's (192 bits, waarvan 144 gebruikt):
+bit ``s`` staat aan als slot ``s`` een meting heeft. Daarmee wordt
+
+- completeness een popcount per rij;
+- "minstens één station" / "alle stations" per slot een bitwise OR / AND
+  over de stationsas;
+- een periode of jaar een slice van rijen.
+
+De bits worden in één keer opgebouwd met ``np.packbits`` uit een boolean
+matrix dagen × slots, zonder lus over dagen of stations.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.timestamps import SLOTS_PER_DAG
+
+WOORDEN = -(-SLOTS_PER_DAG // 64)
+
+_S_PER_DAG = 86400
+_S_PER_SLOT = _S_PER_DAG // SLOTS_PER_DAG
+
+# Aantal bits per byte, voor numpy-versies zonder np.bitwise_count
+_BITS_PER_BYTE = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+def day_bitsets(tijd, waarden):
+    """Bitsets per dag voor een reeks met ``tijd`` in seconden sinds 1970 (gesorteerd).
+
+    Geeft ``(eerste_dag, bits)``: ``eerste_dag`` is het dagnummer (dagen sinds
+    1970-01-01) van rij 0 en ``bits`` een uint64-array dagen × ``WOORDEN``
+    die elke dag van de eerste t/m de laatste meting bevat.
+    """
+    tijd = np.asarray(tijd, dtype=np.int64)
+    gemeten = ~np.isnan(np.asarray(waarden, dtype=float)) & (tijd % _S_PER_SLOT == 0)
+    tijd = tijd[gemeten]
+
+    if len(tijd) == 0:
+        return 0, np.zeros((0, WOORDEN), dtype=np.uint64)
+
+    dagnummer = tijd // _S_PER_DAG
+    slot = tijd % _S_PER_DAG // _S_PER_SLOT
+    eerste_dag = int(dagnummer[0])
+
+    aanwezig = np.zeros((int(dagnummer[-1]) - eerste_dag + 1, WOORDEN * 64), dtype=bool)
+    aanwezig[dagnummer - eerste_dag, slot] = True
+
+    bits = np.packbits(aanwezig, axis=1, bitorder="little")
+    return eerste_dag, bits.view(np.uint64)
+
+
+def day_range(eerste_dag, bits, start, eind):
+    """Bitsets van de dagen ``start`` t/m ``eind``; dagen buiten de reeks zijn 0."""
+    begin = int(pd.Timestamp(start).normalize().value // (_S_PER_DAG * 10**9))
+    einde = int(pd.Timestamp(eind).normalize().value // (_S_PER_DAG * 10**9)) + 1
+
+    uit = np.zeros((max(einde - begin, 0), WOORDEN), dtype=np.uint64)
+    van, tot = max(begin, eerste_dag), min(einde, eerste_dag + len(bits))
+    if van < tot:
+        uit[van - begin:tot - begin] = bits[van - eerste_dag:tot - eerste_dag]
+    return uit
+
+
+def popcount(bits):
+    """Aantal gezette bits per rij (laatste as) van een uint64-array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+    bytes_ = np.ascontiguousarray(bits).view(np.uint8)
+    return _BITS_PER_BYTE[bytes_].sum(axis=-1, dtype=np.int64)
+
+
+def completeness(bits):
+    """Percentage aanwezige slots per dag (afgerond op 0,1)."""
+    return (popcount(bits) / SLOTS_PER_DAG * 100).round(1)
+
+
+def union(bits, axis=0):
+    """Slots met een meting bij minstens één station (OR over ``axis``)."""
+    return np.bitwise_or.reduce(bits, axis=axis)
+
+
+def intersection(bits, axis=0):
+    """Slots met een meting bij alle stations (AND over ``axis``)."""
+    return np.bitwise_and.reduce(bits, axis=axis)
+
+
+def network_bitsets(netwerk, stations, variable, start, eind, manifest=None):
+    """Bitsets stations × dagen × ``WOORDEN`` voor ``start`` t/m ``eind``.
+
+    ``netwerk`` is een ``utils.compact.NetwerkGeheugen``; de bitsets per reeks
+    worden daar één keer berekend en daarna alleen nog gesneden.
+    """
+    if not stations:
+        dagen = len(pd.date_range(start, eind))
+        return np.zeros((0, dagen, WOORDEN), dtype=np.uint64)
+
+    return np.stack([
+        day_range(*netwerk.series(station, variable, manifest).day_bitsets(), start, eind)
+        for station in stations
+    ])
+
+
+def network_calendar(netwerk, stations, variable, start, eind, manifest=None):
+    """Completeness (%) per station en dag als DataFrame (stations × dagen).
+
+    Twee extra rijen vatten het netwerk samen: "Netwerk (≥1 station)" telt
+    slots waarin minstens één station mat, "Netwerk (alle stations)" slots
+    waarin alle stations maten.
+    """
+    dagen = pd.date_range(start, eind).date
+    bits = network_bitsets(netwerk, stations, variable, start, eind, manifest)
+
+    kalender = pd.DataFrame(completeness(bits), index=list(stations), columns=dagen)
+    if len(stations) > 1:
+        kalender.loc["Netwerk (≥1 station)"] = completeness(union(bits))
+        kalender.loc["Netwerk (alle stations)"] = completeness(intersection(bits))
+    return kalender
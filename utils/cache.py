@@ -0,0 +1,130 @@
+"""Inlezen van station-Excelbestanden in het genormaliseerde datamodel.
+
+Elke ``data/<station>/<variabele>_QC.xlsx`` wordt met openpyxl in read-only
+modus ingelezen, rij voor rij en in blokken: alleen de kolommen ``Dag``,
+``Tijd`` en ``Raw Value`` worden uit de rijen gehaald, zodat het objectmodel
+van de hele werkmap nooit in het geheugen staat. Het resultaat bevat een
+geparste ``Timestamp``, een numerieke ``Raw Value`` en de dag als ``Datum``;
+``Dag`` en ``Tijd`` vallen weg zodra de timestamps gebouwd zijn.
+
+De enige cache op schijf is de store (``utils.store``) onder ``CACHE_DIR``;
+die roept ``parse_excel`` aan voor nieuwe of gewijzigde werkmappen.
+"""
+
+from operator import itemgetter
+
+import openpyxl
+import pandas as pd
+
+from utils.timestamps import combine_timestamps, report_invalid
+
+CACHE_DIR = ".qc_cache"
+
+# Ophogen wanneer het inlezen verandert → store en manifest lezen de werkmappen opnieuw in
+CACHE_VERSIE = 5
+
+# De enige kolommen die uit de werkmappen gelezen worden
+KOLOMMEN = ["Dag", "Tijd", "Raw Value"]
+
+# Rijen per blok bij het streamend inlezen
+BLOK_RIJEN = 50_000
+
+def normalize_frame(df):
+    """Breng een ingelezen werkmap naar het genormaliseerde datamodel.
+
+    Na normalisatie is ``Timestamp`` gesorteerd en uniek (rijen zonder
+    geldig tijdstip vallen weg), is ``Raw Value`` numeriek en bevat ``Datum``
+    de dag als datetime64, zodat dagfilters geen ``.dt.date`` nodig hebben.
+    """
+    df = df[df["Timestamp"].notna()]
+
+    # Bij dubbele tijdstippen de rij mét meting bewaren
+    df = df.sort_values(["Timestamp", "Raw Value"], na_position="first", kind="stable")
+    df = df.drop_duplicates("Timestamp", keep="last").reset_index(drop=True)
+
+    df["Datum"] = df["Timestamp"].dt.normalize()
+    return df
+
+
+def empty_frame():
+    """Genormaliseerd frame zonder rijen (zelfde kolommen en dtypes)."""
+    return pd.DataFrame({
+        "Timestamp": pd.Series(dtype="datetime64[ns]"),
+        "Raw Value": pd.Series(dtype="float64"),
+        "Datum": pd.Series(dtype="datetime64[ns]"),
+    })
+
+
+def build_timestamps(df, bron=""):
+    """Bouw ``Timestamp`` uit ``Dag`` + ``Tijd`` en maak ``Raw Value`` numeriek.
+
+    Zie ``utils.timestamps.combine_timestamps``; rijen zonder geldig
+    tijdstip worden gemeld (met ``bron`` in de melding) en krijgen NaT.
+    """
+    df["Timestamp"], ongeldig = combine_timestamps(df["Dag"], df["Tijd"])
+    report_invalid(ongeldig, df["Dag"], df["Tijd"], bron)
+    df["Raw Value"] = pd.to_numeric(df["Raw Value"], errors="coerce")
+    return df
+
+
+def iter_excel(file_path, kolommen=KOLOMMEN, blok_rijen=BLOK_RIJEN):
+    """Lees de ``kolommen`` van het eerste werkblad in blokken van ``blok_rijen`` rijen.
+
+    openpyxl leest in read-only modus de rijen als tuples zonder cellobjecten
+    op te bouwen; per rij worden alleen de gevraagde kolommen bewaard. Elk blok
+    is een DataFrame met precies ``kolommen``, ``Raw Value`` als float64.
+    """
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rijen = wb.worksheets[0].iter_rows(values_only=True)
+
+        koppen = [str(k).strip() if k is not None else None for k in next(rijen, ())]
+        ontbrekend = [k for k in kolommen if k not in koppen]
+        if ontbrekend:
+            raise ValueError(f"{file_path}: kolommen ontbreken: {', '.join(ontbrekend)}")
+        posities = [koppen.index(k) for k in kolommen]
+        kies = itemgetter(*posities)
+        breedte = max(posities) + 1
+
+        blok = []
+        for rij in rijen:
+            if len(rij) < breedte:
+                rij = rij + (None,) * (breedte - len(rij))
+            blok.append(kies(rij))
+            if len(blok) == blok_rijen:
+                yield _block_frame(blok, kolommen)
+                blok = []
+        if blok:
+            yield _block_frame(blok, kolommen)
+    finally:
+        wb.close()
+
+
+def _block_frame(blok, kolommen):
+    df = pd.DataFrame.from_records(blok, columns=kolommen)
+    if "Raw Value" in df.columns:
+        df["Raw Value"] = pd.to_numeric(df["Raw Value"], errors="coerce").astype("float64")
+    return df
+
+
+def read_excel_columns(file_path, kolommen=KOLOMMEN):
+    """Alle blokken van ``iter_excel`` als één DataFrame."""
+    blokken = list(iter_excel(file_path, kolommen))
+    if not blokken:
+        return pd.DataFrame(columns=kolommen)
+    return pd.concat(blokken, ignore_index=True)
+
+
+def parse_excel(file_path):
+    """Lees een QC-werkmap streamend in en bouw Timestamp + numerieke Raw Value.
+
+    Timestamps worden per blok gebouwd, zodat de tijdelijke tekstkolommen
+    daarvan nooit voor de hele werkmap tegelijk bestaan.
+    """
+    blokken = [
+        build_timestamps(blok, file_path).drop(columns=["Dag", "Tijd"])
+        for blok in iter_excel(file_path)
+    ]
+    if not blokken:
+        blokken = [build_timestamps(pd.DataFrame(columns=KOLOMMEN)).drop(columns=["Dag", "Tijd"])]
+    return normalize_frame(pd.concat(blokken, ignore_index=True))
@@ -0,0 +1,224 @@
+"""Compacte reeksen om het hele netwerk in het geheugen van één proces te houden.
+
+Het genormaliseerde frame kost per meting ruim 25 bytes (datetime64
+``Timestamp`` en ``Datum``, float64 ``Raw Value``) plus een objectkolom
+``QC_Flag`` van tientallen bytes per rij. ``CompactReeks`` bewaart per
+meting alleen:
+
+- ``tijd`` – uint32 seconden sinds 1970-01-01 (4 bytes, t/m het jaar 2106);
+- ``waarden`` – float32 (4 bytes);
+- ``flags`` – uint8 index in ``flag_names(variable)`` (1 byte).
+
+Dat is 9 bytes per meting. ``Datum`` en de flagtekst (``QC_Flag``) worden pas
+afgeleid bij ``to_frame`` voor de gevraagde periode.
+
+``NetwerkGeheugen`` houdt de reeksen van alle stations en variabelen vast,
+laadt ze bij eerste gebruik, ververst ze als de manifest een gewijzigde
+werkmap meldt en rapporteert het geheugengebruik (``memory_usage``).
+``estimate_network_bytes`` schat het geheugen van het hele netwerk al uit de
+manifest, zonder iets te laden.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.bitset import day_bitsets
+from utils.flags import flag_indices, flag_names
+from utils.loader import DATA_PATH, qc_file_path
+from utils.store import ingest, load_store
+
+TIJD_DTYPE = np.uint32
+WAARDE_DTYPE = np.float32
+FLAG_DTYPE = np.uint8
+
+BYTES_PER_METING = (
+    np.dtype(TIJD_DTYPE).itemsize + np.dtype(WAARDE_DTYPE).itemsize + np.dtype(FLAG_DTYPE).itemsize
+)
+
+# float32 heeft ~7 significante cijfers: genoeg voor 4 decimalen bij waarden tot ~1000 (hPa)
+TERUG_DECIMALEN = 4
+
+_NS_PER_S = 1_000_000_000
+
+
+class CompactReeks:
+    """Eén station/variabele als drie numpy arrays, gesorteerd op tijd."""
+
+    __slots__ = ("station", "variable", "tijd", "waarden", "flags", "_dagbits")
+
+    def __init__(self, station, variable, tijd, waarden, flags=None):
+        self.station = station
+        self.variable = variable
+        self.tijd = tijd
+        self.waarden = waarden
+        self.flags = flags
+        self._dagbits = None
+
+    @classmethod
+    def from_frame(cls, station, variable, df):
+        """Van een genormaliseerd frame (``Timestamp`` gesorteerd en uniek)."""
+        ns = df["Timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        waarden = df["Raw Value"].to_numpy(dtype=WAARDE_DTYPE)
+        return cls(
+            station,
+            variable,
+            (ns // _NS_PER_S).astype(TIJD_DTYPE),
+            waarden,
+            flag_indices(variable, waarden),
+        )
+
+    def __len__(self):
+        return len(self.tijd)
+
+    @property
+    def nbytes(self):
+        """Bytes van de arrays (zonder de vaste overhead van het object)."""
+        arrays = [self.tijd, self.waarden, self.flags]
+        if self._dagbits is not None:
+            arrays.append(self._dagbits[1])
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def day_bitsets(self):
+        """``(eerste_dag, bits)`` van ``utils.bitset.day_bitsets``, één keer berekend.
+
+        24 bytes per dag, dus verwaarloosbaar naast de reeks zelf.
+        """
+        if self._dagbits is None:
+            self._dagbits = day_bitsets(self.tijd, self.waarden)
+        return self._dagbits
+
+    def _range(self, start, eind):
+        """Slice van de dagen ``start`` t/m ``eind`` (binair zoeken op ``tijd``)."""
+        begin, einde = 0, len(self.tijd)
+        if start is not None:
+            grens = pd.Timestamp(start).normalize().value // _NS_PER_S
+            begin = int(np.searchsorted(self.tijd, grens, side="left"))
+        if eind is not None:
+            grens = (pd.Timestamp(eind).normalize() + pd.Timedelta(days=1)).value // _NS_PER_S
+            einde = int(np.searchsorted(self.tijd, grens, side="left"))
+        return slice(begin, einde)
+
+    def timestamps(self, start=None, eind=None):
+        tijd = self.tijd[self._range(start, eind)].astype(np.int64)
+        return pd.DatetimeIndex(tijd * _NS_PER_S, name="Timestamp")
+
+    def to_frame(self, start=None, eind=None):
+        """Genormaliseerd frame van de periode: ``Timestamp``, ``Raw Value``, ``Datum``
+        en (als er regels zijn) ``QC_Flag``.
+
+        Zelfde kolommen en dtypes als ``utils.store.load_store``, zodat de
+        dashboards er ongewijzigd mee werken. ``QC_Flag`` komt uit de
+        opgeslagen flagcodes; de waarden worden na float32 → float64 terug
+        afgerond op ``TERUG_DECIMALEN``, zodat 24,8 niet als 24,799999 verschijnt.
+        """
+        bereik = self._range(start, eind)
+        ts = pd.Series(self.timestamps(start, eind))
+        frame = pd.DataFrame({
+            "Timestamp": ts,
+            "Raw Value": np.round(self.waarden[bereik].astype(np.float64), TERUG_DECIMALEN),
+            "Datum": ts.dt.normalize(),
+        })
+        if self.flags is not None:
+            namen = np.asarray(flag_names(self.variable), dtype=object)
+            frame["QC_Flag"] = namen[self.flags[bereik]]
+        return frame
+
+
+class NetwerkGeheugen:
+    """Alle ``CompactReeks``-en van het netwerk, per (station, variabele).
+
+    Veilig voor gelijktijdige Streamlit-sessies: laden gebeurt onder een lock.
+    """
+
+    def __init__(self, data_path=DATA_PATH):
+        self.data_path = data_path
+        self._reeksen = {}
+        self._bronnen = {}
+        self._lock = threading.Lock()
+
+    def _load(self, station, variable):
+        ingest(station, variable, qc_file_path(station, variable, self.data_path))
+        df = load_store(station, variable, memo=False)
+        if df is None:
+            df = pd.DataFrame({"Timestamp": pd.Series(dtype="datetime64[ns]"),
+                               "Raw Value": pd.Series(dtype=float)})
+        return CompactReeks.from_frame(station, variable, df)
+
+    def update(self, manifest):
+        """Vergeet reeksen waarvan de werkmap volgens ``manifest`` is gewijzigd."""
+        with self._lock:
+            for (station, variable), bron in list(self._bronnen.items()):
+                entry = manifest.get(station, {}).get(variable)
+                if entry is None or entry["bron"] != bron:
+                    self._reeksen.pop((station, variable), None)
+                    self._bronnen.pop((station, variable), None)
+
+    def series(self, station, variable, manifest=None):
+        """De ``CompactReeks`` van ``station``/``variable`` (bij eerste gebruik geladen)."""
+        if manifest is not None:
+            self.update(manifest)
+
+        sleutel = (station, variable)
+        reeks = self._reeksen.get(sleutel)
+        if reeks is not None:
+            return reeks
+
+        with self._lock:
+            reeks = self._reeksen.get(sleutel)
+            if reeks is None:
+                reeks = self._load(station, variable)
+                self._reeksen[sleutel] = reeks
+                if manifest is not None:
+                    self._bronnen[sleutel] = manifest[station][variable]["bron"]
+            return reeks
+
+    def frame(self, station, variable, start=None, eind=None, manifest=None):
+        """Zoals ``utils.loader.load_station_period``, maar uit het geheugen."""
+        return self.series(station, variable, manifest).to_frame(start, eind)
+
+    def load_all(self, manifest):
+        """Laad alle station/variabele-combinaties met metingen uit ``manifest``."""
+        for station, variabelen in manifest.items():
+            for variable, entry in variabelen.items():
+                if entry.get("metingen", 0) > 0:
+                    self.series(station, variable, manifest)
+
+    @property
+    def rows(self):
+        return sum(len(reeks) for reeks in list(self._reeksen.values()))
+
+    @property
+    def nbytes(self):
+        return sum(reeks.nbytes for reeks in list(self._reeksen.values()))
+
+    def memory_usage(self):
+        """Geheugen per station/variabele: ``Rijen``, ``Bytes`` en ``Bytes per rij``."""
+        rijen = [
+            {"Station": station, "Variabele": variable,
+             "Rijen": len(reeks), "Bytes": reeks.nbytes}
+            for (station, variable), reeks in sorted(list(self._reeksen.items()))
+        ]
+        gebruik = pd.DataFrame(rijen, columns=["Station", "Variabele", "Rijen", "Bytes"])
+        gebruik["Bytes per rij"] = (
+            gebruik["Bytes"] / gebruik["Rijen"].where(gebruik["Rijen"] > 0)
+        ).round(1)
+        return gebruik
+
+
+def estimate_network_bytes(manifest):
+    """Geschat geheugen (bytes) van het hele netwerk als ``CompactReeks``-en.
+
+    Gebaseerd op het aantal rijen per werkmap in de manifest; geschikt om
+    een server te dimensioneren voordat er iets geladen is.
+    """
+    return sum(
+        entry.get("rijen", 0) * BYTES_PER_METING
+        for variabelen in manifest.values()
+        for entry in variabelen.values()
+    )
+
+
+# Eén netwerk per proces, gedeeld door alle sessies en reruns
+NETWERK = NetwerkGeheugen()
@@ -0,0 +1,125 @@
+"""Dag- en maandconclusies als tekst (Markdown), gedeeld door dashboards en rapporten.
+
+De regels zijn dezelfde als voorheen in ``app.py`` en
+``app_winddirection.py``; voor temperatuur gelden de Suriname-specifieke
+grenzen, voor windrichting het bereik 0–360°, en voor de overige variabelen
+alleen het aandeel ongeldige metingen.
+"""
+
+from utils.loader import TEMPERATUUR, WINDRICHTING
+
+
+def day_conclusion(variable, laagste, hoogste, qc_counts, eenheid="dag"):
+    """Conclusie over de metingen van een dag of periode.
+
+    ``qc_counts`` is ``value_counts()`` van de QC-flags; ``eenheid`` is
+    "dag" of "periode".
+    """
+    if variable == TEMPERATUUR:
+        if hoogste > 40:
+            return f"❌ De {eenheid} bevat zeer extreme hoge waarden (boven 40°C). Controle aanbevolen."
+        if hoogste > 37:
+            return f"⚠️ De {eenheid} bevat extreme hoge waarden (boven 37°C)."
+        if laagste < 20:
+            return f"ℹ️ De {eenheid} bevat lage waarden die niet typisch zijn voor Suriname."
+        return "✔️ De gemeten waarden vallen binnen het normale bereik."
+
+    if variable == WINDRICHTING:
+        if qc_counts.get("OUT_OF_RANGE", 0) > 0:
+            return f"❌ De {eenheid} bevat ongeldige windrichtingwaarden (buiten 0–360°)."
+        return "✔️ Alle waarden vallen binnen het geldige bereik."
+
+    if qc_counts.get("OUT_OF_RANGE", 0) + qc_counts.get("LOW_IMPOSSIBLE", 0) > 0:
+        return f"❌ De {eenheid} bevat ongeldige waarden."
+    return "✔️ Alle waarden vallen binnen het geldige bereik."
+
+
+def _temperature_problems(maand_stats):
+    negatieve_count = maand_stats["ongeldig"]
+
+    laagste = maand_stats["laagste_geldig"]
+    laagste = round(laagste, 1) if laagste is not None else None
+    hoogste = round(maand_stats["hoogste"], 1)
+
+    problemen = []
+
+    # Minder dan 50% negatief → filteren en verder gebruiken
+    if negatieve_count > 0:
+        problemen.append(
+            f"Er zijn {negatieve_count} negatieve waarden gevonden. "
+            "Filter deze uit voordat je de data verder gebruikt."
+        )
+
+    if laagste is not None and laagste > 30:
+        problemen.append(
+            "De laagste geldige waarde ligt boven 30°C, wat onrealistisch is voor Suriname."
+        )
+
+    if laagste is not None and laagste < 5:
+        problemen.append(
+            "De laagste geldige waarde ligt onder 5°C, wat fysiek onmogelijk is."
+        )
+    elif laagste is not None and laagste < 10:
+        problemen.append(
+            "De laagste geldige waarde ligt onder 10°C, wat zeer onrealistisch is."
+        )
+    elif laagste is not None and laagste < 20:
+        problemen.append(
+            "De laagste geldige waarde ligt onder 20°C, wat niet typisch is voor Suriname."
+        )
+
+    if hoogste > 45:
+        problemen.append(
+            "De maand bevat waarden boven 45°C, wat fysiek onmogelijk is."
+        )
+    elif hoogste > 40:
+        problemen.append(
+            "De maand bevat extreem hoge waarden (>40°C)."
+        )
+    elif hoogste > 37:
+        problemen.append(
+            "De maand bevat zeer hoge waarden (>37°C)."
+        )
+
+    return problemen
+
+
+def month_conclusion(variable, maand_stats):
+    """Maandconclusie (geschiktheid van het station) uit ``month_statistics``."""
+    if variable == TEMPERATUUR:
+        # A. Meer dan 50% negatieve waarden → data onbruikbaar
+        if maand_stats["ongeldig_percentage"] >= 50:
+            return (
+                "❌ Meer dan 50% van de maandwaarden is negatief. "
+                "De data is NIET geschikt voor analyse."
+            )
+
+        problemen = _temperature_problems(maand_stats)
+        if problemen:
+            return (
+                "⚠️ De data bevat aandachtspunten. Gebruik de data alleen na filtering en controle.\n\n"
+                + "\n".join(f"- {p}" for p in problemen)
+            )
+        return (
+            "✔ Het station toont realistische waarden voor deze maand. "
+            "Het station is geschikt voor verdere analyse."
+        )
+
+    if maand_stats["ongeldig_percentage"] >= 50:
+        return (
+            "❌ Meer dan 50% van de maandwaarden is ongeldig. "
+            "De data is NIET geschikt voor analyse."
+        )
+
+    if maand_stats["ongeldig"] > 0:
+        return (
+            "⚠️ De data bevat aandachtspunten. Gebruik de data alleen na filtering.\n\n"
+            f"- Er zijn {maand_stats['ongeldig']} ongeldige waarden gevonden. "
+            "Filter deze uit voordat je de data verder gebruikt."
+        )
+
+    soort = "windrichtingwaarden" if variable == WINDRICHTING else "waarden"
+    return (
+        f"✔ Het station toont geldige {soort} voor deze maand. "
+        "Het station is geschikt voor verdere analyse."
+    )
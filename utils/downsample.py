@@ -0,0 +1,48 @@
+"""Downsampling van lange tijdreeksen vóór het bouwen van een figuur.
+
+Een reeks wordt in gelijke tijdsintervallen (buckets) verdeeld; per bucket
+blijven alleen de rij met de laagste en de rij met de hoogste waarde over
+(min/max per bucket). Zo blijven pieken en dalen zichtbaar terwijl het aantal
+punten naar de browser begrensd is. Rijen in ``behouden`` (bijv. metingen met
+een QC-flag anders dan OK) worden altijd meegenomen.
+"""
+
+import numpy as np
+
+# Ongeveer het aantal horizontale pixels van een grafiek × 2 (min + max)
+PUNTEN_BUDGET = 2000
+
+
+def downsample(df, budget=PUNTEN_BUDGET, x="Timestamp", y="Raw Value", behouden=None):
+    """Hooguit ~``budget`` rijen van ``df`` (plus ``behouden``), gesorteerd op ``x``.
+
+    ``df`` moet op ``x`` gesorteerd zijn en een unieke index hebben.
+    ``behouden`` is een boolean mask (zelfde index als ``df``) van rijen die
+    altijd blijven staan. Rijen zonder waarde in ``y`` tellen niet mee voor
+    min/max. Een reeks die al binnen het budget past wordt ongewijzigd
+    teruggegeven.
+    """
+    if len(df) <= budget:
+        return df
+
+    buckets = max(budget // 2, 1)
+    t = df[x].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    bereik = t[-1] - t[0] + 1
+    bucket = ((t - t[0]) / bereik * buckets).astype(np.int64)
+
+    waarden = df[y]
+    geldig = waarden.notna().to_numpy()
+    per_bucket = waarden[geldig].groupby(bucket[geldig])
+
+    gekozen = np.zeros(len(df), dtype=bool)
+    gekozen[[0, -1]] = True
+
+    if geldig.any():
+        positie = df.index.get_indexer
+        gekozen[positie(per_bucket.idxmin().to_numpy())] = True
+        gekozen[positie(per_bucket.idxmax().to_numpy())] = True
+
+    if behouden is not None:
+        gekozen |= behouden.to_numpy(dtype=bool)
+
+    return df[gekozen]
@@ -0,0 +1,295 @@
+"""Plotly-figuren voor de QC dashboards.
+
+Alle rasters worden als één heatmap-trace getekend in plaats van één
+``add_shape`` per cel, zodat de figuur-JSON klein blijft en de browser snel
+rendert, ook bij meerdere dagen of stations.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.completeness import SLOTS_PER_DAG
+
+# Discrete kleurschaal: 0 = ontbreekt (rood), 1 = ontvangen (groen)
+AANWEZIG_KLEUREN = [[0, "red"], [0.5, "red"], [0.5, "green"], [1, "green"]]
+
+BLOK_LABELS = ["00", "10", "20", "30", "40", "50"]
+
+
+def _hover_data(timestamps, waarden):
+    """customdata-array met (tijdstip, waarde, status) per cel."""
+    tijd = pd.DatetimeIndex(timestamps).strftime("%Y-%m-%d %H:%M").to_numpy(dtype=object)
+    waarde = np.where(np.isnan(waarden), "–", np.round(waarden, 1).astype(str)).astype(object)
+    status = np.where(np.isnan(waarden), "Ontbrekend", "Ontvangen").astype(object)
+    return np.stack([tijd, waarde, status], axis=-1)
+
+
+def _presence_heatmap(waarden, customdata, xgap, ygap):
+    return go.Heatmap(
+        z=(~np.isnan(waarden)).astype(int),
+        customdata=customdata,
+        hovertemplate=(
+            "%{customdata[0]}<br>"
+            "Waarde: %{customdata[1]}<br>"
+            "Status: %{customdata[2]}<extra></extra>"
+        ),
+        colorscale=AANWEZIG_KLEUREN,
+        zmin=0,
+        zmax=1,
+        xgap=xgap,
+        ygap=ygap,
+        showscale=False
+    )
+
+
+def block_timeline_figure(df_expected, cell_size=30, gap=5):
+    """24×6 raster (uur × 10-minuten blok) voor één dag als één heatmap.
+
+    ``df_expected`` is de uitvoer van ``utils.completeness.day_slots``.
+    """
+    rows = 6
+    cols = 24
+
+    waarden = df_expected["Raw Value"].to_numpy(dtype=float)
+    timestamps = df_expected["Timestamp"]
+
+    # Slots lopen per uur door de blokken → (uur, blok) en dan transponeren
+    # naar rijen = blok, kolommen = uur
+    waarden_raster = waarden.reshape(cols, rows).T
+    hover = _hover_data(timestamps, waarden).reshape(cols, rows, 3).transpose(1, 0, 2)
+
+    fig = go.Figure(_presence_heatmap(waarden_raster, hover, gap, gap))
+
+    fig.update_xaxes(
+        title_text="<b>Uur van de dag</b>",
+        title_font=dict(size=16),
+        tickfont=dict(size=14, color="black"),
+        tickmode="array",
+        tickvals=list(range(cols)),
+        ticktext=[f"<b>{h:02d}:00</b>" for h in range(cols)],
+        showgrid=False,
+        zeroline=False
+    )
+
+    # Blok 00 bovenaan, zoals in het oorspronkelijke raster
+    fig.update_yaxes(
+        title_text="<b>10-minuten blok</b>",
+        title_font=dict(size=16),
+        tickfont=dict(size=14, color="black"),
+        tickmode="array",
+        tickvals=list(range(rows)),
+        ticktext=[f"<b>{t}</b>" for t in BLOK_LABELS],
+        autorange="reversed",
+        showgrid=False,
+        zeroline=False
+    )
+
+    fig.update_layout(
+        width=cols * (cell_size + gap) + 200,
+        height=rows * (cell_size + gap) + 200,
+        margin=dict(l=80, r=40, t=60, b=80),
+        plot_bgcolor="white"
+    )
+
+    return fig
+
+
+def block_timeline_stack(matrix, dagen, row_height=18, gap=1):
+    """Meerdere dagen onder elkaar: dagen × 144 slots als één heatmap.
+
+    ``matrix`` is de uitvoer van ``utils.completeness.slot_matrix`` voor
+    dezelfde ``dagen``.
+    """
+    dagen = list(dagen)
+    dag_starts = np.array(dagen, dtype="datetime64[D]").astype("datetime64[m]")
+    slot_offsets = np.arange(SLOTS_PER_DAG) * np.timedelta64(10, "m")
+    timestamps = (dag_starts[:, None] + slot_offsets[None, :]).ravel()
+
+    hover = _hover_data(timestamps, matrix.ravel()).reshape(len(dagen), SLOTS_PER_DAG, 3)
+
+    fig = go.Figure(_presence_heatmap(matrix, hover, gap, gap))
+    fig.data[0].update(y=[str(d) for d in dagen])
+
+    fig.update_xaxes(
+        title_text="<b>Uur van de dag</b>",
+        tickmode="array",
+        tickvals=[h * 6 for h in range(24)],
+        ticktext=[f"{h:02d}:00" for h in range(24)],
+        showgrid=False,
+        zeroline=False
+    )
+    fig.update_yaxes(type="category", autorange="reversed", showgrid=False, zeroline=False)
+
+    fig.update_layout(
+        height=max(200, len(dagen) * row_height + 120),
+        margin=dict(l=100, r=40, t=40, b=60),
+        plot_bgcolor="white"
+    )
+
+    return fig
+
+
+def _status_kleuren(qc_df):
+    return np.where(qc_df["Status"].to_numpy() == "goed", "green", "red")
+
+
+def month_strip_figure(qc_df, cell_size=40, gap=10):
+    """Dagstrook (groen/rood per dag) als één Bar-trace met dagnummers als tekst."""
+    n = len(qc_df)
+
+    fig = go.Figure(go.Bar(
+        x=np.arange(n),
+        y=np.full(n, cell_size),
+        marker=dict(color=_status_kleuren(qc_df), line=dict(width=0)),
+        text=[str(d.day) for d in qc_df["Dag"]],
+        textposition="inside",
+        insidetextanchor="middle",
+        textfont=dict(color="white", size=14),
+        customdata=np.stack([qc_df["Dag"].astype(str), qc_df["Percentage"]], axis=-1),
+        hovertemplate="%{customdata[0]}<br>Compleet: %{customdata[1]}%<extra></extra>"
+    ))
+
+    fig.update_xaxes(visible=False, range=[-0.5, n - 0.5])
+    fig.update_yaxes(visible=False, range=[0, cell_size])
+    fig.update_layout(
+        height=150,
+        bargap=gap / (cell_size + gap),
+        margin=dict(l=20, r=20, t=20, b=20),
+        plot_bgcolor="white"
+    )
+
+    return fig
+
+
+def month_calendar_figure(qc_df, max_text_weeks=14):
+    """Kalenderweergave (weekdagen × weken) van de dagstatus als één heatmap.
+
+    Geschikt voor meerdere maanden of jaren: elke dag is één cel, dagen zonder
+    data blijven leeg. Dagnummers worden alleen getoond zolang de cellen groot
+    genoeg zijn (``max_text_weeks``).
+    """
+    dagen = pd.DatetimeIndex(pd.to_datetime(qc_df["Dag"].astype(str)))
+    eerste_maandag = dagen.min() - pd.Timedelta(days=dagen.min().dayofweek)
+    week = ((dagen - eerste_maandag).days // 7).to_numpy()
+    weekdag = dagen.dayofweek.to_numpy()
+    n_weken = int(week.max()) + 1
+
+    z = np.full((7, n_weken), np.nan)
+    z[weekdag, week] = (qc_df["Status"].to_numpy() == "goed").astype(float)
+
+    hover = np.full((7, n_weken, 2), "", dtype=object)
+    hover[weekdag, week, 0] = dagen.strftime("%Y-%m-%d")
+    hover[weekdag, week, 1] = qc_df["Percentage"].astype(str).to_numpy()
+
+    tekst = np.full((7, n_weken), "", dtype=object)
+    if n_weken <= max_text_weeks:
+        tekst[weekdag, week] = dagen.day.astype(str)
+
+    week_starts = eerste_maandag + pd.to_timedelta(np.arange(n_weken) * 7, unit="D")
+
+    fig = go.Figure(go.Heatmap(
+        z=z,
+        x=week_starts,
+        y=["Ma", "Di", "Wo", "Do", "Vr", "Za", "Zo"],
+        text=tekst,
+        texttemplate="%{text}",
+        textfont=dict(color="white", size=12),
+        customdata=hover,
+        hovertemplate="%{customdata[0]}<br>Compleet: %{customdata[1]}%<extra></extra>",
+        colorscale=AANWEZIG_KLEUREN,
+        zmin=0,
+        zmax=1,
+        xgap=2,
+        ygap=2,
+        showscale=False
+    ))
+
+    fig.update_xaxes(showgrid=False, zeroline=False, tickformat="%b %Y")
+    fig.update_yaxes(autorange="reversed", showgrid=False, zeroline=False)
+    fig.update_layout(
+        height=260,
+        margin=dict(l=40, r=20, t=20, b=40),
+        plot_bgcolor="white"
+    )
+
+    return fig
+
+
+def network_calendar_figure(kalender, row_height=22):
+    """Stations × dagen met het completenesspercentage als één heatmap.
+
+    ``kalender`` is de uitvoer van ``utils.bitset.network_calendar``. Ook voor
+    meerdere jaren en tientallen stations blijft dit één trace.
+    """
+    dagen = pd.DatetimeIndex(pd.to_datetime([str(d) for d in kalender.columns]))
+
+    fig = go.Figure(go.Heatmap(
+        z=kalender.to_numpy(),
+        x=dagen,
+        y=list(kalender.index),
+        hovertemplate="%{y}<br>%{x|%Y-%m-%d}<br>Compleet: %{z}%<extra></extra>",
+        colorscale=[[0, "red"], [0.75, "orange"], [0.75, "lightgreen"], [1, "green"]],
+        zmin=0,
+        zmax=100,
+        xgap=0,
+        ygap=1,
+        colorbar=dict(title="%")
+    ))
+
+    fig.update_xaxes(showgrid=False, zeroline=False, tickformat="%b %Y")
+    fig.update_yaxes(type="category", autorange="reversed", showgrid=False, zeroline=False)
+    fig.update_layout(
+        height=max(200, len(kalender) * row_height + 100),
+        margin=dict(l=160, r=20, t=20, b=40),
+        plot_bgcolor="white"
+    )
+
+    return fig
+
+
+def windrose_figure(counts, title):
+    """Windroos (Barpolar) uit het aantal metingen per sector.
+
+    ``counts`` is een Series met sectoren in graden als index, bijv. de
+    uitvoer van ``utils.windrose.rose_counts``.
+    """
+    max_count = counts.max()
+    kleur = counts / max_count if max_count > 0 else counts * 0
+
+    fig = go.Figure()
+
+    # Balken met kleurgradatie (LANGER GEMAAKT)
+    fig.add_trace(go.Barpolar(
+        r=counts.to_numpy() * 1.4,   # 40% langer
+        theta=counts.index.to_numpy(),
+        marker=dict(
+            color=kleur.to_numpy(),
+            colorscale="Blues",
+            cmin=0,
+            cmax=1
+        ),
+        opacity=0.95,
+        name="Frequentie"
+    ))
+
+    # Windrichtingen als één teksttrace
+    fig.add_trace(go.Scatterpolar(
+        r=[max_count * 1.8] * 8,
+        theta=[0, 45, 90, 135, 180, 225, 270, 315],
+        mode="text",
+        text=["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
+        textfont=dict(size=14, color="black"),
+        showlegend=False
+    ))
+
+    fig.update_layout(
+        title=title,
+        polar=dict(
+            radialaxis=dict(showticklabels=True, ticks="outside", range=[0, max_count * 2]),
+            angularaxis=dict(direction="clockwise", rotation=90)
+        ),
+        showlegend=True
+    )
+
+    return fig
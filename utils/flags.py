@@ -0,0 +1,224 @@
+"""Declaratieve QC-flagging per variabele.
+
+Per variabele (bestandsnaam zonder ``_QC.xlsx``) staat in ``RULES`` een
+geordende lijst drempelbanden. Elke band is ``(flag, bovengrens, inclusief)``:
+een waarde valt in de eerste band waarvan ze onder de bovengrens ligt (of er
+gelijk aan is als ``inclusief``). De laatste band heeft bovengrens ``inf``.
+
+Alle waarden worden in één ``np.searchsorted`` over de bandgrenzen ingedeeld,
+zodat een hele maand of een heel jaar in één vectorized pass geflagd wordt.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Flag voor rijen zonder meting
+MISSING = "MISSING"
+
+RULES = {
+    # QC-intervallen temperatuur – Suriname specifiek
+    "Air_Temperaturedeg_C": {
+        "afronding": 1,
+        "banden": [
+            ("LOW_IMPOSSIBLE", 0, False),    # Onmogelijk (<0°C)
+            ("LOW_SUSPICIOUS", 5, False),    # Onrealistisch laag (0–5°C)
+            ("LOW_RANGE", 20, False),        # Verdacht laag (5–20°C)
+            ("OK", 37, False),               # Normaal (20–37°C)
+            ("HIGH", 40, True),              # Extreem hoog (37–40°C)
+            ("VERY_HIGH", np.inf, False),    # Zeer extreem hoog (>40°C)
+        ]
+    },
+    "Dew_Pointdeg_C": {
+        "afronding": 1,
+        "banden": [
+            ("LOW_IMPOSSIBLE", 0, False),
+            ("LOW_SUSPICIOUS", 10, False),
+            ("LOW_RANGE", 18, False),
+            ("OK", 28, True),
+            ("HIGH", 32, True),
+            ("VERY_HIGH", np.inf, False),
+        ]
+    },
+    "Relative_Humidity%": {
+        "afronding": 0,
+        "banden": [
+            ("OUT_OF_RANGE", 0, False),
+            ("LOW_SUSPICIOUS", 30, False),
+            ("LOW_RANGE", 50, False),
+            ("OK", 100, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    "Barometric_PressurehPa": {
+        "afronding": 1,
+        "banden": [
+            ("OUT_OF_RANGE", 900, False),
+            ("LOW_SUSPICIOUS", 990, False),
+            ("LOW_RANGE", 1000, False),
+            ("OK", 1020, True),
+            ("HIGH", 1050, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    "QNHhPa": {
+        "afronding": 1,
+        "banden": [
+            ("OUT_OF_RANGE", 900, False),
+            ("LOW_SUSPICIOUS", 990, False),
+            ("LOW_RANGE", 1000, False),
+            ("OK", 1020, True),
+            ("HIGH", 1050, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    # Windrichting moet binnen 0–360° liggen
+    "Wind_Dir_Averagedeg": {
+        "afronding": None,
+        "banden": [
+            ("OUT_OF_RANGE", 0, False),
+            ("OK", 360, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    "Gust_Dirdeg": {
+        "afronding": None,
+        "banden": [
+            ("OUT_OF_RANGE", 0, False),
+            ("OK", 360, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    "Wind_Speed_Averageknots": {
+        "afronding": 1,
+        "banden": [
+            ("OUT_OF_RANGE", 0, False),
+            ("OK", 35, True),
+            ("HIGH", 50, True),
+            ("VERY_HIGH", 75, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    "Gust_Speedknots": {
+        "afronding": 1,
+        "banden": [
+            ("OUT_OF_RANGE", 0, False),
+            ("OK", 50, True),
+            ("HIGH", 70, True),
+            ("VERY_HIGH", 100, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    "Hours_of_Sunshinehr": {
+        "afronding": 1,
+        "banden": [
+            ("OUT_OF_RANGE", 0, False),
+            ("OK", 13, True),
+            ("HIGH", 24, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+    "Accumulated_Solar_RadWhm^2": {
+        "afronding": 1,
+        "banden": [
+            ("OUT_OF_RANGE", 0, False),
+            ("OK", 10000, True),
+            ("OUT_OF_RANGE", np.inf, False),
+        ]
+    },
+}
+
+# Flags die als ongeldige meting tellen in de maandstatistieken
+ONGELDIGE_FLAGS = {"LOW_IMPOSSIBLE", "OUT_OF_RANGE"}
+
+# Decimalen waarmee waarden getoond worden (tabellen, statistieken, rapporten); standaard 1
+WEERGAVE_DECIMALEN = {
+    "Relative_Humidity%": 0,
+    "Wind_Dir_Averagedeg": 0,
+    "Gust_Dirdeg": 0,
+}
+
+# Kleuren voor tabellen en grafieken
+FLAG_STYLES = {
+    "OK": "background-color: #b6f2b6",
+    "LOW_RANGE": "background-color: #ffd27f",
+    "LOW_SUSPICIOUS": "background-color: #fff59d",
+    "LOW_IMPOSSIBLE": "background-color: #90caf9",
+    "HIGH": "background-color: #ff8a80",
+    "VERY_HIGH": "background-color: #d32f2f; color: white",
+    "OUT_OF_RANGE": "background-color: #ff8a80",
+    # Temporele flags (utils.temporal)
+    "STEP": "background-color: #ce93d8",
+    "SPIKE": "background-color: #f48fb1",
+    "FLATLINE": "background-color: #b0bec5"
+}
+
+FLAG_COLORS = {
+    "OK": "green",
+    "LOW_RANGE": "orange",
+    "LOW_SUSPICIOUS": "yellow",
+    "LOW_IMPOSSIBLE": "blue",
+    "HIGH": "red",
+    "VERY_HIGH": "darkred",
+    "OUT_OF_RANGE": "red",
+    "STEP": "purple",
+    "SPIKE": "magenta",
+    "FLATLINE": "gray"
+}
+
+
+def _compile(banden):
+    """Bandgrenzen als exclusieve bovengrenzen + flag per band."""
+    grenzen = np.array([
+        np.nextafter(grens, np.inf) if inclusief else grens
+        for _, grens, inclusief in banden[:-1]
+    ], dtype=float)
+    flags = np.array([flag for flag, _, _ in banden] + [MISSING], dtype=object)
+    return grenzen, flags
+
+
+_COMPILED = {variable: _compile(rule["banden"]) for variable, rule in RULES.items()}
+
+
+def display_decimals(variable):
+    """Aantal decimalen waarmee ``variable`` in dashboards en rapporten getoond wordt."""
+    return WEERGAVE_DECIMALEN.get(variable, 1)
+
+
+def flag_names(variable):
+    """Flag per index van ``flag_indices`` (de banden + ``MISSING`` als laatste)."""
+    return list(_COMPILED[variable][1])
+
+
+def flag_indices(variable, waarden):
+    """Flag van ``waarden`` als uint8-index in ``flag_names(variable)``.
+
+    ``None`` als er geen regels zijn. Zelfde afronding en banden als
+    ``flag_variable``, maar zonder een objectkolom met strings.
+    """
+    rule = RULES.get(variable)
+    if rule is None:
+        return None
+
+    v = np.asarray(waarden, dtype=float)
+    if rule["afronding"] is not None:
+        v = np.round(v, rule["afronding"])
+
+    grenzen, flags = _COMPILED[variable]
+
+    # Index van de band waar elke waarde in valt; NaN → MISSING (laatste plek)
+    band = np.searchsorted(grenzen, v, side="right").astype(np.uint8)
+    band[np.isnan(v)] = len(flags) - 1
+    return band
+
+
+def flag_variable(variable, waarden):
+    """Flag ``waarden`` met de regels van ``variable``; ``None`` als er geen regels zijn.
+
+    Waarden worden eerst afgerond zoals in de tabellen van het dashboard
+    (temperatuur op 0,1°C). Rijen zonder meting krijgen ``MISSING``.
+    """
+    band = flag_indices(variable, waarden)
+    if band is None:
+        return None
+
+    return pd.Series(_COMPILED[variable][1][band], index=waarden.index, name="QC_Flag")
@@ -0,0 +1,198 @@
+"""Inlezen van station/variabele-combinaties in het genormaliseerde datamodel.
+
+Eén aanroep per rerun levert een frame waarin ``Timestamp`` gesorteerd en
+uniek is, ``Raw Value`` numeriek is en ``Datum`` de dag bevat. Alle verdere
+stappen (completeness, flagging, aggregatie) werken op dit frame zonder
+opnieuw te converteren.
+
+``load_station_frame`` laadt alle variabelen van een station tegelijk en lijnt
+ze uit op één gedeeld 10-minuten raster (één kolom per variabele);
+``load_network_frame`` doet hetzelfde voor één variabele over alle stations.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import empty_frame
+from utils.completeness import SLOT_DUUR
+from utils.profiling import map_in_context
+from utils.store import ingest, load_store
+
+DATA_PATH = "data"
+
+# Bestandsnamen zonder "_QC.xlsx"
+TEMPERATUUR = "Air_Temperaturedeg_C"
+WINDRICHTING = "Wind_Dir_Averagedeg"
+
+
+def list_stations(data_path=DATA_PATH):
+    """Alle stationsmappen onder ``data_path``, alfabetisch."""
+    return sorted(
+        d for d in os.listdir(data_path)
+        if os.path.isdir(os.path.join(data_path, d))
+    )
+
+
+def list_variables(station, data_path=DATA_PATH):
+    """Alle variabelen waarvoor het station een ``*_QC.xlsx`` heeft."""
+    station_path = os.path.join(data_path, station)
+    return sorted(
+        f[:-len("_QC.xlsx")] for f in os.listdir(station_path)
+        if f.endswith("_QC.xlsx")
+    )
+
+
+def qc_file_path(station, variable, data_path=DATA_PATH):
+    return os.path.join(data_path, station, f"{variable}_QC.xlsx")
+
+
+def load_station_variable(station, variable, data_path=DATA_PATH):
+    """Laad één station/variabele als genormaliseerd frame.
+
+    Nieuwe rijen uit de werkmap worden eerst incrementeel aan de store
+    toegevoegd (``utils.store``); een ongewijzigde werkmap wordt niet geopend.
+    """
+    file_path = qc_file_path(station, variable, data_path)
+    ingest(station, variable, file_path)
+
+    df = load_store(station, variable)
+    if df is None:
+        # Werkmap zonder rijen → lege store
+        return empty_frame()
+    return df
+
+
+def load_station_period(station, variable, start, eind, data_path=DATA_PATH):
+    """Zoals ``load_station_variable``, maar alleen de dagen ``start`` t/m ``eind``.
+
+    Leest uit de store alleen de maandpartities die de periode raken, zodat
+    geheugen en laadtijd niet meegroeien met de lengte van het archief.
+    """
+    file_path = qc_file_path(station, variable, data_path)
+    ingest(station, variable, file_path)
+
+    df = load_store(station, variable, start, eind)
+    if df is None:
+        return empty_frame()
+    return df
+
+
+def month_bounds(dag):
+    """Eerste en laatste dag van de maand van ``dag``."""
+    start = pd.Timestamp(dag).replace(day=1)
+    return start.date(), (start + pd.offsets.MonthEnd(0)).date()
+
+
+def period_bounds(periode, dag):
+    """Eerste en laatste dag van de ``periode`` ("Dag", "Week", "Maand") rond ``dag``.
+
+    Een week loopt van maandag t/m zondag.
+    """
+    if periode == "Maand":
+        return month_bounds(dag)
+    if periode == "Week":
+        maandag = pd.Timestamp(dag) - pd.Timedelta(days=pd.Timestamp(dag).weekday())
+        return maandag.date(), (maandag + pd.Timedelta(days=6)).date()
+    return dag, dag
+
+
+def _load_values(station, variable, start, eind, data_path):
+    if start is not None and eind is not None:
+        df = load_station_period(station, variable, start, eind, data_path)
+    else:
+        df = load_station_variable(station, variable, data_path)
+    return df.set_index("Timestamp")["Raw Value"].astype(np.float32)
+
+
+def align_on_grid(reeksen):
+    """Lijn Series (index Timestamp) uit op één gedeeld 10-minuten raster.
+
+    ``reeksen`` is een dict ``{kolom: Series}``. Het raster loopt van het
+    eerste tot het laatste tijdstip van alle reeksen (stap ``SLOT_DUUR``);
+    ontbrekende slots zijn NaN. Metingen die niet precies op een 10-minuten
+    tijdstip vallen tellen niet mee.
+    """
+    gevuld = [r.index for r in reeksen.values() if not r.empty]
+    if not gevuld:
+        return pd.DataFrame(columns=list(reeksen), index=pd.DatetimeIndex([], name="Timestamp"),
+                            dtype=np.float32)
+
+    eerste = min(i[0] for i in gevuld).floor(SLOT_DUUR)
+    laatste = max(i[-1] for i in gevuld).floor(SLOT_DUUR)
+    index = pd.date_range(eerste, laatste, freq=SLOT_DUUR, name="Timestamp")
+
+    # Timestamp is per reeks al uniek, dus reindex is een directe uitlijning
+    return pd.DataFrame({kolom: r.reindex(index) for kolom, r in reeksen.items()})
+
+
+def load_station_frame(station, variables=None, start=None, eind=None,
+                       data_path=DATA_PATH, workers=None):
+    """Alle variabelen van ``station`` als één breed frame op een 10-minuten raster.
+
+    De variabelen (standaard alle werkmappen van het station) worden parallel
+    in een thread pool geladen; het lezen van de Parquet-delen laat de GIL
+    vrij. Het resultaat (zie ``align_on_grid``) heeft één float32-kolom met
+    de Raw Value per variabele.
+
+    Met ``start``/``eind`` worden alleen die dagen geladen.
+    """
+    if variables is None:
+        variables = list_variables(station, data_path)
+    if not variables:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="Timestamp"))
+
+    workers = min(workers or os.cpu_count() or 1, len(variables))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reeksen = map_in_context(
+            pool, lambda variable: _load_values(station, variable, start, eind, data_path), variables
+        )
+        return align_on_grid(dict(zip(variables, reeksen)))
+
+
+def load_network_frame(stations, variable, start=None, eind=None,
+                       data_path=DATA_PATH, workers=None):
+    """Eén variabele voor alle ``stations`` als breed frame (kolom per station).
+
+    Zelfde uitlijning en thread pool als ``load_station_frame``, maar dan
+    station × tijd in plaats van variabele × tijd.
+    """
+    if not stations:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="Timestamp"))
+
+    workers = min(workers or os.cpu_count() or 1, len(stations))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reeksen = map_in_context(
+            pool, lambda station: _load_values(station, variable, start, eind, data_path), stations
+        )
+        return align_on_grid(dict(zip(stations, reeksen)))
+
+
+def available_days(df):
+    """Gesorteerde lijst van dagen (datetime.date) met minstens één rij."""
+    return list(pd.DatetimeIndex(df["Datum"].unique()).date)
+
+
+def select_range(df, start, eind):
+    """Alle rijen van de dagen ``start`` t/m ``eind``.
+
+    ``Timestamp`` is gesorteerd, dus de grenzen worden met binair zoeken
+    gevonden en het resultaat is één aaneengesloten slice: O(log n + k) in
+    plaats van een vergelijking over de hele kolom.
+    """
+    ts = df["Timestamp"]
+    begin = ts.searchsorted(pd.Timestamp(start).normalize(), side="left")
+    einde = ts.searchsorted(pd.Timestamp(eind).normalize() + pd.Timedelta(days=1), side="left")
+    return df.iloc[begin:einde]
+
+
+def select_day(df, dag):
+    """Alle rijen van ``dag``."""
+    return select_range(df, dag, dag)
+
+
+def select_month(df, jaar, maand):
+    """Alle rijen van de opgegeven maand."""
+    return select_range(df, *month_bounds(pd.Timestamp(year=jaar, month=maand, day=1)))
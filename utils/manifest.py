@@ -0,0 +1,173 @@
+"""Persistente index van stations, variabelen en beschikbare dagen.
+
+De manifest (``.qc_cache/manifest.json``) bevat per station per variabele de
+bronsleutel van de werkmap, het aantal rijen en metingen, de eerste/laatste
+dag en de lijst met dagen. Alles komt uit de dag-QC en de Parquet-metadata
+van de store; de ruwe reeks wordt daarvoor niet geladen. De dashboards vullen hun keuzelijsten uit de
+manifest, zonder een werkmap te openen; een station zonder werkmap voor de
+gevraagde variabele (zoals een lege stationsmap) wordt niet aangeboden.
+
+Bij elke ``load_manifest`` worden alleen mtime en grootte van de werkmappen
+vergeleken; alleen nieuwe of gewijzigde werkmappen worden (via de store)
+opnieuw ingelezen, parallel in een process pool. De lijst met stations en
+werkmappen wordt per proces onthouden en alleen opnieuw gescand als de
+mtime van ``data_path`` of van een stationsmap verandert. Eén ``os.stat``
+per werkmap per aanroep blijft nodig: een werkmap die ter plekke wordt
+overschreven verandert de mtime van zijn map niet.
+
+De dashboards roepen ``load_manifest`` aan met ``workers=1``: een process
+pool starten vanuit de (multithreaded) Streamlit-server kan vastlopen.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from utils.cache import CACHE_DIR
+from utils.loader import DATA_PATH, list_stations, list_variables, qc_file_path
+from utils.profiling import tel_cache
+from utils.store import ingest, load_daily_qc, source_key, store_rows
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+
+# Ophogen wanneer de opbouw van een manifest-entry verandert
+MANIFEST_VERSIE = 2
+
+# In-process memo: (data_path, sleutels) -> manifest
+_memo = {}
+
+# In-process memo van de mappen: data_path -> (mtime, {station: (mtime, variabelen)})
+_mappen = {}
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("versie") != MANIFEST_VERSIE:
+        return None
+    return manifest
+
+
+def _write_manifest(manifest):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def _workbooks(data_path):
+    """``{station: variabelen}`` onder ``data_path``; alleen gewijzigde mappen worden gescand."""
+    data_mtime = os.stat(data_path).st_mtime_ns
+    vorige = _mappen.get(data_path)
+    if vorige is not None and vorige[0] == data_mtime:
+        stations = vorige[1]
+    else:
+        stations = {station: (None, []) for station in list_stations(data_path)}
+
+    mappen = {}
+    for station, (mtime, variabelen) in stations.items():
+        nu = os.stat(os.path.join(data_path, station)).st_mtime_ns
+        if nu != mtime:
+            variabelen = list_variables(station, data_path)
+        mappen[station] = (nu, variabelen)
+
+    _mappen[data_path] = (data_mtime, mappen)
+    return {station: variabelen for station, (_, variabelen) in mappen.items()}
+
+
+def _entry(station, variable, file_path):
+    """Manifest-entry voor één werkmap (werkt de store bij)."""
+    bron = source_key(file_path)
+    ingest(station, variable, file_path)
+    dag_qc = load_daily_qc(station, variable)
+
+    if dag_qc is None or dag_qc.empty:
+        return {"bron": bron, "rijen": 0, "metingen": 0,
+                "eerste": None, "laatste": None, "dagen": []}
+
+    # dag_qc heeft een rij per dag met minstens één rij in de store
+    dagen = pd.DatetimeIndex(pd.to_datetime(dag_qc["Dag"].astype(str))).strftime("%Y-%m-%d")
+    return {
+        "bron": bron,
+        "rijen": store_rows(station, variable),
+        "metingen": int(dag_qc["Aanwezig"].sum()),
+        "eerste": dagen[0],
+        "laatste": dagen[-1],
+        "dagen": dagen.tolist(),
+    }
+
+
+def _entry_job(job):
+    return _entry(*job)
+
+
+def load_manifest(data_path=DATA_PATH, workers=None):
+    """De actuele manifest als dict ``{station: {variabele: entry}}``.
+
+    Alleen werkmappen waarvan de bronsleutel afwijkt worden opnieuw verwerkt;
+    ``workers`` is het aantal processen daarvoor (standaard: aantal cores).
+    """
+    werkmappen = _workbooks(data_path)
+    stations = list(werkmappen)
+    bronnen = {
+        (station, variable): source_key(qc_file_path(station, variable, data_path))
+        for station, variabelen in werkmappen.items()
+        for variable in variabelen
+    }
+
+    memo_key = (data_path, json.dumps(sorted((list(k), v) for k, v in bronnen.items())))
+    if memo_key in _memo:
+        tel_cache("manifest", True)
+        return _memo[memo_key]
+    tel_cache("manifest", False)
+
+    oud = _read_manifest()
+    oud_stations = oud["stations"] if oud and oud.get("data_path") == data_path else {}
+
+    manifest = {station: {} for station in stations}
+    verouderd = []
+    for (station, variable), bron in bronnen.items():
+        entry = oud_stations.get(station, {}).get(variable)
+        if entry is not None and entry["bron"] == bron:
+            manifest[station][variable] = entry
+        else:
+            verouderd.append((station, variable, qc_file_path(station, variable, data_path)))
+
+    if verouderd:
+        workers = min(workers or os.cpu_count() or 1, len(verouderd))
+        if workers == 1:
+            entries = [_entry_job(job) for job in verouderd]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                entries = list(pool.map(_entry_job, verouderd))
+
+        for (station, variable, _), entry in zip(verouderd, entries):
+            manifest[station][variable] = entry
+
+    if verouderd or set(oud_stations) != set(manifest) or any(
+        set(oud_stations.get(s, {})) != set(v) for s, v in manifest.items()
+    ):
+        _write_manifest({"versie": MANIFEST_VERSIE, "data_path": data_path, "stations": manifest})
+
+    _memo[memo_key] = manifest
+    return manifest
+
+
+def stations_with(manifest, variable):
+    """Stations met minstens één meting voor ``variable``, alfabetisch."""
+    return sorted(
+        station for station, variabelen in manifest.items()
+        if variabelen.get(variable, {}).get("metingen", 0) > 0
+    )
+
+
+def manifest_days(manifest, station, variable):
+    """Beschikbare dagen (datetime.date) van ``station``/``variable`` uit de manifest."""
+    dagen = manifest.get(station, {}).get(variable, {}).get("dagen", [])
+    return list(pd.to_datetime(dagen).date)
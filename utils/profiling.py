@@ -0,0 +1,162 @@
+"""Tijdmeting per dashboardsectie, cachetellers en geheugen van de frames.
+
+Elke rerun van een dashboard maakt één ``RerunProfiel``. ``sectie(naam)``
+markeert het begin van een genummerde sectie en sluit de vorige af, zodat de
+scripts niet ingesprongen hoeven te worden. ``frame`` noteert rijen en
+geheugen van een geladen DataFrame. De caches (store, manifest)
+tellen hun hits en misses via ``tel_cache``.
+
+De tellers van een rerun staan in een ``ContextVar``: Streamlit draait elke
+sessie in een eigen thread, dus gelijktijdige sessies tellen niet bij
+elkaars rerun mee. Daarnaast houdt ``CACHE_TELLERS`` de totalen van het hele
+proces bij (alle sessies samen).
+
+``afronden`` schrijft het rapport als één JSON-regel naar de logger
+``aws_qc.profiel`` en toont het, als de gebruiker dat aanzet, in een
+debugpaneel in de sidebar. De logging zelf wordt ingesteld door het
+script dat start (``configure_logging``), niet bij het importeren.
+"""
+
+import contextvars
+import json
+import logging
+import sys
+import threading
+import time
+
+import pandas as pd
+
+logger = logging.getLogger("aws_qc.profiel")
+
+# Tellers per cache over de hele levensduur van het proces (alle sessies): naam -> {"hit", "miss"}
+CACHE_TELLERS = {}
+
+# Tellers van de lopende rerun in deze thread/context (None buiten een rerun)
+_RERUN_TELLERS = contextvars.ContextVar("aws_qc_rerun_tellers", default=None)
+
+_lock = threading.Lock()
+
+
+def configure_logging(level=logging.INFO):
+    """Log ``aws_qc.*`` naar stderr; voor de dashboards en scripts, één keer per proces."""
+    basis = logging.getLogger("aws_qc")
+    if basis.handlers:
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    basis.addHandler(handler)
+    basis.setLevel(level)
+    basis.propagate = False
+
+
+def tel_cache(cache, hit):
+    """Tel één hit of miss voor ``cache``, in het proces en in de lopende rerun."""
+    soort = "hit" if hit else "miss"
+    with _lock:
+        for tellers in (CACHE_TELLERS, _RERUN_TELLERS.get()):
+            if tellers is not None:
+                tellers.setdefault(cache, {"hit": 0, "miss": 0})[soort] += 1
+
+
+def map_in_context(pool, functie, items):
+    """Als ``pool.map(functie, items)`` (een thread pool), maar elke taak draait in
+    een kopie van de context van de aanroeper, zodat cachehits in de threads
+    bij de lopende rerun meetellen."""
+    taken = [pool.submit(contextvars.copy_context().run, functie, item) for item in items]
+    return [taak.result() for taak in taken]
+
+
+class RerunProfiel:
+    """Tijden, cachetellers en framegeheugen van één rerun van ``dashboard``."""
+
+    def __init__(self, dashboard):
+        self.dashboard = dashboard
+        self.secties = []
+        self.frames = {}
+        self._start = time.perf_counter()
+        self._huidige = None
+        self.caches = {}
+        _RERUN_TELLERS.set(self.caches)
+
+    def sectie(self, naam):
+        """Sluit de lopende sectie af en start sectie ``naam``."""
+        nu = time.perf_counter()
+        self._sluit(nu)
+        self._huidige = (naam, nu)
+
+    def _sluit(self, nu):
+        if self._huidige is not None:
+            naam, begin = self._huidige
+            self.secties.append({"sectie": naam, "duur_ms": (nu - begin) * 1000})
+            self._huidige = None
+
+    def frame(self, naam, df):
+        """Noteer rijen en geheugen (diep, in bytes) van ``df``."""
+        self.frames[naam] = {
+            "rijen": len(df),
+            "bytes": int(df.memory_usage(deep=True).sum()),
+        }
+
+    def resident(self, naam, rijen, nbytes):
+        """Noteer rijen en geheugen van gegevens die buiten een DataFrame bewaard worden."""
+        self.frames[naam] = {"rijen": int(rijen), "bytes": int(nbytes)}
+
+    def rapport(self):
+        """Het rapport van deze rerun tot nu toe als dict."""
+        nu = time.perf_counter()
+        secties = list(self.secties)
+        if self._huidige is not None:
+            naam, begin = self._huidige
+            secties.append({"sectie": naam, "duur_ms": (nu - begin) * 1000})
+
+        with _lock:
+            caches = {cache: dict(teller) for cache, teller in self.caches.items()}
+            proces = {cache: dict(teller) for cache, teller in CACHE_TELLERS.items()}
+
+        return {
+            "dashboard": self.dashboard,
+            "totaal_ms": (nu - self._start) * 1000,
+            "secties": secties,
+            "caches": caches,
+            "caches_proces": proces,
+            "frames": self.frames,
+        }
+
+    def afronden(self, sidebar=None):
+        """Sluit de laatste sectie af, log het rapport en toon het debugpaneel.
+
+        ``sidebar`` is ``st.sidebar``; zonder sidebar wordt alleen gelogd.
+        Roep dit ook aan vlak voor een ``st.stop()``.
+        """
+        self._sluit(time.perf_counter())
+        rapport = self.rapport()
+        logger.info(json.dumps(rapport))
+
+        if sidebar is not None and sidebar.checkbox("Debug: tijden per sectie"):
+            render_profiel(sidebar, rapport)
+
+        return rapport
+
+
+def render_profiel(container, rapport):
+    """Toon een rapport van ``RerunProfiel.rapport`` in ``container``."""
+    container.markdown(f"**Rerun:** {rapport['totaal_ms']:.0f} ms")
+
+    secties = pd.DataFrame(rapport["secties"], columns=["sectie", "duur_ms"])
+    container.dataframe(secties.round({"duur_ms": 1}), hide_index=True)
+
+    if rapport["caches"]:
+        caches = pd.DataFrame.from_dict(rapport["caches"], orient="index")
+        container.markdown("**Caches (deze rerun)**")
+        container.dataframe(caches)
+
+    if rapport.get("caches_proces"):
+        caches = pd.DataFrame.from_dict(rapport["caches_proces"], orient="index")
+        container.markdown("**Caches (proces, alle sessies)**")
+        container.dataframe(caches)
+
+    if rapport["frames"]:
+        frames = pd.DataFrame.from_dict(rapport["frames"], orient="index")
+        frames["MB"] = (frames["bytes"] / 1e6).round(2)
+        container.markdown("**Geladen frames**")
+        container.dataframe(frames[["rijen", "MB"]])
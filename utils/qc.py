@@ -0,0 +1,56 @@
+"""Dagelijkse QC-resultaten: completeness, min/max/som en aantal metingen per QC-flag."""
+
+import pandas as pd
+
+from utils.completeness import daily_completeness
+from utils.flags import ONGELDIGE_FLAGS, flag_variable
+
+
+def daily_qc(df, variable):
+    """Eén rij per dag met ``Dag``, ``Aanwezig``, ``Percentage``, ``Status``,
+    ``Minimum``, ``Maximum``, ``Som``, ``Gemiddelde``, ``Ongeldig``,
+    ``Minimum geldig``, ``Maximum geldig`` en een kolom ``Aantal <flag>`` per
+    QC-flag van ``variable``.
+
+    ``Ongeldig`` telt de metingen met een flag uit ``ONGELDIGE_FLAGS``; de
+    ``geldig``-kolommen zijn over de overige metingen. Dagen zonder (geldige)
+    metingen hebben NaN als minimum/maximum.
+    """
+    resultaat = daily_completeness(df)
+
+    metingen = df[df["Raw Value"].notna()]
+    flags = flag_variable(variable, metingen["Raw Value"])
+
+    if flags is not None:
+        ongeldig = flags.isin(ONGELDIGE_FLAGS)
+    else:
+        ongeldig = pd.Series(False, index=metingen.index)
+
+    dag = metingen["Datum"].dt.date.rename("Dag")
+    waarden = metingen["Raw Value"]
+
+    stats = waarden.groupby(dag).agg(["min", "max", "sum"])
+    stats.columns = ["Minimum", "Maximum", "Som"]
+    stats["Ongeldig"] = ongeldig.groupby(dag).sum().astype(int)
+
+    geldig = waarden[~ongeldig].groupby(dag[~ongeldig]).agg(["min", "max"])
+    geldig.columns = ["Minimum geldig", "Maximum geldig"]
+
+    resultaat = resultaat.merge(stats.join(geldig).reset_index(), on="Dag", how="left")
+    resultaat["Som"] = resultaat["Som"].fillna(0.0)
+    resultaat["Ongeldig"] = resultaat["Ongeldig"].fillna(0).astype(int)
+    resultaat["Gemiddelde"] = resultaat["Som"] / resultaat["Aanwezig"].where(resultaat["Aanwezig"] > 0)
+
+    if flags is not None and not metingen.empty:
+        flag_counts = (
+            pd.crosstab(dag, flags)
+            .rename_axis(index="Dag", columns=None)
+            .add_prefix("Aantal ")
+            .reset_index()
+        )
+        resultaat = resultaat.merge(flag_counts, on="Dag", how="left")
+
+        count_cols = [c for c in resultaat.columns if c.startswith("Aantal ")]
+        resultaat[count_cols] = resultaat[count_cols].fillna(0).astype(int)
+
+    return resultaat
@@ -0,0 +1,233 @@
+"""Statische HTML-maandrapporten per station en variabele, zonder dashboard.
+
+Elk rapport bevat dezelfde onderdelen als de dashboards voor één maand:
+completeness-raster, maandstrook, flagtabel (alleen afwijkende metingen),
+maandstatistieken en dag-/maandconclusie. De figuren zijn dezelfde
+Plotly-figuren als in ``app.py``; plotly.js wordt via de CDN geladen.
+
+Naast elk rapport staat een ``.json`` met de invoersleutel (de Parquet-delen
+van die maand in de store + ``RAPPORT_VERSIE``). Is die sleutel ongewijzigd, dan wordt het rapport
+overgeslagen, zodat een geplande run alleen nieuwe of gewijzigde maanden
+opnieuw rendert. De rapporten worden parallel gemaakt in een process pool.
+"""
+
+import html
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from utils.aggregation import month_statistics
+from utils.completeness import slot_matrix
+from utils.conclusions import day_conclusion, month_conclusion
+from utils.figures import block_timeline_stack, month_strip_figure
+from utils.flags import display_decimals, flag_variable
+from utils.loader import DATA_PATH, load_station_period, month_bounds
+from utils.manifest import load_manifest, manifest_days
+from utils.store import load_daily_qc, load_monthly_qc, month_key
+from utils.tables import filter_flags, flag_styles
+from utils.temporal import temporal_flag
+
+RAPPORT_DIR = "reports"
+
+# Verhogen wanneer de inhoud of opmaak van de rapporten verandert
+RAPPORT_VERSIE = 3
+
+
+def report_path(station, variable, jaar, maand, output_dir=RAPPORT_DIR):
+    return os.path.join(output_dir, station, variable, f"{jaar}-{maand:02d}.html")
+
+
+def report_key(station, variable, jaar, maand):
+    """Invoersleutel van een rapport: de delen van de maandpartitie + ``RAPPORT_VERSIE``."""
+    return {"versie": RAPPORT_VERSIE, "delen": month_key(station, variable, jaar, maand)}
+
+
+def _read_key(pad):
+    try:
+        with open(pad + ".json") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(pad, inhoud, sleutel):
+    os.makedirs(os.path.dirname(pad), exist_ok=True)
+    tmp_path = pad + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(inhoud)
+    os.replace(tmp_path, pad)
+
+    # Sleutel pas na het rapport: een onderbroken run wordt de volgende keer herhaald
+    with open(pad + ".json.tmp", "w") as f:
+        json.dump(sleutel, f)
+    os.replace(pad + ".json.tmp", pad + ".json")
+
+
+def _markdown(tekst):
+    """De conclusieteksten (regels, ``- `` opsommingen) als eenvoudige HTML."""
+    regels = [r for r in tekst.split("\n") if r.strip()]
+    punten = [r[2:] for r in regels if r.startswith("- ")]
+    alinea = [r for r in regels if not r.startswith("- ")]
+
+    uit = "".join(f"<p>{html.escape(r)}</p>" for r in alinea)
+    if punten:
+        uit += "<ul>" + "".join(f"<li>{html.escape(p)}</li>" for p in punten) + "</ul>"
+    return uit
+
+
+def _statistics_html(stats, decimalen):
+    if stats is None:
+        return "<p>Geen maandstatistieken beschikbaar.</p>"
+
+    laagste = stats["laagste_geldig"]
+    rijen = [
+        ("Aantal metingen", stats["totaal"]),
+        ("Aantal ongeldige waarden", stats["ongeldig"]),
+        ("Percentage ongeldige waarden", f"{stats['ongeldig_percentage']:.1f}%"),
+        ("Laagste geldige waarde",
+         f"{laagste:.{decimalen}f}" if laagste is not None else "Geen geldige waarden"),
+        ("Hoogste waarde", f"{stats['hoogste']:.{decimalen}f}"),
+    ]
+    return "<table>" + "".join(
+        f"<tr><th>{naam}</th><td>{waarde}</td></tr>" for naam, waarde in rijen
+    ) + "</table>"
+
+
+def render_month_report(station, variable, jaar, maand, data_path=DATA_PATH):
+    """HTML van het maandrapport voor ``station``/``variable`` (``None`` zonder metingen)."""
+    start, eind = month_bounds(pd.Timestamp(year=jaar, month=maand, day=1))
+    df = load_station_period(station, variable, start, eind, data_path)
+    if df.empty:
+        return None
+
+    titel = f"{station} – {variable} – {jaar}-{maand:02d}"
+    onderdelen = [f"<h1>{html.escape(titel)}</h1>"]
+
+    # 1. Completeness-raster (dagen × 10-minuten slots)
+    kalenderdagen = list(pd.date_range(start, eind).date)
+    fig = block_timeline_stack(slot_matrix(df, kalenderdagen), kalenderdagen)
+    onderdelen += ["<h2>Completeness</h2>", fig.to_html(full_html=False, include_plotlyjs="cdn")]
+
+    # 2. Maandstrook uit de opgeslagen dagresultaten
+    qc_df = load_daily_qc(station, variable)
+    if qc_df is not None:
+        qc_df = qc_df[(qc_df["Dag"] >= start) & (qc_df["Dag"] <= eind)]
+    if qc_df is not None and not qc_df.empty:
+        fig = month_strip_figure(qc_df)
+        onderdelen += [
+            "<h2>Maandoverzicht</h2>",
+            fig.to_html(full_html=False, include_plotlyjs=False),
+            "<p>🟩 Geschikte dag (≥75% compleet) | 🟥 Ongeschikte dag (&lt;75% compleet)</p>",
+        ]
+
+    # 3. Flagtabel – alleen de afwijkende metingen. Eerst flaggen op de
+    # opgeslagen waarden (zoals de dashboards), pas daarna afronden voor weergave
+    df_dag = df[df["Raw Value"].notna()].copy()
+    df_dag["QC_Flag"] = flag_variable(variable, df_dag["Raw Value"])
+    kolommen = ["Timestamp", "Raw Value", "QC_Flag"]
+
+    tijd_flag = temporal_flag(variable, df_dag)
+    if tijd_flag is not None:
+        df_dag["Tijd_Flag"] = tijd_flag
+        kolommen.append("Tijd_Flag")
+
+    decimalen = display_decimals(variable)
+    df_dag["Raw Value"] = df_dag["Raw Value"].round(decimalen)
+
+    afwijkend = filter_flags(df_dag[kolommen], True)
+    onderdelen.append(f"<h2>Afwijkende metingen ({len(afwijkend)} van {len(df_dag)})</h2>")
+    if not afwijkend.empty:
+        onderdelen.append(
+            afwijkend.style
+            .apply(flag_styles, axis=None)
+            .format({"Raw Value": f"{{:.{decimalen}f}}"})
+            .hide(axis="index")
+            .to_html()
+        )
+
+    # 4. Maandstatistieken uit de maandrollup
+    stats = month_statistics(load_monthly_qc(station, variable), jaar, maand)
+    onderdelen += ["<h2>Maandstatistieken</h2>", _statistics_html(stats, decimalen)]
+
+    # 5. Conclusies
+    onderdelen.append("<h2>Conclusies</h2>")
+    if not df_dag.empty:
+        conclusie = day_conclusion(
+            variable, df_dag["Raw Value"].min(), df_dag["Raw Value"].max(),
+            df_dag["QC_Flag"].value_counts(), "periode"
+        )
+        onderdelen += ["<h3>Periode</h3>", _markdown(conclusie)]
+    if stats is not None:
+        onderdelen += ["<h3>Maand</h3>", _markdown(month_conclusion(variable, stats))]
+
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(titel)}</title></head><body>\n"
+        + "\n".join(onderdelen)
+        + "\n</body></html>\n"
+    )
+
+
+def report_months(manifest, station, variable):
+    """Alle (jaar, maand) met minstens één dag in de manifest."""
+    return sorted({(d.year, d.month) for d in manifest_days(manifest, station, variable)})
+
+
+def find_report_jobs(manifest):
+    """Alle (station, variabele, jaar, maand) met metingen."""
+    return [
+        (station, variable, jaar, maand)
+        for station, variabelen in sorted(manifest.items())
+        for variable, entry in sorted(variabelen.items())
+        if entry.get("metingen", 0) > 0
+        for jaar, maand in report_months(manifest, station, variable)
+    ]
+
+
+def _report_job(job):
+    """Maak het rapport van één maand; geeft "nieuw", "overgeslagen" of "leeg"."""
+    station, variable, jaar, maand, data_path, output_dir = job
+
+    pad = report_path(station, variable, jaar, maand, output_dir)
+    sleutel = report_key(station, variable, jaar, maand)
+    if _read_key(pad) == sleutel:
+        return "overgeslagen"
+
+    inhoud = render_month_report(station, variable, jaar, maand, data_path)
+    if inhoud is None:
+        return "leeg"
+
+    _write(pad, inhoud, sleutel)
+    return "nieuw"
+
+
+def run_reports(data_path=DATA_PATH, output_dir=RAPPORT_DIR, workers=None):
+    """Maak alle maandrapporten onder ``output_dir``.
+
+    De manifest werkt eerst alle stores bij; daarna lezen de rapporten alleen
+    de maandpartities van hun eigen maand. Geeft het aantal rapporten per
+    uitkomst (``{"nieuw": .., "overgeslagen": .., "leeg": ..}``).
+    """
+    manifest = load_manifest(data_path, workers)
+    jobs = [
+        (station, variable, jaar, maand, data_path, output_dir)
+        for station, variable, jaar, maand in find_report_jobs(manifest)
+    ]
+
+    uitkomsten = {"nieuw": 0, "overgeslagen": 0, "leeg": 0}
+    if not jobs:
+        return uitkomsten
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    if workers == 1:
+        resultaten = [_report_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            resultaten = list(pool.map(_report_job, jobs, chunksize=8))
+
+    for uitkomst in resultaten:
+        uitkomsten[uitkomst] += 1
+    return uitkomsten
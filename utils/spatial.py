@@ -0,0 +1,114 @@
+"""Ruimtelijke QC: elke meting vergeleken met de andere stations op hetzelfde tijdstip.
+
+Alle stations van één variabele worden uitgelijnd tot een matrix tijd ×
+station (``utils.loader.load_network_frame``). Per tijdstip worden de
+netwerkmediaan en de MAD (median absolute deviation) over de stations
+berekend; de robuuste z-score van een meting is dan
+
+    z = (waarde - mediaan) / (1.4826 · MAD)
+
+Alles is één ``np.nanmedian`` over de stationsas, dus de kosten groeien
+lineair met het aantal tijdstippen × stations.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.loader import DATA_PATH, TEMPERATUUR, load_network_frame
+from utils.manifest import load_manifest, stations_with
+
+# Schaalfactor zodat de MAD bij normale verdeling gelijk is aan de standaardafwijking
+MAD_SCHAAL = 1.4826
+
+# |z| boven deze drempel geldt als ruimtelijke uitschieter
+Z_DREMPEL = 3.5
+
+# Minimaal aantal stations met een meting op hetzelfde tijdstip
+MIN_STATIONS = 4
+
+# Ondergrens voor de spreiding per variabele (voorkomt deling door ~0 bij gelijke waarden)
+MIN_SPREIDING = {
+    "Air_Temperaturedeg_C": 0.5,
+    "Dew_Pointdeg_C": 0.5,
+    "Relative_Humidity%": 3.0,
+    "Barometric_PressurehPa": 0.5,
+    "QNHhPa": 0.5,
+}
+
+
+def robust_zscores(matrix, min_spreiding=0.0, min_stations=MIN_STATIONS):
+    """Robuuste z-score per cel van ``matrix`` (tijd × station, numpy array).
+
+    Geeft ``(z, mediaan)``; tijdstippen met minder dan ``min_stations``
+    metingen krijgen z = NaN.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    aantal = (~np.isnan(matrix)).sum(axis=1)
+    genoeg = aantal >= min_stations
+
+    z = np.full(matrix.shape, np.nan, dtype=np.float32)
+    mediaan = np.full(len(matrix), np.nan, dtype=np.float32)
+    if not genoeg.any():
+        return z, mediaan
+
+    deel = matrix[genoeg]
+    med = np.nanmedian(deel, axis=1)
+    mad = np.nanmedian(np.abs(deel - med[:, None]), axis=1)
+    spreiding = np.maximum(MAD_SCHAAL * mad, min_spreiding)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z[genoeg] = (deel - med[:, None]) / spreiding[:, None]
+    mediaan[genoeg] = med
+    return z, mediaan
+
+
+def spatial_outliers(netwerk, variable, drempel=Z_DREMPEL, min_stations=MIN_STATIONS):
+    """Alle ruimtelijke uitschieters in ``netwerk`` (uitvoer van ``load_network_frame``).
+
+    Geeft een DataFrame met ``Timestamp``, ``Station``, ``Raw Value``,
+    ``Netwerkmediaan`` en ``Z``, gesorteerd op tijd en station.
+    """
+    z, mediaan = robust_zscores(
+        netwerk.to_numpy(), MIN_SPREIDING.get(variable, 0.0), min_stations
+    )
+
+    with np.errstate(invalid="ignore"):
+        rij, kolom = np.nonzero(np.abs(z) > drempel)
+
+    return pd.DataFrame({
+        "Timestamp": netwerk.index[rij],
+        "Station": netwerk.columns[kolom],
+        "Raw Value": netwerk.to_numpy()[rij, kolom],
+        "Netwerkmediaan": mediaan[rij],
+        "Z": z[rij, kolom].round(2),
+    })
+
+
+def spatial_summary(netwerk, uitschieters):
+    """Per station: aantal metingen, aantal uitschieters en het percentage."""
+    metingen = netwerk.notna().sum()
+    per_station = uitschieters["Station"].value_counts().reindex(netwerk.columns, fill_value=0)
+
+    samenvatting = pd.DataFrame({
+        "Metingen": metingen,
+        "Uitschieters": per_station,
+    }).rename_axis("Station").reset_index()
+    samenvatting["Percentage"] = (
+        samenvatting["Uitschieters"] / samenvatting["Metingen"].where(samenvatting["Metingen"] > 0)
+        * 100
+    ).round(2)
+    return samenvatting
+
+
+def run_spatial_check(variable=TEMPERATUUR, start=None, eind=None, data_path=DATA_PATH,
+                      drempel=Z_DREMPEL, min_stations=MIN_STATIONS, workers=None):
+    """Ruimtelijke controle over alle stations met ``variable``.
+
+    Geeft ``(uitschieters, samenvatting)``; zie ``spatial_outliers`` en
+    ``spatial_summary``.
+    """
+    stations = stations_with(load_manifest(data_path, workers), variable)
+    netwerk = load_network_frame(stations, variable, start, eind, data_path, workers)
+
+    uitschieters = spatial_outliers(netwerk, variable, drempel, min_stations)
+    return uitschieters, spatial_summary(netwerk, uitschieters)
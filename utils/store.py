@@ -0,0 +1,304 @@
+"""Incrementele opslag per station/variabele.
+
+Werkmappen groeien met nieuwe maanden. In plaats van bij elke wijziging de
+hele historie opnieuw te verwerken, houdt de store per station/variabele een
+reeks Parquet-delen bij onder ``.qc_cache/store/<station>/<variabele>/``:
+
+- ``jaar=<jjjj>/maand=<mm>/deel-00000.parquet``, … – elk deel bevat alleen de
+  rijen van die maand die bij die ingest nieuw waren; ``load_store`` met
+  ``start``/``eind`` leest alleen de maandmappen die de periode raken;
+- ``dag_qc.parquet`` – de dagelijkse QC-resultaten (``utils.qc.daily_qc``);
+- ``maand_qc.parquet`` – de maandrollup daarvan (``utils.aggregation.monthly_rollup``);
+- ``windroos.parquet`` – alleen voor richtingvariabelen: het 36-sectoren
+  histogram per dag (``utils.windrose.daily_sector_histograms``);
+- ``state.json`` – pad en sleutel van de verwerkte werkmap en aantal delen.
+
+Een store hoort bij precies één werkmap. Komt een ingest uit een andere
+werkmap (een andere ``--data`` map of een verplaatste checkout), dan wordt de
+store weggegooid en uit die werkmap opnieuw opgebouwd, zodat archieven nooit
+door elkaar raken.
+
+``ingest`` voegt alleen tijdstippen toe die nog niet in de store staan en
+berekent de dag-QC en windroos-histogrammen alleen opnieuw voor de dagen die
+nieuwe rijen kregen, en de maandrollup alleen voor de maanden van die dagen. Gewijzigde waarden op al opgeslagen tijdstippen worden niet opnieuw ingelezen;
+gebruik daarvoor ``ingest(..., rebuild=True)``.
+"""
+
+import glob
+import json
+import os
+import shutil
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from utils.aggregation import monthly_rollup
+from utils.cache import CACHE_DIR, CACHE_VERSIE, parse_excel
+from utils.profiling import tel_cache
+from utils.qc import daily_qc
+from utils.windrose import RICHTING_VARIABELEN, daily_sector_histograms
+
+STORE_DIR = os.path.join(CACHE_DIR, "store")
+
+# Ophogen wanneer de inhoud van de store verandert → volgende ingest bouwt opnieuw op
+STORE_VERSIE = 8
+
+# In-process memo: (station, variabele) -> (state, DataFrame)
+_memo = {}
+
+
+def store_path(station, variable):
+    return os.path.join(STORE_DIR, station, variable)
+
+
+def source_key(file_path):
+    stat = os.stat(file_path)
+    return {"versie": CACHE_VERSIE, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _read_state(pad):
+    try:
+        with open(os.path.join(pad, "state.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(pad, state):
+    tmp_path = os.path.join(pad, "state.json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, os.path.join(pad, "state.json"))
+
+
+def _partition_path(pad, jaar, maand):
+    return os.path.join(pad, f"jaar={jaar}", f"maand={maand:02d}")
+
+
+def _months(start, eind):
+    """Alle (jaar, maand) van ``start`` t/m ``eind``."""
+    maanden = pd.period_range(pd.Timestamp(start), pd.Timestamp(eind), freq="M")
+    return [(m.year, m.month) for m in maanden]
+
+
+def _parts(pad, maanden=None):
+    """Parquet-delen van de store; met ``maanden`` alleen die maandmappen."""
+    if maanden is None:
+        return sorted(glob.glob(os.path.join(pad, "jaar=*", "maand=*", "deel-*.parquet")))
+    return sorted(
+        p for jaar, maand in maanden
+        for p in glob.glob(os.path.join(_partition_path(pad, jaar, maand), "deel-*.parquet"))
+    )
+
+
+def month_key(station, variable, jaar, maand):
+    """Sleutel van de maandpartitie: naam, grootte en mtime van de delen.
+
+    Een ingest schrijft alleen nieuwe delen in de maanden die hij raakt, dus
+    de sleutel van een ongeraakte maand blijft gelijk.
+    """
+    pad = store_path(station, variable)
+    return [
+        [os.path.basename(p), stat.st_size, stat.st_mtime_ns]
+        for p in _parts(pad, [(jaar, maand)])
+        for stat in [os.stat(p)]
+    ]
+
+
+def _read_parts(pad, columns=None, filters=None, maanden=None):
+    delen = [pd.read_parquet(p, columns=columns, filters=filters) for p in _parts(pad, maanden)]
+    delen = [d for d in delen if not d.empty]
+    if not delen:
+        return None
+    return pd.concat(delen, ignore_index=True)
+
+
+def _write_daily_qc(pad, dag_qc):
+    dag_qc = dag_qc.assign(Dag=pd.to_datetime(dag_qc["Dag"].astype(str)))
+    tmp_path = os.path.join(pad, "dag_qc.parquet.tmp")
+    dag_qc.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, os.path.join(pad, "dag_qc.parquet"))
+
+
+def ingest(station, variable, file_path, rebuild=False):
+    """Voeg nieuwe rijen uit ``file_path`` toe aan de store.
+
+    Geeft ``(aantal nieuwe rijen, geraakte dagen)`` terug. Is de werkmap sinds
+    de vorige ingest niet gewijzigd, dan wordt hij niet eens geopend. Is de
+    store uit een andere werkmap opgebouwd, dan wordt hij opnieuw opgebouwd.
+    """
+    pad = store_path(station, variable)
+    state = _read_state(pad)
+    bestand = os.path.abspath(file_path)
+
+    if rebuild or (state is not None and (
+        state.get("versie") != STORE_VERSIE or state.get("bestand") != bestand
+    )):
+        shutil.rmtree(pad, ignore_errors=True)
+        state = None
+    os.makedirs(pad, exist_ok=True)
+
+    bron = source_key(file_path)
+    state = state or {"versie": STORE_VERSIE, "bestand": bestand, "bron": None, "delen": 0}
+
+    tel_cache("store_ingest", state["bron"] == bron)
+    if state["bron"] == bron:
+        return 0, []
+
+    df = parse_excel(file_path)
+
+    # Alleen tijdstippen die nog niet in de store staan (alleen de geraakte maanden lezen)
+    bekend = None
+    if not df.empty:
+        maanden = _months(df["Timestamp"].iloc[0], df["Timestamp"].iloc[-1])
+        bekend = _read_parts(pad, columns=["Timestamp"], maanden=maanden)
+    if bekend is not None:
+        df = df[~df["Timestamp"].isin(bekend["Timestamp"])]
+
+    if df.empty:
+        state["bron"] = bron
+        _write_state(pad, state)
+        return 0, []
+
+    maanden = []
+    for (jaar, maand), deel in df.groupby([df["Timestamp"].dt.year, df["Timestamp"].dt.month]):
+        partitie = _partition_path(pad, jaar, maand)
+        os.makedirs(partitie, exist_ok=True)
+        deel.to_parquet(os.path.join(partitie, f"deel-{state['delen']:05d}.parquet"), index=False)
+        maanden.append((jaar, maand))
+
+    # Dag-QC alleen herberekenen voor de dagen met nieuwe rijen
+    geraakte_dagen = list(df["Datum"].unique())
+    rijen = _read_parts(pad, filters=[("Datum", "in", geraakte_dagen)], maanden=maanden)
+    nieuw_qc = daily_qc(rijen, variable)
+
+    oud_qc = load_daily_qc(station, variable)
+    if oud_qc is not None:
+        oud_qc = oud_qc[~oud_qc["Dag"].isin(nieuw_qc["Dag"])]
+        nieuw_qc = pd.concat([oud_qc, nieuw_qc], ignore_index=True)
+
+    count_cols = [c for c in nieuw_qc.columns if c.startswith("Aantal ")]
+    nieuw_qc[count_cols] = nieuw_qc[count_cols].fillna(0).astype(int)
+    nieuw_qc = nieuw_qc.sort_values("Dag").reset_index(drop=True)
+    _write_daily_qc(pad, nieuw_qc)
+
+    # Maandrollup alleen herberekenen voor de maanden van de geraakte dagen
+    geraakte_maanden = pd.DatetimeIndex(geraakte_dagen).to_period("M")
+    in_geraakte_maand = pd.to_datetime(nieuw_qc["Dag"].astype(str)).dt.to_period("M").isin(
+        geraakte_maanden
+    )
+    nieuw_maand = monthly_rollup(nieuw_qc[in_geraakte_maand])
+
+    oud_maand = load_monthly_qc(station, variable)
+    if oud_maand is not None:
+        oud_maand = oud_maand[~oud_maand["Maand"].isin(nieuw_maand["Maand"])]
+        nieuw_maand = pd.concat([oud_maand, nieuw_maand], ignore_index=True)
+
+    count_cols = [c for c in nieuw_maand.columns if c.startswith("Aantal ")]
+    nieuw_maand[count_cols] = nieuw_maand[count_cols].fillna(0).astype(int)
+
+    tmp_path = os.path.join(pad, "maand_qc.parquet.tmp")
+    nieuw_maand.sort_values("Maand").reset_index(drop=True).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, os.path.join(pad, "maand_qc.parquet"))
+
+    if variable in RICHTING_VARIABELEN:
+        nieuw_hist = daily_sector_histograms(rijen)
+
+        oud_hist = load_sector_histograms(station, variable)
+        if oud_hist is not None:
+            oud_hist = oud_hist.drop(nieuw_hist.index, errors="ignore")
+            nieuw_hist = pd.concat([oud_hist, nieuw_hist]).sort_index()
+
+        tmp_path = os.path.join(pad, "windroos.parquet.tmp")
+        nieuw_hist.to_parquet(tmp_path)
+        os.replace(tmp_path, os.path.join(pad, "windroos.parquet"))
+
+    state = {"versie": STORE_VERSIE, "bestand": bestand, "bron": bron, "delen": state["delen"] + 1}
+    _write_state(pad, state)
+
+    return len(df), [d.date() for d in pd.DatetimeIndex(geraakte_dagen)]
+
+
+def load_store(station, variable, start=None, eind=None, memo=True):
+    """Alle opgeslagen rijen, gesorteerd op Timestamp (``None`` als leeg).
+
+    Met ``start`` en ``eind`` (dagen, inclusief) worden alleen de maandmappen
+    van die periode gelezen en alleen de rijen van die dagen teruggegeven.
+    Met ``memo=False`` wordt de volledige reeks niet in het proces bewaard
+    (voor aanroepers die zelf een compactere kopie bijhouden).
+    """
+    pad = store_path(station, variable)
+
+    if start is not None and eind is not None:
+        start, eind = pd.Timestamp(start).normalize(), pd.Timestamp(eind).normalize()
+        df = _read_parts(
+            pad,
+            filters=[("Datum", ">=", start), ("Datum", "<=", eind)],
+            maanden=_months(start, eind)
+        )
+        if df is None:
+            return None
+        return df.sort_values("Timestamp", kind="stable").reset_index(drop=True)
+
+    state = _read_state(pad)
+
+    gememoriseerd = _memo.get((station, variable))
+    if gememoriseerd is not None and gememoriseerd[0] == state:
+        tel_cache("store_memo", True)
+        return gememoriseerd[1].copy()
+    tel_cache("store_memo", False)
+
+    df = _read_parts(pad)
+    if df is None:
+        return None
+
+    # Delen uit een latere ingest kunnen oudere tijdstippen bevatten
+    if not df["Timestamp"].is_monotonic_increasing:
+        df = df.sort_values("Timestamp", kind="stable").reset_index(drop=True)
+
+    if not memo:
+        return df
+
+    _memo[(station, variable)] = (state, df)
+    return df.copy()
+
+
+def store_rows(station, variable):
+    """Aantal opgeslagen rijen, uit de Parquet-metadata (zonder de data te lezen)."""
+    return sum(pq.ParquetFile(p).metadata.num_rows for p in _parts(store_path(station, variable)))
+
+
+def load_daily_qc(station, variable):
+    """De opgeslagen dagelijkse QC-resultaten (``None`` als nog niet berekend)."""
+    dag_qc_path = os.path.join(store_path(station, variable), "dag_qc.parquet")
+    if not os.path.exists(dag_qc_path):
+        return None
+
+    dag_qc = pd.read_parquet(dag_qc_path)
+    dag_qc["Dag"] = dag_qc["Dag"].dt.date
+    return dag_qc
+
+
+def load_monthly_qc(station, variable):
+    """De opgeslagen maandrollup (``None`` als nog niet berekend)."""
+    maand_qc_path = os.path.join(store_path(station, variable), "maand_qc.parquet")
+    if not os.path.exists(maand_qc_path):
+        return None
+    return pd.read_parquet(maand_qc_path)
+
+
+def load_sector_histograms(station, variable, start=None, eind=None):
+    """Opgeslagen windroos-histogrammen per dag (``None`` als niet aanwezig).
+
+    Met ``start``/``eind`` (inclusief) worden alleen die dagen gelezen.
+    """
+    hist_path = os.path.join(store_path(station, variable), "windroos.parquet")
+    if not os.path.exists(hist_path):
+        return None
+
+    filters = []
+    if start is not None:
+        filters.append(("Dag", ">=", pd.Timestamp(start)))
+    if eind is not None:
+        filters.append(("Dag", "<=", pd.Timestamp(eind)))
+    return pd.read_parquet(hist_path, filters=filters or None)
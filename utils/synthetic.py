@@ -0,0 +1,100 @@
+"""Synthetische QC-werkmappen voor benchmarks.
+
+Genereert reeksen in dezelfde indeling als ``data/<station>/<variabele>_QC.xlsx``
+(``Dag``, ``Tijd``, ``Raw Value``, ``QC Flag``, ``Cleaned Value``, aflopend
+gesorteerd) met instelbare gaten en waarden buiten bereik, zodat de
+dashboards en de batch-QC op jaren aan data gemeten kunnen worden.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.loader import TEMPERATUUR, WINDRICHTING
+
+
+def _temperatuur(tijd, rng):
+    # Dagelijkse gang rond 27°C plus ruis
+    uur = tijd.hour.to_numpy() + tijd.minute.to_numpy() / 60
+    return 27 + 4 * np.sin((uur - 9) / 24 * 2 * np.pi) + rng.normal(0, 0.8, len(tijd))
+
+
+def _windrichting(tijd, rng):
+    # Random walk rond de noordoostpassaat
+    stappen = rng.normal(0, 8, len(tijd))
+    return (60 + np.cumsum(stappen)) % 360
+
+
+GENERATORS = {
+    TEMPERATUUR: (_temperatuur, [-5.0, 45.0]),
+    WINDRICHTING: (_windrichting, [-10.0, 400.0]),
+}
+
+
+def synthetic_series(variable, start, dagen, interval="10min", gap_fraction=0.05,
+                     out_of_range_fraction=0.001, seed=0):
+    """Eén synthetische werkmap als DataFrame.
+
+    ``gap_fraction`` is het aandeel tijdstippen zonder meting; de helft daarvan
+    valt in aaneengesloten gaten van 1–12 uur, de rest verspreid. Een aandeel
+    ``out_of_range_fraction`` van de metingen krijgt een onmogelijke waarde.
+    """
+    generator, buiten_bereik = GENERATORS[variable]
+    rng = np.random.default_rng(seed)
+
+    tijd = pd.date_range(start, periods=int(pd.Timedelta(days=dagen) / pd.Timedelta(interval)),
+                         freq=interval)
+    waarden = generator(tijd, rng)
+
+    # Aaneengesloten gaten (stationsuitval)
+    ontbreekt = np.zeros(len(tijd), dtype=bool)
+    per_uur = int(pd.Timedelta("1h") / pd.Timedelta(interval))
+    te_verwijderen = int(len(tijd) * gap_fraction / 2)
+    while te_verwijderen > 0:
+        lengte = min(int(rng.integers(1, 13)) * per_uur, te_verwijderen)
+        begin = int(rng.integers(0, max(len(tijd) - lengte, 1)))
+        ontbreekt[begin:begin + lengte] = True
+        te_verwijderen -= lengte
+
+    # Losse ontbrekende metingen
+    ontbreekt |= rng.random(len(tijd)) < gap_fraction / 2
+    waarden[ontbreekt] = np.nan
+
+    fout = ~ontbreekt & (rng.random(len(tijd)) < out_of_range_fraction)
+    waarden[fout] = rng.choice(buiten_bereik, fout.sum())
+
+    df = pd.DataFrame({
+        "Dag": tijd.strftime("%Y-%m-%d"),
+        "Tijd": tijd.strftime("%H:%M:%S"),
+        "Raw Value": np.round(waarden, 1),
+        "QC Flag": np.where(fout, "NEG", None),
+        "Cleaned Value": np.where(fout, np.nan, np.round(waarden, 1)),
+    })
+
+    # Nieuwste meting bovenaan, zoals in de echte werkmappen
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+def write_synthetic_data(data_path, stations, variables, start, dagen,
+                         file_format="xlsx", **kwargs):
+    """Schrijf ``data_path/<station>/<variabele>_QC.<file_format>`` voor alle combinaties.
+
+    ``file_format`` is ``"xlsx"`` of ``"parquet"``. Geeft de geschreven paden terug.
+    """
+    paden = []
+    for i, station in enumerate(stations):
+        station_path = os.path.join(data_path, station)
+        os.makedirs(station_path, exist_ok=True)
+
+        for j, variable in enumerate(variables):
+            df = synthetic_series(variable, start, dagen, seed=i * 100 + j, **kwargs)
+            pad = os.path.join(station_path, f"{variable}_QC.{file_format}")
+
+            if file_format == "parquet":
+                df.to_parquet(pad, index=False)
+            else:
+                df.to_excel(pad, index=False)
+            paden.append(pad)
+
+    return paden
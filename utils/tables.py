@@ -0,0 +1,77 @@
+"""Snelle weergave van grote QC-flagtabellen.
+
+pandas' Styler bouwt HTML per cel en ``applymap`` roept per cel een Python
+functie aan. Voor een maand of jaar (tienduizenden rijen) is dat te traag.
+Daarom wordt de tabel eerst gefilterd en gepagineerd, en krijgt alleen de
+getoonde pagina kleuren: één ``Series.map`` over de flagkolom levert de CSS
+voor alle cellen tegelijk (``Styler.apply(..., axis=None)``). Zowel de
+bereikflag (``QC_Flag``) als de temporele flag (``Tijd_Flag``) worden gekleurd.
+"""
+
+import pandas as pd
+
+from utils.flags import FLAG_STYLES
+
+# Rijen per pagina
+PER_PAGINA = 500
+
+# Kolommen met een flag (voor zover aanwezig in de tabel)
+FLAG_KOLOMMEN = ["QC_Flag", "Tijd_Flag"]
+
+
+def _flag_columns(df):
+    return [k for k in FLAG_KOLOMMEN if k in df.columns]
+
+
+def flag_styles(df):
+    """CSS per cel van ``df``: alleen de flagkolommen krijgen de kleur van hun flag."""
+    css = pd.DataFrame("", index=df.index, columns=df.columns)
+    for kolom in _flag_columns(df):
+        css[kolom] = df[kolom].map(FLAG_STYLES).fillna("")
+    return css
+
+
+def filter_flags(df, alleen_afwijkend):
+    """Met ``alleen_afwijkend`` alleen de rijen waarvan minstens één flag niet OK is."""
+    if not alleen_afwijkend:
+        return df
+    return df[(df[_flag_columns(df)] != "OK").any(axis=1)]
+
+
+def page_count(aantal_rijen, per_pagina=PER_PAGINA):
+    return max(-(-aantal_rijen // per_pagina), 1)
+
+
+def page(df, pagina, per_pagina=PER_PAGINA):
+    """Rijen van ``pagina`` (1-based, begrensd op de eerste/laatste pagina)."""
+    pagina = min(max(int(pagina), 1), page_count(len(df), per_pagina))
+    begin = (pagina - 1) * per_pagina
+    return df.iloc[begin:begin + per_pagina]
+
+
+def render_flag_table(container, df, formaat, per_pagina=PER_PAGINA, key="qc_tabel"):
+    """Toon ``df`` (met een ``QC_Flag``-kolom) gefilterd, gepagineerd en gekleurd.
+
+    ``container`` is ``st`` of een Streamlit-container; ``formaat`` gaat naar
+    ``Styler.format``. ``key`` onderscheidt meerdere tabellen op één pagina.
+    """
+    alleen_afwijkend = container.checkbox(
+        "Alleen afwijkende metingen (flag niet OK)", key=f"{key}_filter"
+    )
+    gefilterd = filter_flags(df, alleen_afwijkend)
+
+    paginas = page_count(len(gefilterd), per_pagina)
+    pagina = 1
+    if paginas > 1:
+        pagina = container.number_input(
+            f"Pagina (1–{paginas})", min_value=1, max_value=paginas, value=1,
+            key=f"{key}_pagina"
+        )
+
+    container.caption(f"{len(gefilterd)} van {len(df)} metingen")
+    container.dataframe(
+        page(gefilterd, pagina, per_pagina)
+        .style
+        .apply(flag_styles, axis=None)
+        .format(formaat)
+    )
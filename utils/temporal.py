@@ -0,0 +1,145 @@
+"""Temporele QC: sprong (step), piek (spike) en vlakke lijn (flatline).
+
+De controles werken op het 10-minuten raster: elke meting krijgt een vaste
+positie vanaf het eerste tijdstip, ontbrekende slots zijn NaN. Verschillen
+tussen buren worden daardoor nooit over een gat heen berekend, en alles is
+één ``np.diff``/``np.bincount`` over de hele reeks, ook voor jaren data.
+
+Per variabele staat in ``TEMPORELE_REGELS``:
+
+- ``max_stap`` – maximaal verschil met de vorige meting (``STEP``);
+- ``piek`` – minimaal verschil met beide buren, in dezelfde richting (``SPIKE``);
+- ``vlak_uren`` – aantal uren met exact dezelfde waarde (``FLATLINE``);
+- ``circulair`` – verschillen in graden rond 360° (windrichting).
+
+Een regel met ``None`` wordt niet gecontroleerd.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.completeness import SLOTS_PER_DAG
+from utils.flags import MISSING
+from utils.timestamps import grid_positions
+
+SLOTS_PER_UUR = SLOTS_PER_DAG // 24
+
+TEMPORELE_REGELS = {
+    "Air_Temperaturedeg_C": {"max_stap": 3.0, "piek": 2.5, "vlak_uren": 3, "circulair": False},
+    "Dew_Pointdeg_C": {"max_stap": 3.0, "piek": 2.5, "vlak_uren": 3, "circulair": False},
+    "Relative_Humidity%": {"max_stap": 15.0, "piek": 10.0, "vlak_uren": 6, "circulair": False},
+    "Barometric_PressurehPa": {"max_stap": 1.5, "piek": 1.0, "vlak_uren": 6, "circulair": False},
+    "QNHhPa": {"max_stap": 1.5, "piek": 1.0, "vlak_uren": 6, "circulair": False},
+    "Wind_Dir_Averagedeg": {"max_stap": None, "piek": 150.0, "vlak_uren": 6, "circulair": True},
+    "Gust_Dirdeg": {"max_stap": None, "piek": None, "vlak_uren": 6, "circulair": True},
+    "Wind_Speed_Averageknots": {"max_stap": 20.0, "piek": 15.0, "vlak_uren": 12, "circulair": False},
+    "Gust_Speedknots": {"max_stap": None, "piek": None, "vlak_uren": 12, "circulair": False},
+}
+
+# Volgorde = prioriteit bij het samenvoegen tot één flag
+TEMPORELE_FLAGS = ["FLATLINE", "SPIKE", "STEP"]
+
+
+def circular_diff(a, b):
+    """Kleinste verschil ``a - b`` in graden, in het bereik [-180, 180)."""
+    return (a - b + 180) % 360 - 180
+
+
+def _grid(df):
+    """Waarden op het 10-minuten raster + positie van elke rij daarin (-1 = niet op een slot)."""
+    waarden = df["Raw Value"].to_numpy(dtype=float)
+
+    positie, op_slot = grid_positions(df["Timestamp"])
+    positie = positie - positie[0]
+    positie[~op_slot] = -1
+
+    raster = np.full(max(positie.max() + 1, 1), np.nan)
+    raster[positie[op_slot]] = waarden[op_slot]
+    return raster, positie
+
+
+def temporal_checks(variable, df):
+    """Boolean kolommen ``STEP``, ``SPIKE`` en ``FLATLINE`` per rij van ``df``.
+
+    ``df`` moet op ``Timestamp`` gesorteerd zijn (het genormaliseerde frame).
+    Geeft ``None`` als er geen temporele regels voor ``variable`` zijn.
+    """
+    regel = TEMPORELE_REGELS.get(variable)
+    if regel is None:
+        return None
+
+    resultaat = pd.DataFrame(False, index=df.index, columns=TEMPORELE_FLAGS[::-1])
+    if df.empty:
+        return resultaat
+
+    raster, positie = _grid(df)
+    verschil = circular_diff if regel["circulair"] else np.subtract
+
+    # vorige[i] = x[i] - x[i-1], volgende[i] = x[i] - x[i+1]; NaN over gaten
+    d = verschil(raster[1:], raster[:-1])
+    vorige = np.concatenate([[np.nan], d])
+    volgende = np.concatenate([-d, [np.nan]])
+
+    with np.errstate(invalid="ignore"):
+        stap = np.zeros(len(raster), dtype=bool)
+        if regel["max_stap"] is not None:
+            stap = np.abs(vorige) > regel["max_stap"]
+
+        piek = np.zeros(len(raster), dtype=bool)
+        if regel["piek"] is not None:
+            piek = (
+                (np.abs(vorige) > regel["piek"])
+                & (np.abs(volgende) > regel["piek"])
+                & (np.sign(vorige) == np.sign(volgende))
+            )
+
+        vlak = np.zeros(len(raster), dtype=bool)
+        if regel["vlak_uren"] is not None:
+            # Reeksen van gelijke opeenvolgende waarden; een gat breekt de reeks
+            gelijk = np.concatenate([[False], d == 0])
+            reeks = np.cumsum(~gelijk)
+            lengte = np.bincount(reeks)[reeks]
+            vlak = (lengte > regel["vlak_uren"] * SLOTS_PER_UUR) & ~np.isnan(raster)
+
+    geldig = positie >= 0
+    for naam, masker in [("STEP", stap), ("SPIKE", piek), ("FLATLINE", vlak)]:
+        kolom = np.zeros(len(df), dtype=bool)
+        kolom[geldig] = masker[positie[geldig]]
+        resultaat[naam] = kolom
+
+    return resultaat
+
+
+def temporal_flag(variable, df):
+    """Eén temporele flag per rij: ``FLATLINE`` > ``SPIKE`` > ``STEP`` > ``OK``.
+
+    Rijen zonder meting krijgen ``MISSING``; ``None`` als er geen regels zijn.
+    """
+    checks = temporal_checks(variable, df)
+    if checks is None:
+        return None
+
+    flag = np.full(len(df), "OK", dtype=object)
+    for naam in TEMPORELE_FLAGS[::-1]:
+        flag[checks[naam].to_numpy()] = naam
+    flag[df["Raw Value"].isna().to_numpy()] = MISSING
+
+    return pd.Series(flag, index=df.index, name="Tijd_Flag")
+
+
+def daily_temporal_counts(df, variable):
+    """Aantal ``STEP``/``SPIKE``/``FLATLINE`` per dag (``Dag`` als datetime.date).
+
+    Geeft ``None`` als er geen temporele regels voor ``variable`` zijn.
+    """
+    checks = temporal_checks(variable, df)
+    if checks is None:
+        return None
+
+    return (
+        checks.groupby(df["Datum"].dt.date.rename("Dag"))
+        .sum()
+        .astype(int)
+        .add_prefix("Aantal ")
+        .reset_index()
+    )
@@ -0,0 +1,197 @@
+"""Timestamps uit ``Dag`` + ``Tijd`` zonder tekst te plakken en te parsen.
+
+openpyxl levert de cellen in hun eigen Excel-type: een datum als
+``datetime``/``date``, een tijd als ``time``/``timedelta`` of als fractie van
+een dag, en soms (handmatig ingevoerde cellen) als tekst. De timestamp is dan
+eenvoudig ``dag + tijd sinds middernacht``, per type rekenkundig bepaald.
+Alleen cellen met tekst worden geparset, met een vast formaat en daarna een
+expliciete terugvaloptie; wat dan nog niet lukt wordt als ongeldig gemeld.
+
+``slot_indices`` geeft per tijdstip het dagnummer (dagen sinds 1970-01-01)
+en het 10-minuten slot (0–143), als gehele getallen voor het completeness-
+raster en de temporele controles.
+"""
+
+import datetime
+import logging
+
+import numpy as np
+import pandas as pd
+
+# 10-minuten metingen → 144 per dag
+SLOTS_PER_DAG = 144
+SLOT_DUUR = pd.Timedelta("10min")
+
+logger = logging.getLogger("aws_qc.timestamps")
+
+# Excel telt dagen vanaf 1899-12-30 (inclusief de niet-bestaande 29-02-1900)
+EXCEL_EPOCH = pd.Timestamp("1899-12-30")
+
+DAG_NS = pd.Timedelta(days=1).value
+SLOT_NS = SLOT_DUUR.value
+
+_DATUMS = (datetime.datetime, datetime.date, pd.Timestamp)
+_GETALLEN = (int, float, np.integer, np.floating)
+
+# Uitkomst van ``infer_dtype`` voor een kolom met één soort waarde
+_SOORT_PER_TYPE = {
+    "datetime": "datum", "datetime64": "datum", "date": "datum",
+    "time": "tijd",
+    "timedelta": "duur", "timedelta64": "duur",
+    "integer": "getal", "floating": "getal", "mixed-integer-float": "getal",
+    "string": "tekst",
+    "empty": "leeg",
+}
+
+
+def _kinds(kolom):
+    """Per cel het soort waarde: "datum", "tijd", "duur", "getal", "tekst" of "leeg".
+
+    Een kolom met één soort waarde (het normale geval) wordt in één
+    ``infer_dtype`` herkend; alleen gemengde kolommen worden per cel bekeken.
+    """
+    gelijk = _SOORT_PER_TYPE.get(pd.api.types.infer_dtype(kolom, skipna=True))
+    if gelijk is not None:
+        return pd.Series(np.where(kolom.isna(), "leeg", gelijk), index=kolom.index)
+
+    def soort(waarde):
+        if waarde is None or waarde is pd.NaT or (isinstance(waarde, float) and np.isnan(waarde)):
+            return "leeg"
+        if isinstance(waarde, datetime.time):
+            return "tijd"
+        if isinstance(waarde, (datetime.timedelta, pd.Timedelta)):
+            return "duur"
+        if isinstance(waarde, _DATUMS):
+            return "datum"
+        if isinstance(waarde, _GETALLEN):
+            return "getal"
+        return "tekst"
+
+    return kolom.map(soort)
+
+
+def _strings(kolom):
+    return kolom.astype(str).str.strip()
+
+
+def day_starts(dag):
+    """``Dag`` als datetime64 (middernacht); NaT waar de cel geen datum is."""
+    if pd.api.types.is_datetime64_any_dtype(dag):
+        return dag.dt.normalize()
+    if pd.api.types.is_numeric_dtype(dag):
+        return EXCEL_EPOCH + pd.to_timedelta(np.floor(dag), unit="D")
+
+    uit = pd.Series(pd.NaT, index=dag.index, dtype="datetime64[ns]")
+    soort = _kinds(dag)
+
+    datum = soort == "datum"
+    if datum.any():
+        uit[datum] = pd.to_datetime(dag[datum].tolist()).normalize()
+
+    getal = soort == "getal"
+    if getal.any():
+        uit[getal] = EXCEL_EPOCH + pd.to_timedelta(np.floor(dag[getal].astype(float)), unit="D")
+
+    tekst = soort == "tekst"
+    if tekst.any():
+        waarden = _strings(dag[tekst])
+        geparst = pd.to_datetime(waarden, format="%Y-%m-%d", errors="coerce")
+        # Terugvaloptie: andere notaties (bijv. met tijd erbij of dag-maand-jaar)
+        mislukt = geparst.isna()
+        if mislukt.any():
+            geparst[mislukt] = pd.to_datetime(
+                waarden[mislukt], format="mixed", dayfirst=True, errors="coerce"
+            )
+        uit[tekst] = geparst.dt.normalize()
+
+    return uit
+
+
+def time_offsets(tijd):
+    """``Tijd`` als tijd sinds middernacht (timedelta64); NaT waar dat niet lukt."""
+    if pd.api.types.is_timedelta64_dtype(tijd):
+        return tijd
+    if pd.api.types.is_datetime64_any_dtype(tijd):
+        return tijd - tijd.dt.normalize()
+    if pd.api.types.is_numeric_dtype(tijd):
+        return pd.to_timedelta((tijd % 1 * 86400).round(), unit="s")
+
+    uit = pd.Series(pd.NaT, index=tijd.index, dtype="timedelta64[ns]")
+    soort = _kinds(tijd)
+
+    tijden = soort == "tijd"
+    if tijden.any():
+        seconden = np.fromiter(
+            (t.hour * 3600 + t.minute * 60 + t.second for t in tijd[tijden]),
+            dtype=np.int64, count=int(tijden.sum())
+        )
+        uit[tijden] = pd.to_timedelta(seconden, unit="s")
+
+    duur = soort == "duur"
+    if duur.any():
+        uit[duur] = pd.to_timedelta(tijd[duur].tolist())
+
+    # Een tijd als datum-cel (Excel: 1899-12-30 10:20) → alleen het tijdsdeel
+    datum = soort == "datum"
+    if datum.any():
+        ts = pd.to_datetime(tijd[datum].tolist())
+        uit[datum] = (ts - ts.normalize()).to_numpy()
+
+    getal = soort == "getal"
+    if getal.any():
+        uit[getal] = pd.to_timedelta((tijd[getal].astype(float) % 1 * 86400).round(), unit="s")
+
+    tekst = soort == "tekst"
+    if tekst.any():
+        waarden = _strings(tijd[tekst])
+        # "10:20" → "10:20:00"; to_timedelta verwacht uren, minuten en seconden
+        waarden = waarden.where(waarden.str.count(":") != 1, waarden + ":00")
+        uit[tekst] = pd.to_timedelta(waarden, errors="coerce")
+
+    return uit
+
+
+def combine_timestamps(dag, tijd):
+    """Timestamp = ``day_starts(dag) + time_offsets(tijd)``.
+
+    Geeft ``(timestamps, ongeldig)``: ``ongeldig`` markeert rijen met een
+    ingevulde ``Dag`` of ``Tijd`` waarvan geen tijdstip gemaakt kon worden.
+    Volledig lege rijen (bijv. onderaan een werkblad) tellen niet als ongeldig.
+    """
+    timestamps = day_starts(dag) + time_offsets(tijd)
+    leeg = dag.isna() & tijd.isna()
+    return timestamps, timestamps.isna() & ~leeg
+
+
+def report_invalid(ongeldig, dag, tijd, bron="", voorbeelden=5):
+    """Meld ongeldige rijen (aantal + eerste voorbeelden) als waarschuwing."""
+    aantal = int(ongeldig.sum())
+    if aantal == 0:
+        return
+
+    voorbeeld = ", ".join(
+        f"{d!r} {t!r}" for d, t in zip(dag[ongeldig].head(voorbeelden), tijd[ongeldig].head(voorbeelden))
+    )
+    logger.warning("%s: %d rijen zonder geldig tijdstip (bijv. %s)", bron, aantal, voorbeeld)
+
+
+def epoch_ns(timestamps):
+    """Timestamps als int64 nanoseconden sinds 1970-01-01 (numpy array)."""
+    return np.asarray(timestamps, dtype="datetime64[ns]").view(np.int64)
+
+
+def slot_indices(timestamps):
+    """Dagnummer, 10-minuten slot (0–143) en of het tijdstip precies op een slot valt.
+
+    Drie numpy arrays (int64, int64, bool) zonder tussenliggende Timedelta's.
+    """
+    ns = epoch_ns(timestamps)
+    dagnummer, rest = np.divmod(ns, DAG_NS)
+    slot, binnen_slot = np.divmod(rest, SLOT_NS)
+    return dagnummer, slot, binnen_slot == 0
+
+
+def grid_positions(timestamps):
+    """Doorlopend slotnummer (dagnummer × 144 + slot) en of het op een slot valt."""
+    dagnummer, slot, op_slot = slot_indices(timestamps)
+    return dagnummer * SLOTS_PER_DAG + slot, op_slot
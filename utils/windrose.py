@@ -0,0 +1,64 @@
+"""Windroos-histogrammen: 36 sectoren van 10° per dag.
+
+Per station-dag wordt één keer een vast histogram van 36 sectoren berekend
+(één ``np.bincount`` over alle dagen tegelijk). Een windroos voor een maand,
+seizoen, jaar of willekeurige periode is daarna alleen nog een som van
+dagvectoren.
+"""
+
+import numpy as np
+import pandas as pd
+
+SECTOR_BREEDTE = 10
+SECTOREN = 360 // SECTOR_BREEDTE
+
+# Variabelen met een richting in graden (bestandsnaam zonder "_QC.xlsx")
+RICHTING_VARIABELEN = {"Wind_Dir_Averagedeg", "Gust_Dirdeg"}
+
+SECTOR_KOLOMMEN = [str(s * SECTOR_BREEDTE) for s in range(SECTOREN)]
+
+
+def sector_index(waarden):
+    """Sector (0–35) per waarde; -1 voor ontbrekende of ongeldige richtingen.
+
+    Waarden worden eerst op hele graden afgerond, zoals in het dashboard;
+    360° valt samen met 0° in sector N.
+    """
+    v = np.round(waarden.to_numpy(dtype=float))
+    geldig = (v >= 0) & (v <= 360)
+
+    sector = np.full(len(v), -1, dtype=np.int64)
+    sector[geldig] = (v[geldig] // SECTOR_BREEDTE).astype(np.int64) % SECTOREN
+    return sector
+
+
+def daily_sector_histograms(df):
+    """Histogram per dag als DataFrame: index ``Dag`` (datetime64), 36 kolommen."""
+    dagen, dag_idx = np.unique(df["Datum"].to_numpy(), return_inverse=True)
+    sector = sector_index(df["Raw Value"])
+
+    geldig = sector >= 0
+    counts = np.bincount(
+        dag_idx[geldig] * SECTOREN + sector[geldig],
+        minlength=len(dagen) * SECTOREN
+    ).reshape(len(dagen), SECTOREN)
+
+    return pd.DataFrame(
+        counts,
+        index=pd.DatetimeIndex(dagen, name="Dag"),
+        columns=SECTOR_KOLOMMEN
+    )
+
+
+def rose_counts(histogrammen, start=None, eind=None):
+    """Som van de dagvectoren tussen ``start`` en ``eind`` (inclusief).
+
+    Geeft een Series met het aantal metingen per sector (index in graden).
+    """
+    periode = histogrammen.loc[
+        pd.Timestamp(start) if start is not None else None:
+        pd.Timestamp(eind) if eind is not None else None
+    ]
+    counts = periode.sum()
+    counts.index = counts.index.astype(int)
+    return counts